@@ -0,0 +1,106 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from parser.ast import ASTNode, iter_fields
+
+
+SAMPLE_FUNCTION = """
+func work_{index}(n) {{
+    var int total = 0;
+    var int i = 0;
+    while (i < n) {{
+        if (i % 2 == 0) {{
+            total = total + i * 3;
+        }} else {{
+            total = total - 1;
+        }}
+        i++;
+    }}
+    print("total: *total*");
+    return total;
+}}
+"""
+
+
+def generate_source(functions):
+    parts = [SAMPLE_FUNCTION.format(index=i) for i in range(functions)]
+    parts.append("func main() {\n    var int r = work_0(10);\n    return 0;\n}\n")
+    return "".join(parts)
+
+
+def collect_nodes(node, nodes):
+    if isinstance(node, (list, tuple)):
+        for item in node:
+            collect_nodes(item, nodes)
+    elif isinstance(node, dict):
+        for item in node.values():
+            collect_nodes(item, nodes)
+    elif isinstance(node, ASTNode):
+        nodes.append(node)
+        for name, value in iter_fields(node):
+            if name != 'source_line':
+                collect_nodes(value, nodes)
+
+
+def slotted_size(nodes, source_lines):
+    total = sum(sys.getsizeof(node) for node in nodes)
+    total += sys.getsizeof(source_lines) + sum(sys.getsizeof(line) for line in source_lines)
+    return total
+
+
+def dict_size(nodes):
+    classes = {}
+    total = 0
+    for node in nodes:
+        cls = classes.get(type(node))
+        if cls is None:
+            cls = classes[type(node)] = type(type(node).__name__, (), {})
+        legacy = cls()
+        for name, value in iter_fields(node):
+            setattr(legacy, name, value)
+        if hasattr(node, 'line_number'):
+            legacy.source_line = node.source_line
+            total += sys.getsizeof(legacy.source_line)
+        else:
+            legacy.line_number = None
+            legacy.source_line = None
+        total += sys.getsizeof(legacy) + sys.getsizeof(legacy.__dict__)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report AST memory per node for slotted nodes vs dict-backed nodes')
+    parser.add_argument('files', nargs='*', help='Kato files to parse (default: generated program)')
+    parser.add_argument('--functions', type=int, default=500, help='Functions in the generated program')
+    args = parser.parse_args()
+    
+    if args.files:
+        sources = []
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8') as f:
+                sources.append(f.read())
+    else:
+        sources = [generate_source(args.functions)]
+    
+    nodes = []
+    tables = []
+    for source in sources:
+        parser_obj = Parser(Lexer(source).generate_tokens(), source)
+        collect_nodes(parser_obj.parse(), nodes)
+        tables.extend(parser_obj.source_lines)
+    
+    before = dict_size(nodes)
+    after = slotted_size(nodes, tables)
+    print(f"nodes: {len(nodes)}")
+    print(f"dict nodes with copied lines: {before / len(nodes):.1f} bytes/node")
+    print(f"slotted nodes with shared lines: {after / len(nodes):.1f} bytes/node")
+    print(f"reduction: {100 * (1 - after / before):.1f}%")
+
+
+if __name__ == '__main__':
+    main()
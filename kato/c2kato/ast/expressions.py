@@ -2,26 +2,36 @@ from .nodes import CASTNode
 
 
 class CIdentifier(CASTNode):
+    __slots__ = ('name',)
+    
     def __init__(self, name):
         self.name = name
 
 
 class CNumber(CASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class CString(CASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class CChar(CASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class CBinaryOp(CASTNode):
+    __slots__ = ('left', 'operator', 'right')
+    
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
@@ -29,12 +39,16 @@ class CBinaryOp(CASTNode):
 
 
 class CArrayAccess(CASTNode):
+    __slots__ = ('array', 'index')
+    
     def __init__(self, array, index):
         self.array = array
         self.index = index
 
 
 class CFunctionCall(CASTNode):
+    __slots__ = ('name', 'arguments')
+    
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
@@ -1,2 +1,2 @@
 class CASTNode:
-    pass
+    __slots__ = ()
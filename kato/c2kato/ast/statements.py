@@ -2,11 +2,15 @@ from .nodes import CASTNode
 
 
 class CProgram(CASTNode):
+    __slots__ = ('declarations',)
+    
     def __init__(self, declarations):
         self.declarations = declarations
 
 
 class CFunctionDef(CASTNode):
+    __slots__ = ('return_type', 'name', 'params', 'body')
+    
     def __init__(self, return_type, name, params, body):
         self.return_type = return_type
         self.name = name
@@ -15,6 +19,8 @@ class CFunctionDef(CASTNode):
 
 
 class CVarDeclaration(CASTNode):
+    __slots__ = ('var_type', 'name', 'value')
+    
     def __init__(self, var_type, name, value=None):
         self.var_type = var_type
         self.name = name
@@ -22,6 +28,8 @@ class CVarDeclaration(CASTNode):
 
 
 class CArrayDeclaration(CASTNode):
+    __slots__ = ('array_type', 'name', 'size', 'values')
+    
     def __init__(self, array_type, name, size, values=None):
         self.array_type = array_type
         self.name = name
@@ -30,12 +38,16 @@ class CArrayDeclaration(CASTNode):
 
 
 class CAssignment(CASTNode):
+    __slots__ = ('target', 'value')
+    
     def __init__(self, target, value):
         self.target = target
         self.value = value
 
 
 class CIfStatement(CASTNode):
+    __slots__ = ('condition', 'if_body', 'else_body')
+    
     def __init__(self, condition, if_body, else_body=None):
         self.condition = condition
         self.if_body = if_body
@@ -43,12 +55,16 @@ class CIfStatement(CASTNode):
 
 
 class CWhileStatement(CASTNode):
+    __slots__ = ('condition', 'body')
+    
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
 
 
 class CForStatement(CASTNode):
+    __slots__ = ('init', 'condition', 'increment', 'body')
+    
     def __init__(self, init, condition, increment, body):
         self.init = init
         self.condition = condition
@@ -57,16 +73,22 @@ class CForStatement(CASTNode):
 
 
 class CReturnStatement(CASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class CExpressionStatement(CASTNode):
+    __slots__ = ('expression',)
+    
     def __init__(self, expression):
         self.expression = expression
 
 
 class CSwitchStatement(CASTNode):
+    __slots__ = ('expression', 'cases', 'default_body')
+    
     def __init__(self, expression, cases, default_body):
         self.expression = expression
         self.cases = cases
@@ -74,11 +96,15 @@ class CSwitchStatement(CASTNode):
 
 
 class CCaseClause(CASTNode):
+    __slots__ = ('value', 'body')
+    
     def __init__(self, value, body):
         self.value = value
         self.body = body
 
 
 class CMultiDeclaration(CASTNode):
+    __slots__ = ('declarations',)
+    
     def __init__(self, declarations):
         self.declarations = declarations
@@ -6,57 +6,56 @@ from parser.ast import (
     StringLiteral, NumberLiteral, FloatLiteral, CharLiteral,
     Identifier, BinaryOp, ArrayAccess, InptCall, InfStatement, StopStatement
 )
+from compiler.codegen.emitter import Emitter
 from .formatter import KatoFormatter
 
 
 class KatoGenerator:
     def __init__(self):
         self.formatter = KatoFormatter()
-        self.indent_level = 0
+        self.out = Emitter()
     
-    def indent(self):
-        return "    " * self.indent_level
-    
-    def generate(self, kato_ast):
+    def generate(self, kato_ast, stream=None):
         if not isinstance(kato_ast, Program):
             raise ValueError("Expected Program")
         
-        code = []
+        self.out = Emitter(stream)
         
-        for func in kato_ast.functions:
-            code.append(self.generate_function(func))
-            code.append("")
+        for i, func in enumerate(kato_ast.functions):
+            if i > 0:
+                self.out.write("\n")
+            self.generate_function(func)
+            self.out.write("\n")
+            self.out.flush()
         
-        return "\n".join(code)
+        if stream is not None:
+            return None
+        return self.out.getvalue()
     
     def generate_function(self, func):
         params_str = ", ".join(func.params) if func.params else ""
-        code = f"func {func.name}({params_str}) {{\n"
+        self.out.line(f"func {func.name}({params_str}) {{")
         
-        self.indent_level += 1
+        self.out.indent()
         
         for stmt in func.body:
-            stmt_code = self.generate_statement(stmt)
-            if stmt_code:
-                code += stmt_code
-        
-        self.indent_level -= 1
-        code += "}\n"
+            self.generate_statement(stmt)
         
-        return code
+        self.out.dedent()
+        self.out.line("}")
     
     def generate_statement(self, stmt):
         if isinstance(stmt, VarDeclaration):
             value_str = self.generate_expression(stmt.value) if stmt.value else "0"
-            return f"{self.indent()}var {stmt.var_type} {stmt.name} = {value_str};\n"
+            self.out.line(f"var {stmt.var_type} {stmt.name} = {value_str};")
         
         elif isinstance(stmt, ArrayDeclaration):
             elements_str = ", ".join([self.generate_expression(e) for e in stmt.elements])
-            return f"{self.indent()}mass {stmt.array_type} {stmt.name} = {{{elements_str}}};\n"
+            self.out.line(f"mass {stmt.array_type} {stmt.name} = {{{elements_str}}};")
         
         elif isinstance(stmt, Assignment):
             value_str = self.generate_expression(stmt.value)
-            return f"{self.indent()}{stmt.name} = {value_str};\n"
+            self.out.line(f"{stmt.name} = {value_str};")
         
         elif isinstance(stmt, IfStatement):
             condition_str = self.generate_expression(stmt.condition)
@@ -64,36 +63,34 @@ class KatoGenerator:
             if condition_str.startswith("(") and condition_str.endswith(")"):
                 condition_str = condition_str[1:-1]
             
-            code = f"{self.indent()}if ({condition_str}) {{\n"
+            self.out.line(f"if ({condition_str}) {{")
             
-            self.indent_level += 1
+            self.out.indent()
             for s in stmt.if_body:
-                code += self.generate_statement(s)
-            self.indent_level -= 1
+                self.generate_statement(s)
+            self.out.dedent()
             
-            code += f"{self.indent()}}}"
+            self.out.start_line("}")
             
             if stmt.else_body:
-                code += " else {\n"
-                self.indent_level += 1
+                self.out.write(" else {\n")
+                self.out.indent()
                 for s in stmt.else_body:
-                    code += self.generate_statement(s)
-                self.indent_level -= 1
-                code += f"{self.indent()}}}"
+                    self.generate_statement(s)
+                self.out.dedent()
+                self.out.start_line("}")
             
-            code += "\n"
-            return code
+            self.out.write("\n")
         
         elif isinstance(stmt, InfStatement):
-            code = f"{self.indent()}inf {{\n"
+            self.out.line("inf {")
             
-            self.indent_level += 1
+            self.out.indent()
             for s in stmt.body:
-                code += self.generate_statement(s)
-            self.indent_level -= 1
+                self.generate_statement(s)
+            self.out.dedent()
             
-            code += f"{self.indent()}}}\n"
-            return code
+            self.out.line("}")
         
         elif isinstance(stmt, WhileStatement):
             condition_str = self.generate_expression(stmt.condition)
@@ -101,28 +98,27 @@ class KatoGenerator:
             if condition_str.startswith("(") and condition_str.endswith(")"):
                 condition_str = condition_str[1:-1]
             
-            code = f"{self.indent()}while ({condition_str}) {{\n"
+            self.out.line(f"while ({condition_str}) {{")
             
-            self.indent_level += 1
+            self.out.indent()
             for s in stmt.body:
-                code += self.generate_statement(s)
-            self.indent_level -= 1
+                self.generate_statement(s)
+            self.out.dedent()
             
-            code += f"{self.indent()}}}\n"
-            return code
+            self.out.line("}")
         
         elif isinstance(stmt, ReturnStatement):
             value_str = self.generate_expression(stmt.value) if stmt.value else "0"
-            return f"{self.indent()}return {value_str};\n"
+            self.out.line(f"return {value_str};")
         
         elif isinstance(stmt, IncrementStatement):
-            return f"{self.indent()}{stmt.name}++;\n"
+            self.out.line(f"{stmt.name}++;")
         
         elif isinstance(stmt, DecrementStatement):
-            return f"{self.indent()}{stmt.name}--;\n"
+            self.out.line(f"{stmt.name}--;")
         
         elif isinstance(stmt, StopStatement):
-            return f"{self.indent()}stop;\n"
+            self.out.line("stop;")
         
         elif isinstance(stmt, PrintStatement):
             values = stmt.value if isinstance(stmt.value, list) else [stmt.value]
@@ -139,40 +135,37 @@ class KatoGenerator:
                     result_parts.append(self.generate_expression(v))
             
             values_str = " ".join(result_parts)
-            return f"{self.indent()}print({values_str});\n"
+            self.out.line(f"print({values_str});")
         
         elif isinstance(stmt, CallStatement):
             args_str = ", ".join([self.generate_expression(arg) for arg in stmt.arguments]) if stmt.arguments else ""
-            return f"{self.indent()}call {stmt.func_name}({args_str});\n"
+            self.out.line(f"call {stmt.func_name}({args_str});")
         
         elif isinstance(stmt, SwitchStatement):
             expr_str = self.generate_expression(stmt.expression)
             
-            code = f"{self.indent()}switch ({expr_str}) {{\n"
-            self.indent_level += 1
+            self.out.line(f"switch ({expr_str}) {{")
+            self.out.indent()
             
             for case in stmt.cases:
                 case_value_str = self.generate_expression(case.value)
-                code += f"{self.indent()}case {case_value_str}\n"
+                self.out.line(f"case {case_value_str}")
                 
-                self.indent_level += 1
+                self.out.indent()
                 for s in case.body:
-                    code += self.generate_statement(s)
-                self.indent_level -= 1
+                    self.generate_statement(s)
+                self.out.dedent()
             
             if stmt.default_body:
-                code += f"{self.indent()}default {{\n"
-                self.indent_level += 1
+                self.out.line("default {")
+                self.out.indent()
                 for s in stmt.default_body:
-                    code += self.generate_statement(s)
-                self.indent_level -= 1
-                code += f"{self.indent()}}}\n"
+                    self.generate_statement(s)
+                self.out.dedent()
+                self.out.line("}")
             
-            self.indent_level -= 1
-            code += f"{self.indent()}}}\n"
-            return code
-        
-        return ""
+            self.out.dedent()
+            self.out.line("}")
     
     def generate_expression(self, expr):
         from parser.ast import FunctionCall
@@ -0,0 +1,336 @@
+from parser.ast import NodeVisitor, Identifier, NumberLiteral, FloatLiteral, VarDeclaration
+
+PURE = 0
+READS = 1
+WRITES = 2
+EFFECT_LEVELS = {"none": PURE, "reads": READS, "writes": WRITES}
+BUILTIN_EFFECTS = {"random": WRITES}
+TRAPPING_OPERATORS = {"/", "%", "//"}
+
+
+def reachable_functions(callees, root):
+    reachable = set()
+    pending = [root]
+    
+    while pending:
+        name = pending.pop()
+        if name in reachable or name not in callees:
+            continue
+        reachable.add(name)
+        pending.extend(callees[name])
+    
+    return reachable
+
+
+def call_order(callees, roots):
+    order = []
+    visited = set()
+    
+    for root in roots:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(sorted(callees.get(root, ()))))]
+        
+        while stack:
+            name, pending = stack[-1]
+            for callee in pending:
+                if callee not in visited and callee in callees:
+                    visited.add(callee)
+                    stack.append((callee, iter(sorted(callees.get(callee, ())))))
+                    break
+            else:
+                stack.pop()
+                order.append(name)
+    
+    return order
+
+
+def independent_iterations(loop):
+    counter = loop.counter.name if isinstance(loop.counter, VarDeclaration) else loop.counter
+    scanner = IterationScanner(counter)
+    scanner.visit_value(loop.condition)
+    scanner.visit_value(loop.body)
+    return scanner.independent and bool(scanner.written)
+
+
+class FunctionFacts:
+    def __init__(self):
+        self.locals = {}
+        self.arrays = set()
+        self.returns = []
+
+
+class ProgramAnalysis:
+    def __init__(self):
+        self.uses_find = False
+        self.called_functions = set()
+        self.used_stdlib = set()
+        self.used_stdlib_functions = set()
+        self.features = set()
+        self.functions = {}
+        self.call_sites = {}
+        self.calls = {}
+        self.callees = {}
+        self.callers = {}
+    
+    def arguments_for(self, callee):
+        return self.call_sites.get(callee, ())
+    
+    def calls_from(self, caller):
+        return self.calls.get(caller, ())
+    
+    def callers_of(self, callee):
+        return self.callers.get(callee, ())
+    
+    def reachable_from(self, root):
+        return reachable_functions(self.callees, root)
+
+
+class ProgramAnalyzer(NodeVisitor):
+    def __init__(self, stdlib_functions=None):
+        self.stdlib_owners = {}
+        for stdlib_name, functions in (stdlib_functions or {}).items():
+            for func_name in functions:
+                self.stdlib_owners[func_name] = stdlib_name
+    
+    def analyze(self, program):
+        self.result = ProgramAnalysis()
+        
+        for function in program.functions:
+            self.caller = function.name
+            self.facts = FunctionFacts()
+            self.result.functions[function.name] = self.facts
+            self.result.calls.setdefault(function.name, [])
+            self.result.callees.setdefault(function.name, set())
+            self.visit_value(function.body)
+        
+        self.caller = None
+        self.facts = None
+        return self.result
+    
+    def add_call(self, callee, arguments):
+        result = self.result
+        arguments = arguments or []
+        
+        result.called_functions.add(callee)
+        if callee in self.stdlib_owners:
+            result.used_stdlib.add(self.stdlib_owners[callee])
+            result.used_stdlib_functions.add(callee)
+        elif callee == "random":
+            result.features.add("random")
+        
+        result.callees[self.caller].add(callee)
+        result.callers.setdefault(callee, set()).add(self.caller)
+        result.calls[self.caller].append((callee, arguments))
+        result.call_sites.setdefault(callee, []).append(arguments)
+    
+    def visit_FunctionCall(self, node):
+        self.add_call(node.name, node.arguments)
+        self.generic_visit(node)
+    
+    def visit_CallStatement(self, node):
+        self.add_call(node.func_name, node.arguments)
+        self.generic_visit(node)
+    
+    def visit_PrintStatement(self, node):
+        self.result.features.add("print")
+        self.generic_visit(node)
+    
+    def visit_InptCall(self, node):
+        self.result.features.add("input")
+        self.generic_visit(node)
+    
+    def visit_ConvertExpression(self, node):
+        self.result.features.add("convert")
+        self.generic_visit(node)
+    
+    def visit_CCallStatement(self, node):
+        self.result.features.add("c_call")
+        self.generic_visit(node)
+    
+    def visit_FindCall(self, node):
+        self.result.uses_find = True
+        self.generic_visit(node)
+    
+    def visit_BinaryOp(self, node):
+        if node.operator == "//":
+            self.result.features.add("floor_div")
+        self.generic_visit(node)
+    
+    def visit_ReturnStatement(self, node):
+        if node.value is not None:
+            self.facts.returns.append(node.value)
+        self.generic_visit(node)
+    
+    def visit_ForStatement(self, node):
+        if independent_iterations(node):
+            self.result.features.add("canonical_loop")
+        self.generic_visit(node)
+    
+    def visit_VarDeclaration(self, node):
+        self.facts.locals[node.name] = node.var_type
+        self.generic_visit(node)
+    
+    def visit_ArrayDeclaration(self, node):
+        self.facts.locals[node.name] = node.array_type
+        self.facts.arrays.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_StructVarDeclaration(self, node):
+        self.facts.locals[node.name] = node.struct_type
+        self.generic_visit(node)
+    
+    def visit_ConvertStatement(self, node):
+        self.result.features.add("convert")
+        if isinstance(node.expression, Identifier):
+            self.facts.locals[node.expression.name] = node.target_type
+        self.generic_visit(node)
+
+
+class IterationScanner(NodeVisitor):
+    def __init__(self, counter):
+        self.counter = counter
+        self.independent = True
+        self.written = set()
+    
+    def at_counter(self, index):
+        return isinstance(index, Identifier) and index.name == self.counter
+    
+    def dependent(self, node):
+        self.independent = False
+    
+    visit_FunctionCall = dependent
+    visit_CallStatement = dependent
+    visit_CCallStatement = dependent
+    visit_PrintStatement = dependent
+    visit_InptCall = dependent
+    visit_PointerAssignment = dependent
+    visit_Dereference = dependent
+    visit_AddressOf = dependent
+    visit_ConvertStatement = dependent
+    visit_ConvertExpression = dependent
+    visit_WhileStatement = dependent
+    visit_ForStatement = dependent
+    visit_InfStatement = dependent
+    visit_ReturnStatement = dependent
+    visit_BreakStatement = dependent
+    visit_StopStatement = dependent
+    
+    def assign(self, node):
+        if node.name == self.counter:
+            self.independent = False
+        self.generic_visit(node)
+    
+    visit_Assignment = assign
+    visit_IncrementStatement = assign
+    visit_DecrementStatement = assign
+    
+    def visit_ArrayAssignment(self, node):
+        if not self.at_counter(node.index):
+            self.independent = False
+        self.written.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_ArrayAccess(self, node):
+        if not self.at_counter(node.index):
+            self.independent = False
+        self.generic_visit(node)
+
+
+class AddressScanner(NodeVisitor):
+    def __init__(self):
+        self.names = set()
+    
+    def visit_AddressOf(self, node):
+        if isinstance(node.operand, Identifier):
+            self.names.add(node.operand.name)
+        self.generic_visit(node)
+
+
+class EffectScanner(NodeVisitor):
+    def __init__(self, params=()):
+        self.params = set(params)
+        self.effect = PURE
+        self.speculatable = True
+        self.callees = set()
+    
+    def write(self, node):
+        self.effect = WRITES
+        self.generic_visit(node)
+    
+    visit_PrintStatement = write
+    visit_InptCall = write
+    visit_CCallStatement = write
+    visit_PointerAssignment = write
+    
+    def unsafe(self, node):
+        self.speculatable = False
+        self.generic_visit(node)
+    
+    visit_WhileStatement = unsafe
+    visit_ForStatement = unsafe
+    visit_InfStatement = unsafe
+    visit_ArrayAccess = unsafe
+    visit_Dereference = unsafe
+    visit_ConvertExpression = unsafe
+    visit_ConvertStatement = unsafe
+    
+    def visit_ArrayAssignment(self, node):
+        if node.name in self.params:
+            self.effect = WRITES
+        self.generic_visit(node)
+    
+    def visit_FunctionCall(self, node):
+        self.callees.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_CallStatement(self, node):
+        self.callees.add(node.func_name)
+        self.generic_visit(node)
+    
+    def visit_BinaryOp(self, node):
+        if node.operator in TRAPPING_OPERATORS:
+            divisor = node.right
+            if type(divisor) not in (NumberLiteral, FloatLiteral) or divisor.value in (0, -1):
+                self.speculatable = False
+        self.generic_visit(node)
+
+
+class EffectAnalysis:
+    def __init__(self, functions, external_effects=None):
+        self.external_effects = external_effects or {}
+        self.effects = {}
+        self.speculatable = set()
+        scanners = {}
+        
+        for function in functions:
+            scanner = EffectScanner(function.params)
+            scanner.visit_value(function.body)
+            scanners[function.name] = scanner
+            self.effects[function.name] = scanner.effect
+        
+        changed = True
+        while changed:
+            changed = False
+            for name, scanner in scanners.items():
+                effect = max([self.effects[name]] + [self.call_effect(callee) for callee in scanner.callees])
+                if effect != self.effects[name]:
+                    self.effects[name] = effect
+                    changed = True
+                if name not in self.speculatable and scanner.speculatable and scanner.callees <= self.speculatable:
+                    self.speculatable.add(name)
+                    changed = True
+    
+    def call_effect(self, name):
+        if name in self.effects:
+            return self.effects[name]
+        if name in self.external_effects:
+            return EFFECT_LEVELS[self.external_effects[name]]
+        return BUILTIN_EFFECTS.get(name, WRITES)
+    
+    def scan(self, node):
+        scanner = EffectScanner()
+        scanner.visit_value(node)
+        effect = max([scanner.effect] + [self.call_effect(callee) for callee in scanner.callees])
+        return effect, scanner.speculatable and scanner.callees <= self.speculatable
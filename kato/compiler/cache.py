@@ -0,0 +1,257 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import functools
+import tempfile
+from pathlib import Path
+
+from parser.ast import ASTNode, FunctionCall, CallStatement, StructVarDeclaration
+
+CACHE_FORMAT = 1
+MISSING = object()
+
+
+def default_cache_dir():
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if not cache_home:
+        cache_home = Path.home() / '.cache'
+    return Path(cache_home) / 'kato'
+
+
+@functools.lru_cache(maxsize=None)
+def compiler_fingerprint():
+    digest = hashlib.sha256()
+    kato_root = Path(__file__).resolve().parent.parent
+    for path in sorted(kato_root.rglob('*.py')):
+        digest.update(str(path.relative_to(kato_root)).encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def write_atomic(target, data):
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, target)
+    except OSError:
+        os.unlink(temp_path)
+        raise
+
+
+class CompilationCache:
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.entries_dir = self.cache_dir / 'entries'
+        self.stats_file = self.cache_dir / 'stats.json'
+    
+    def make_key(self, source_code, dependencies, stdlib_imports, flags):
+        digest = hashlib.sha256()
+        digest.update(f"kato-cache-{CACHE_FORMAT}\0{sys.platform}\0".encode('utf-8'))
+        digest.update(compiler_fingerprint().encode('utf-8'))
+        digest.update(b"\0main\0")
+        digest.update(source_code.encode('utf-8'))
+        
+        for path in dependencies:
+            digest.update(f"\0dep\0{path}\0".encode('utf-8'))
+            digest.update(Path(path).read_bytes())
+        
+        digest.update(f"\0stdlib\0{','.join(sorted(stdlib_imports))}".encode('utf-8'))
+        for name in sorted(flags):
+            digest.update(f"\0flag\0{name}={flags[name]}".encode('utf-8'))
+        
+        return digest.hexdigest()
+    
+    def entry_dir(self, key):
+        return self.entries_dir / key[:2] / key
+    
+    def lookup(self, key):
+        c_file = self.entry_dir(key) / 'output.c'
+        try:
+            c_code = c_file.read_text(encoding='utf-8')
+        except OSError:
+            self.record('misses')
+            return None
+        
+        self.record('hits')
+        return c_code
+    
+    def restore_binary(self, key, output_file):
+        binary = self.entry_dir(key) / 'binary'
+        try:
+            shutil.copyfile(binary, output_file)
+            os.chmod(output_file, 0o755)
+        except OSError:
+            return False
+        return True
+    
+    def store(self, key, c_code=None, binary=None):
+        entry = self.entry_dir(key)
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            if c_code is not None:
+                write_atomic(entry / 'output.c', c_code.encode('utf-8'))
+            if binary is not None:
+                write_atomic(entry / 'binary', Path(binary).read_bytes())
+        except OSError:
+            pass
+    
+    def summary_file(self, content_hash):
+        key = hashlib.sha256(f"{compiler_fingerprint()}\0{content_hash}".encode('utf-8')).hexdigest()
+        return self.cache_dir / 'summaries' / f"{key}.json"
+    
+    def load_summaries(self, content_hash):
+        try:
+            with open(self.summary_file(content_hash), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def store_summaries(self, content_hash, summaries):
+        target = self.summary_file(content_hash)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(target, json.dumps(summaries).encode('utf-8'))
+        except OSError:
+            pass
+    
+    def load_stats(self):
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"hits": 0, "misses": 0}
+    
+    def record(self, counter):
+        stats = self.load_stats()
+        stats[counter] = stats.get(counter, 0) + 1
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.stats_file, json.dumps(stats).encode('utf-8'))
+        except OSError:
+            pass
+    
+    def stats(self):
+        stats = self.load_stats()
+        entries = 0
+        total_size = 0
+        
+        if self.entries_dir.exists():
+            for entry in self.entries_dir.glob('*/*'):
+                entries += 1
+                for item in entry.iterdir():
+                    total_size += item.stat().st_size
+        
+        function_packs = 0
+        functions_dir = self.cache_dir / 'functions'
+        if functions_dir.exists():
+            for pack in functions_dir.glob('*.json'):
+                function_packs += 1
+                total_size += pack.stat().st_size
+        
+        summary_files = 0
+        summaries_dir = self.cache_dir / 'summaries'
+        if summaries_dir.exists():
+            for summary_file in summaries_dir.glob('*.json'):
+                summary_files += 1
+                total_size += summary_file.stat().st_size
+        
+        stats["entries"] = entries
+        stats["function_packs"] = function_packs
+        stats["summary_files"] = summary_files
+        stats["size"] = total_size
+        return stats
+    
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+
+def flatten_node(node, out, callees, struct_types):
+    if isinstance(node, ASTNode):
+        node_type = type(node)
+        out.append(node_type.__name__)
+        if node_type is FunctionCall:
+            callees.add(node.name)
+        elif node_type is CallStatement:
+            callees.add(node.func_name)
+        elif node_type is StructVarDeclaration:
+            struct_types.add(node.struct_type)
+        for name in node_type.__slots__:
+            value = getattr(node, name, MISSING)
+            if value is MISSING:
+                out.append(None)
+            else:
+                flatten_node(value, out, callees, struct_types)
+        if getattr(node, 'line_number', None) is not None:
+            out.append(node.source_line)
+    elif isinstance(node, (list, tuple)):
+        out.append(len(node))
+        for item in node:
+            flatten_node(item, out, callees, struct_types)
+    elif isinstance(node, dict):
+        out.append(len(node))
+        for key, value in node.items():
+            out.append(key)
+            flatten_node(value, out, callees, struct_types)
+    else:
+        out.append(node)
+
+
+class FunctionCodeCache:
+    def __init__(self, cache, build_name):
+        build_hash = hashlib.sha256(str(build_name).encode('utf-8')).hexdigest()
+        self.pack_file = cache.cache_dir / 'functions' / f"{build_hash}.json"
+        self.entries = None
+        self.used = {}
+        self.dirty = False
+    
+    def make_key(self, function, compiler):
+        out = [compiler_fingerprint()]
+        callees = set()
+        struct_types = set()
+        flatten_node(function, out, callees, struct_types)
+        if function.name == "main":
+            out.append(("uses_random", compiler.uses_random))
+        ir = compiler.ir_functions.get(function.name)
+        out.append(("ir", tuple(ir.passes) if ir is not None else None))
+        
+        for name in sorted(callees):
+            out.append((name, compiler.get_function_return_type(name)))
+        for name in sorted(struct_types):
+            if name in compiler.struct_definitions:
+                out.append((name, tuple(compiler.struct_definitions[name].items())))
+        
+        return hashlib.sha256(repr(out).encode('utf-8')).hexdigest()
+    
+    def load(self):
+        try:
+            with open(self.pack_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+    
+    def lookup(self, key):
+        if self.entries is None:
+            self.load()
+        
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.used[key] = entry
+        return entry
+    
+    def store(self, key, entry):
+        self.used[key] = entry
+        self.dirty = True
+    
+    def save(self):
+        if not self.dirty and len(self.used) == len(self.entries or {}):
+            return
+        
+        try:
+            self.pack_file.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.pack_file, json.dumps(self.used).encode('utf-8'))
+        except OSError:
+            pass
@@ -1,5 +1,6 @@
+from .emitter import Emitter
 from .expressions import ExpressionCodegen
 from .statements import StatementCodegen
 from .functions import FunctionCodegen
 
-__all__ = ['ExpressionCodegen', 'StatementCodegen', 'FunctionCodegen']
+__all__ = ['Emitter', 'ExpressionCodegen', 'StatementCodegen', 'FunctionCodegen']
@@ -0,0 +1,35 @@
+class Emitter:
+    def __init__(self, stream=None, indent_text="    "):
+        self.stream = stream
+        self.indent_text = indent_text
+        self.indent_level = 0
+        self.chunks = []
+    
+    def indent(self):
+        self.indent_level += 1
+    
+    def dedent(self):
+        self.indent_level -= 1
+    
+    def prefix(self):
+        return self.indent_text * self.indent_level
+    
+    def write(self, text):
+        self.chunks.append(text)
+    
+    def start_line(self, text):
+        self.chunks.append(self.indent_text * self.indent_level)
+        self.chunks.append(text)
+    
+    def line(self, text):
+        self.chunks.append(self.indent_text * self.indent_level)
+        self.chunks.append(text)
+        self.chunks.append("\n")
+    
+    def flush(self):
+        if self.stream is not None and self.chunks:
+            self.stream.write("".join(self.chunks))
+            self.chunks.clear()
+    
+    def getvalue(self):
+        return "".join(self.chunks)
@@ -3,77 +3,137 @@ from parser.ast import (
     Identifier, BinaryOp, InptCall, ArrayAccess, FunctionCall,
     ConvertExpression, FindCall, StructAccess, AddressOf, Dereference
 )
+from compiler.preprocessor import stdlib_return_types
+
+ARITHMETIC_OPERATORS = {"+", "-", "*", "/", "%", "//"}
+LITERAL_TYPES = {NumberLiteral: "int", FloatLiteral: "float", CharLiteral: "char", StringLiteral: "string"}
 
 
 class ExpressionCodegen:
     def __init__(self, compiler):
         self.compiler = compiler
+        self.handlers = {
+            StringLiteral: self.compile_string_literal,
+            CharLiteral: self.compile_char_literal,
+            NumberLiteral: self.compile_number_literal,
+            FloatLiteral: self.compile_number_literal,
+            Identifier: self.compile_identifier,
+            ArrayAccess: self.compile_array_access,
+            BinaryOp: self.compile_binary_op,
+            InptCall: self.compile_inpt_call,
+            FunctionCall: self.compile_function_call,
+            ConvertExpression: self.compile_convert_expression,
+            FindCall: self.compile_find_call,
+            StructAccess: self.compile_struct_access,
+            AddressOf: self.compile_address_of,
+            Dereference: self.compile_dereference,
+        }
     
     def compile_expr(self, expr, var_type=None):
-        if isinstance(expr, StringLiteral):
-            escaped_string = expr.value.replace('\\', '\\\\').replace('\n', '\\n').replace('\t', '\\t').replace('\r', '\\r').replace('"', '\\"')
-            return f'"{escaped_string}"'
-        elif isinstance(expr, CharLiteral):
-            if len(expr.value) == 1:
-                return f"'{expr.value}'"
-            else:
-                return f"'{expr.value[0]}'"
-        elif isinstance(expr, NumberLiteral):
-            return str(expr.value)
-        elif isinstance(expr, FloatLiteral):
-            return str(expr.value)
-        elif isinstance(expr, Identifier):
-            return expr.name
-        elif isinstance(expr, ArrayAccess):
-            index = self.compile_expr(expr.index, var_type)
-            return f"{expr.name}[{index}]"
-        elif isinstance(expr, BinaryOp):
-            left = self.compile_expr(expr.left, var_type)
-            right = self.compile_expr(expr.right, var_type)
-            return f"({left} {expr.operator} {right})"
-        elif isinstance(expr, InptCall):
-            prompt = self.compile_expr(expr.prompt, var_type)
-            
-            if var_type == "int":
-                return f"(printf({prompt}), scanf(\"%d\", &(int){{0}}), (int){{0}})"
-            elif var_type == "float":
-                return f"(printf({prompt}), scanf(\"%f\", &(float){{0.0}}), (float){{0.0}})"
-            elif var_type == "char":
-                return f"(printf({prompt}), getchar())"
-            elif var_type == "string":
-                return f"(printf({prompt}), (char[256]){{0}})"
-            else:
-                return f"(printf({prompt}), 0)"
-        elif isinstance(expr, FunctionCall):
-            return_type = self.compiler.get_function_return_type(expr.name)
-            
-            if return_type == "void":
-                raise ValueError(f"Cannot use void function '{expr.name}' in expression")
-            
-            if expr.name == "random":
-                if len(expr.arguments) == 2:
-                    min_val = self.compile_expr(expr.arguments[0])
-                    max_val = self.compile_expr(expr.arguments[1])
-                    return f"({min_val} + rand() % (({max_val}) - ({min_val}) + 1))"
-                else:
-                    return "0"
+        handler = self.handlers.get(type(expr))
+        if handler is None:
+            return "0"
+        return handler(expr, var_type)
+    
+    def compile_string_literal(self, expr, var_type):
+        escaped_string = expr.value.replace('\\', '\\\\').replace('\n', '\\n').replace('\t', '\\t').replace('\r', '\\r').replace('"', '\\"')
+        return f'"{escaped_string}"'
+    
+    def compile_char_literal(self, expr, var_type):
+        if len(expr.value) == 1:
+            return f"'{expr.value}'"
+        else:
+            return f"'{expr.value[0]}'"
+    
+    def compile_number_literal(self, expr, var_type):
+        return str(expr.value)
+    
+    def compile_identifier(self, expr, var_type):
+        return expr.name
+    
+    def compile_array_access(self, expr, var_type):
+        index = self.compile_expr(expr.index, var_type)
+        return f"{expr.name}[{index}]"
+    
+    def compile_binary_op(self, expr, var_type):
+        left = self.compile_expr(expr.left, var_type)
+        right = self.compile_expr(expr.right, var_type)
+        if expr.operator == "//":
+            if self.expression_type(expr) == "float":
+                return f"kato_floor_divf({left}, {right})"
+            return f"kato_floor_div({left}, {right})"
+        return f"({left} {expr.operator} {right})"
+    
+    def expression_type(self, expr):
+        if type(expr) in LITERAL_TYPES:
+            return LITERAL_TYPES[type(expr)]
+        if isinstance(expr, (Identifier, ArrayAccess)):
+            return self.compiler.variables.get(expr.name)
+        if isinstance(expr, BinaryOp):
+            if expr.operator not in ARITHMETIC_OPERATORS:
+                return "int"
+            operand_types = (self.expression_type(expr.left), self.expression_type(expr.right))
+            if "string" in operand_types:
+                return "string"
+            return "float" if "float" in operand_types else "int"
+        if isinstance(expr, FunctionCall):
+            if expr.name in self.compiler.function_return_types:
+                return self.compiler.get_function_return_type(expr.name)
+            return stdlib_return_types(self.compiler.stdlib_imports).get(expr.name)
+        if isinstance(expr, StructAccess):
+            fields = self.compiler.struct_definitions.get(self.compiler.variables.get(expr.struct_name), {})
+            return fields.get(expr.field_name)
+        if isinstance(expr, ConvertExpression):
+            return expr.target_type
+        return None
+    
+    def compile_inpt_call(self, expr, var_type):
+        prompt = self.compile_expr(expr.prompt, var_type)
+        
+        if var_type == "int":
+            return f"(printf({prompt}), scanf(\"%d\", &(int){{0}}), (int){{0}})"
+        elif var_type == "float":
+            return f"(printf({prompt}), scanf(\"%f\", &(float){{0.0}}), (float){{0.0}})"
+        elif var_type == "char":
+            return f"(printf({prompt}), getchar())"
+        elif var_type == "string":
+            return f"(printf({prompt}), (char[256]){{0}})"
+        else:
+            return f"(printf({prompt}), 0)"
+    
+    def compile_function_call(self, expr, var_type):
+        return_type = self.compiler.get_function_return_type(expr.name)
+        
+        if return_type == "void":
+            raise ValueError(f"Cannot use void function '{expr.name}' in expression")
+        
+        if expr.name == "random":
+            if len(expr.arguments) == 2:
+                min_val = self.compile_expr(expr.arguments[0])
+                max_val = self.compile_expr(expr.arguments[1])
+                return f"({min_val} + rand() % (({max_val}) - ({min_val}) + 1))"
             else:
-                args = ", ".join([self.compile_expr(arg) for arg in expr.arguments])
-                return f"{expr.name}({args})"
-        elif isinstance(expr, ConvertExpression):
-            return f"__convert_temp__"
-        elif isinstance(expr, FindCall):
-            self.compiler.uses_find = True
-            target_code = self.compile_expr(expr.target)
-            pattern_code = self.compile_expr(expr.pattern)
-            return f"kato_find({target_code}, {pattern_code})"
-        elif isinstance(expr, StructAccess):
-            return f"{expr.struct_name}.{expr.field_name}"
-        elif isinstance(expr, AddressOf):
-            operand_code = self.compile_expr(expr.operand)
-            return f"&{operand_code}"
-        elif isinstance(expr, Dereference):
-            operand_code = self.compile_expr(expr.operand)
-            return f"(*{operand_code})"
+                return "0"
         else:
-            return "0"
+            args = ", ".join([self.compile_expr(arg) for arg in expr.arguments])
+            return f"{expr.name}({args})"
+    
+    def compile_convert_expression(self, expr, var_type):
+        return f"__convert_temp__"
+    
+    def compile_find_call(self, expr, var_type):
+        self.compiler.uses_find = True
+        target_code = self.compile_expr(expr.target)
+        pattern_code = self.compile_expr(expr.pattern)
+        return f"kato_find({target_code}, {pattern_code})"
+    
+    def compile_struct_access(self, expr, var_type):
+        return f"{expr.struct_name}.{expr.field_name}"
+    
+    def compile_address_of(self, expr, var_type):
+        operand_code = self.compile_expr(expr.operand)
+        return f"&{operand_code}"
+    
+    def compile_dereference(self, expr, var_type):
+        operand_code = self.compile_expr(expr.operand)
+        return f"(*{operand_code})"
@@ -9,64 +9,65 @@ from parser.ast import (
     StringLiteral, NumberLiteral, FloatLiteral, Identifier, BinaryOp, InptCall, ArrayAccess, CharLiteral,
     ConvertExpression, FunctionCall, StructAccess
 )
+from compiler.analysis import independent_iterations
 import re
 
+C_TYPES = {
+    "int": "int",
+    "float": "float",
+    "char": "char",
+    "string": "char*",
+    "int*": "int*",
+    "float*": "float*",
+    "char*": "char*",
+    "string*": "char**"
+}
+PRINT_FORMATS = {"int": "%d", "float": "%f", "char": "%c", "string": "%s"}
+
 
 class StatementCodegen:
     def __init__(self, compiler, expr_codegen):
         self.compiler = compiler
         self.expr_codegen = expr_codegen
+        self.handlers = {
+            BreakStatement: self.compile_break,
+            ContinueStatement: self.compile_continue,
+            CImportStatement: self.compile_c_import,
+            CCallStatement: self.compile_c_call,
+            PrintStatement: self.compile_print,
+            ReturnStatement: self.compile_return,
+            VarDeclaration: self.compile_var_declaration,
+            CallStatement: self.compile_call,
+            IfStatement: self.compile_if,
+            Assignment: self.compile_assignment,
+            WhileStatement: self.compile_while,
+            IncrementStatement: self.compile_increment,
+            DecrementStatement: self.compile_decrement,
+            ArrayDeclaration: self.compile_array_declaration,
+            ArrayAssignment: self.compile_array_assignment,
+            SwitchStatement: self.compile_switch,
+            ConvertStatement: self.compile_convert,
+            InfStatement: self.compile_inf,
+            StopStatement: self.compile_break,
+            ForStatement: self.compile_for,
+            StructVarDeclaration: self.compile_struct_var_declaration,
+            StructFieldAssignment: self.compile_struct_field_assignment,
+            PointerAssignment: self.compile_pointer_assignment,
+        }
     
     def compile_statement(self, statement):
-        line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
-        if isinstance(statement, BreakStatement):
-            return f'{self.compiler.indent()}break;{line_comment}\n'
-        elif isinstance(statement, ContinueStatement):
-            return f'{self.compiler.indent()}continue;{line_comment}\n'
-        elif isinstance(statement, CImportStatement):
-            return self.compile_c_import(statement)
-        elif isinstance(statement, CCallStatement):
-            return self.compile_c_call(statement)
-        elif isinstance(statement, PrintStatement):
-            return self.compile_print(statement)
-        elif isinstance(statement, ReturnStatement):
-            return self.compile_return(statement)
-        elif isinstance(statement, VarDeclaration):
-            return self.compile_var_declaration(statement)
-        elif isinstance(statement, CallStatement):
-            return self.compile_call(statement)
-        elif isinstance(statement, IfStatement):
-            return self.compile_if(statement)
-        elif isinstance(statement, Assignment):
-            return self.compile_assignment(statement)
-        elif isinstance(statement, WhileStatement):
-            return self.compile_while(statement)
-        elif isinstance(statement, IncrementStatement):
-            return self.compile_increment(statement)
-        elif isinstance(statement, DecrementStatement):
-            return self.compile_decrement(statement)
-        elif isinstance(statement, ArrayDeclaration):
-            return self.compile_array_declaration(statement)
-        elif isinstance(statement, ArrayAssignment):
-            return self.compile_array_assignment(statement)
-        elif isinstance(statement, SwitchStatement):
-            return self.compile_switch(statement)
-        elif isinstance(statement, ConvertStatement):
-            return self.compile_convert(statement)
-        elif isinstance(statement, InfStatement):
-            return self.compile_inf(statement)
-        elif isinstance(statement, StopStatement):
-            return f'{self.compiler.indent()}break;{line_comment}\n'
-        elif isinstance(statement, ForStatement):
-            return self.compile_for(statement)
-        elif isinstance(statement, StructVarDeclaration):
-            return self.compile_struct_var_declaration(statement)
-        elif isinstance(statement, StructFieldAssignment):
-            return self.compile_struct_field_assignment(statement)
-        elif isinstance(statement, PointerAssignment):
-            return self.compile_pointer_assignment(statement)
-        else:
+        handler = self.handlers.get(type(statement))
+        if handler is None:
             raise ValueError(f"Unknown statement type: {type(statement).__name__}")
+        handler(statement)
+    
+    def compile_break(self, statement):
+        line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
+        self.compiler.out.line(f'break;{line_comment}')
+    
+    def compile_continue(self, statement):
+        line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
+        self.compiler.out.line(f'continue;{line_comment}')
     
     def compile_print(self, statement):
         line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
@@ -182,7 +183,7 @@ class StatementCodegen:
                     format_parts.append("%s")
                     printf_args.append(self.expr_codegen.compile_expr(value))
             elif isinstance(value, BinaryOp):
-                format_parts.append("%d")
+                format_parts.append(PRINT_FORMATS.get(self.expr_codegen.expression_type(value), "%d"))
                 printf_args.append(self.expr_codegen.compile_expr(value))
             elif isinstance(value, FunctionCall):
                 func_name = value.name
@@ -193,7 +194,7 @@ class StatementCodegen:
                 elif func_name == "random":
                     format_parts.append("%d")
                 else:
-                    format_parts.append("%s")
+                    format_parts.append(PRINT_FORMATS.get(self.expr_codegen.expression_type(value), "%d"))
                 printf_args.append(self.expr_codegen.compile_expr(value))
         
    
@@ -202,27 +203,33 @@ class StatementCodegen:
         
         if printf_args:
             args_str = ", ".join(printf_args)
-            return f'{self.compiler.indent()}printf("{escaped_string}", {args_str});{line_comment}\n'
+            self.compiler.out.line(f'printf("{escaped_string}", {args_str});{line_comment}')
         else:
-            return f'{self.compiler.indent()}printf("{escaped_string}");{line_comment}\n'
+            self.compiler.out.line(f'printf("{escaped_string}");{line_comment}')
     
     def compile_return(self, statement):
         line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
         value = statement.value
         
         if isinstance(value, NumberLiteral):
-            return f'{self.compiler.indent()}return {value.value};{line_comment}\n'
+            self.compiler.out.line(f'return {value.value};{line_comment}')
         elif isinstance(value, FloatLiteral):
-            return f'{self.compiler.indent()}return (int){value.value};{line_comment}\n'
+            if self.compiler.return_type == "float":
+                self.compiler.out.line(f'return {value.value};{line_comment}')
+            else:
+                self.compiler.out.line(f'return (int){value.value};{line_comment}')
         elif isinstance(value, StringLiteral):
-            return f'{self.compiler.indent()}return 0;{line_comment}\n'
+            if self.compiler.return_type == "string":
+                self.compiler.out.line(f'return {self.expr_codegen.compile_expr(value)};{line_comment}')
+            else:
+                self.compiler.out.line(f'return 0;{line_comment}')
         elif isinstance(value, Identifier):
-            return f'{self.compiler.indent()}return {value.name};{line_comment}\n'
+            self.compiler.out.line(f'return {value.name};{line_comment}')
         elif isinstance(value, BinaryOp):
-            return f'{self.compiler.indent()}return {self.expr_codegen.compile_expr(value)};{line_comment}\n'
+            self.compiler.out.line(f'return {self.expr_codegen.compile_expr(value)};{line_comment}')
         else:
             
-            return f'{self.compiler.indent()}return {self.expr_codegen.compile_expr(value)};{line_comment}\n'
+            self.compiler.out.line(f'return {self.expr_codegen.compile_expr(value)};{line_comment}')
     
     def compile_var_declaration(self, statement):
         line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
@@ -232,65 +239,52 @@ class StatementCodegen:
         
         self.compiler.variables[var_name] = var_type
         
-        c_type_map = {
-            "int": "int",
-            "float": "float",
-            "char": "char",
-            "string": "char*",
-            "int*": "int*",
-            "float*": "float*",
-            "char*": "char*",
-            "string*": "char**"
-        }
-        c_type = c_type_map.get(var_type, "int")
+        c_type = C_TYPES.get(var_type, "int")
         
         if isinstance(var_value, InptCall):
             prompt = self.expr_codegen.compile_expr(var_value.prompt)
-            code = f'{self.compiler.indent()}{c_type} {var_name}; {line_comment}\n'
-            code += f'{self.compiler.indent()}printf({prompt});\n'
+            self.compiler.out.line(f'{c_type} {var_name}; {line_comment}')
+            self.compiler.out.line(f'printf({prompt});')
             
             if var_type == "int":
-                code += f'{self.compiler.indent()}scanf("%d", &{var_name});\n'
+                self.compiler.out.line(f'scanf("%d", &{var_name});')
             elif var_type == "float":
-                code += f'{self.compiler.indent()}scanf("%f", &{var_name});\n'
+                self.compiler.out.line(f'scanf("%f", &{var_name});')
             elif var_type == "char":
-                code += f'{self.compiler.indent()}scanf(" %c", &{var_name});\n'
+                self.compiler.out.line(f'scanf(" %c", &{var_name});')
             elif var_type == "string":
-                code += f'{self.compiler.indent()}{var_name} = (char*)malloc(4096);\n'
-                code += f'{self.compiler.indent()}fgets({var_name}, 4096, stdin);\n'
-                code += f'{self.compiler.indent()}{var_name}[strcspn({var_name}, "\\n")] = 0;\n'
-            
-            return code
+                self.compiler.out.line(f'{var_name} = (char*)malloc(4096);')
+                self.compiler.out.line(f'fgets({var_name}, 4096, stdin);')
+                self.compiler.out.line(f'{var_name}[strcspn({var_name}, "\\n")] = 0;')
         elif isinstance(var_value, ConvertExpression):
             self.compiler.uses_conversion = True
             source_expr = self.expr_codegen.compile_expr(var_value.expression)
             target_type = var_value.target_type
             
-            code = f'{self.compiler.indent()}{c_type} {var_name}; {line_comment}\n'
-            code += f'{self.compiler.indent()}{{\n'
-            self.compiler.indent_level += 1
+            self.compiler.out.line(f'{c_type} {var_name}; {line_comment}')
+            self.compiler.out.line('{')
+            self.compiler.out.indent()
             
             if target_type == "string":
                 # Converting to string
                 source_var = var_value.expression.name if isinstance(var_value.expression, Identifier) else None
                 if source_var and source_var in self.compiler.variables:
                     source_type = self.compiler.variables[source_var]
-                    code += f'{self.compiler.indent()}{var_name} = (char*)malloc(32);\n'
+                    self.compiler.out.line(f'{var_name} = (char*)malloc(32);')
                     if source_type == "int":
-                        code += f'{self.compiler.indent()}sprintf({var_name}, "%d", {source_expr});\n'
+                        self.compiler.out.line(f'sprintf({var_name}, "%d", {source_expr});')
                     elif source_type == "float":
-                        code += f'{self.compiler.indent()}sprintf({var_name}, "%f", {source_expr});\n'
+                        self.compiler.out.line(f'sprintf({var_name}, "%f", {source_expr});')
                     elif source_type == "char":
-                        code += f'{self.compiler.indent()}sprintf({var_name}, "%c", {source_expr});\n'
+                        self.compiler.out.line(f'sprintf({var_name}, "%c", {source_expr});')
                     else:
-                        code += f'{self.compiler.indent()}strcpy({var_name}, {source_expr});\n'
+                        self.compiler.out.line(f'strcpy({var_name}, {source_expr});')
             
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}\n'
-            return code
+            self.compiler.out.dedent()
+            self.compiler.out.line('}')
         else:
             c_value = self.expr_codegen.compile_expr(var_value, var_type)
-            return f'{self.compiler.indent()}{c_type} {var_name} = {c_value};{line_comment}\n'
+            self.compiler.out.line(f'{c_type} {var_name} = {c_value};{line_comment}')
     
     def compile_call(self, statement):
         line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
@@ -302,39 +296,38 @@ class StatementCodegen:
             for arg in arguments:
                 compiled_args.append(self.expr_codegen.compile_expr(arg))
             args_str = ", ".join(compiled_args)
-            return f'{self.compiler.indent()}{func_name}({args_str});{line_comment}\n'
-        
-        return f'{self.compiler.indent()}{func_name}();{line_comment}\n'
+            self.compiler.out.line(f'{func_name}({args_str});{line_comment}')
+        else:
+            self.compiler.out.line(f'{func_name}();{line_comment}')
     
     def compile_if(self, statement):
         condition = self.expr_codegen.compile_expr(statement.condition)
         
-        code = f'{self.compiler.indent()}if ({condition}) {{\n'
-        self.compiler.indent_level += 1
+        self.compiler.out.line(f'if ({condition}) {{')
+        self.compiler.out.indent()
         for stmt in statement.if_body:
-            code += self.compile_statement(stmt)
-        self.compiler.indent_level -= 1
-        code += f'{self.compiler.indent()}}}'
+            self.compile_statement(stmt)
+        self.compiler.out.dedent()
+        self.compiler.out.start_line('}')
         
         for elif_condition, elif_body in statement.elif_parts:
             elif_cond = self.expr_codegen.compile_expr(elif_condition)
-            code += f' else if ({elif_cond}) {{\n'
-            self.compiler.indent_level += 1
+            self.compiler.out.write(f' else if ({elif_cond}) {{\n')
+            self.compiler.out.indent()
             for stmt in elif_body:
-                code += self.compile_statement(stmt)
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}'
+                self.compile_statement(stmt)
+            self.compiler.out.dedent()
+            self.compiler.out.start_line('}')
         
         if statement.else_body:
-            code += f' else {{\n'
-            self.compiler.indent_level += 1
+            self.compiler.out.write(' else {\n')
+            self.compiler.out.indent()
             for stmt in statement.else_body:
-                code += self.compile_statement(stmt)
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}'
+                self.compile_statement(stmt)
+            self.compiler.out.dedent()
+            self.compiler.out.start_line('}')
         
-        code += '\n'
-        return code
+        self.compiler.out.write('\n')
     
     def compile_assignment(self, statement):
         var_name = statement.name
@@ -344,42 +337,38 @@ class StatementCodegen:
         
         if isinstance(var_value, InptCall):
             prompt = self.expr_codegen.compile_expr(var_value.prompt)
-            code = f'{self.compiler.indent()}printf({prompt}); {line_comment}\n'
+            self.compiler.out.line(f'printf({prompt}); {line_comment}')
             
             if var_type == "int":
-                code += f'{self.compiler.indent()}scanf("%d", &{var_name});\n'
+                self.compiler.out.line(f'scanf("%d", &{var_name});')
             elif var_type == "float":
-                code += f'{self.compiler.indent()}scanf("%f", &{var_name});\n'
+                self.compiler.out.line(f'scanf("%f", &{var_name});')
             elif var_type == "char":
-                code += f'{self.compiler.indent()}scanf(" %c", &{var_name});\n'
+                self.compiler.out.line(f'scanf(" %c", &{var_name});')
             elif var_type == "string":
-                code += f'{self.compiler.indent()}fgets({var_name}, 4096, stdin);\n'
-                code += f'{self.compiler.indent()}{var_name}[strcspn({var_name}, "\\n")] = 0;\n'
-            
-            return code
+                self.compiler.out.line(f'fgets({var_name}, 4096, stdin);')
+                self.compiler.out.line(f'{var_name}[strcspn({var_name}, "\\n")] = 0;')
         else:
             c_value = self.expr_codegen.compile_expr(var_value, var_type)
-            return f'{self.compiler.indent()}{var_name} = {c_value};\n'
+            self.compiler.out.line(f'{var_name} = {c_value};')
 
     def compile_while(self, statement):
         condition = self.expr_codegen.compile_expr(statement.condition)
         
-        code = f'{self.compiler.indent()}while ({condition}) {{\n'
-        self.compiler.indent_level += 1
+        self.compiler.out.line(f'while ({condition}) {{')
+        self.compiler.out.indent()
         for stmt in statement.body:
-            code += self.compile_statement(stmt)
-        self.compiler.indent_level -= 1
-        code += f'{self.compiler.indent()}}}\n'
-        
-        return code
+            self.compile_statement(stmt)
+        self.compiler.out.dedent()
+        self.compiler.out.line('}')
     
     def compile_increment(self, statement):
         line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
-        return f'{self.compiler.indent()}{statement.name}++;{line_comment}\n'
+        self.compiler.out.line(f'{statement.name}++;{line_comment}')
     
     def compile_decrement(self, statement):
         line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
-        return f'{self.compiler.indent()}{statement.name}--;{line_comment}\n'
+        self.compiler.out.line(f'{statement.name}--;{line_comment}')
 
     def compile_array_declaration(self, statement):
         array_type = statement.array_type
@@ -403,7 +392,7 @@ class StatementCodegen:
         
         elements_str = ", ".join(compiled_elements)
         
-        return f'{self.compiler.indent()}{c_type} {array_name}[{array_size}] = {{{elements_str}}};\n'
+        self.compiler.out.line(f'{c_type} {array_name}[{array_size}] = {{{elements_str}}};')
     
     def compile_array_assignment(self, statement):
         line_comment = f" // {statement.source_line}" if hasattr(statement, 'source_line') and statement.source_line else ""
@@ -411,40 +400,38 @@ class StatementCodegen:
         index = self.expr_codegen.compile_expr(statement.index)
         value = self.expr_codegen.compile_expr(statement.value)
         
-        return f'{self.compiler.indent()}{array_name}[{index}] = {value};{line_comment}\n'
+        self.compiler.out.line(f'{array_name}[{index}] = {value};{line_comment}')
     
     def compile_switch(self, statement):
         switch_expr = self.expr_codegen.compile_expr(statement.expression)
         
-        code = f'{self.compiler.indent()}switch ({switch_expr}) {{\n'
-        self.compiler.indent_level += 1
+        self.compiler.out.line(f'switch ({switch_expr}) {{')
+        self.compiler.out.indent()
         
         for case in statement.cases:
             case_value = self.expr_codegen.compile_expr(case.value)
-            code += f'{self.compiler.indent()}case {case_value}:\n'
+            self.compiler.out.line(f'case {case_value}:')
             
-            self.compiler.indent_level += 1
+            self.compiler.out.indent()
             has_break = any(isinstance(stmt, BreakStatement) for stmt in case.body)
             for stmt in case.body:
-                code += self.compile_statement(stmt)
+                self.compile_statement(stmt)
             if not has_break:
-                code += f'{self.compiler.indent()}break;\n'
-            self.compiler.indent_level -= 1
+                self.compiler.out.line('break;')
+            self.compiler.out.dedent()
         
         if statement.default_body:
-            code += f'{self.compiler.indent()}default:\n'
-            self.compiler.indent_level += 1
+            self.compiler.out.line('default:')
+            self.compiler.out.indent()
             has_break = any(isinstance(stmt, BreakStatement) for stmt in statement.default_body)
             for stmt in statement.default_body:
-                code += self.compile_statement(stmt)
+                self.compile_statement(stmt)
             if not has_break:
-                code += f'{self.compiler.indent()}break;\n'
-            self.compiler.indent_level -= 1
+                self.compiler.out.line('break;')
+            self.compiler.out.dedent()
         
-        self.compiler.indent_level -= 1
-        code += f'{self.compiler.indent()}}}\n'
-        
-        return code
+        self.compiler.out.dedent()
+        self.compiler.out.line('}')
     
     def compile_convert(self, statement):
         self.compiler.uses_conversion = True
@@ -466,120 +453,115 @@ class StatementCodegen:
         
         temp_var = f"__convert_temp_{var_name}" if var_name else "__convert_temp"
         
-        code = ""
-        
         if target_type == "int":
-            code += f'{self.compiler.indent()}int {temp_var} = 0;\n'
-            code += f'{self.compiler.indent()}{{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}if (strcmp({expr}, "") == 0) {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}fprintf(stderr, "Error: Cannot convert empty string to int\\n");\n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}} else {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}char* endptr;\n'
-            code += f'{self.compiler.indent()}long val = strtol({expr}, &endptr, 10);\n'
-            code += f'{self.compiler.indent()}if (*endptr != \'\\0\') {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}fprintf(stderr, "Error: Cannot convert \\"" "%s" "\\" to int\\n", {expr});\n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}} else {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}{temp_var} = (int)val;\n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}  \n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}  \n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}\n'
+            self.compiler.out.line(f'int {temp_var} = 0;')
+            self.compiler.out.line('{')
+            self.compiler.out.indent()
+            self.compiler.out.line(f'if (strcmp({expr}, "") == 0) {{')
+            self.compiler.out.indent()
+            self.compiler.out.line('fprintf(stderr, "Error: Cannot convert empty string to int\\n");')
+            self.compiler.out.dedent()
+            self.compiler.out.line('} else {')
+            self.compiler.out.indent()
+            self.compiler.out.line('char* endptr;')
+            self.compiler.out.line(f'long val = strtol({expr}, &endptr, 10);')
+            self.compiler.out.line('if (*endptr != \'\\0\') {')
+            self.compiler.out.indent()
+            self.compiler.out.line(f'fprintf(stderr, "Error: Cannot convert \\"" "%s" "\\" to int\\n", {expr});')
+            self.compiler.out.dedent()
+            self.compiler.out.line('} else {')
+            self.compiler.out.indent()
+            self.compiler.out.line(f'{temp_var} = (int)val;')
+            self.compiler.out.dedent()
+            self.compiler.out.line('}  ')
+            self.compiler.out.dedent()
+            self.compiler.out.line('}  ')
+            self.compiler.out.dedent()
+            self.compiler.out.line('}')
             if var_name:
-                code += f'{self.compiler.indent()}#define {var_name} {temp_var}\n'
+                self.compiler.out.line(f'#define {var_name} {temp_var}')
                 self.compiler.variables[var_name] = "int"
         
         elif target_type == "float":
-            code += f'{self.compiler.indent()}float {temp_var} = 0.0;\n'
-            code += f'{self.compiler.indent()}{{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}if (strcmp({expr}, "") == 0) {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}fprintf(stderr, "Error: Cannot convert empty string to float\\n");\n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}} else {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}char* endptr;\n'
-            code += f'{self.compiler.indent()}double val = strtod({expr}, &endptr);\n'
-            code += f'{self.compiler.indent()}if (*endptr != \'\\0\') {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}fprintf(stderr, "Error: Cannot convert \\"" "%s" "\\" to float\\n", {expr});\n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}} else {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}{temp_var} = (float)val;\n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}  \n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}  \n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}\n'
+            self.compiler.out.line(f'float {temp_var} = 0.0;')
+            self.compiler.out.line('{')
+            self.compiler.out.indent()
+            self.compiler.out.line(f'if (strcmp({expr}, "") == 0) {{')
+            self.compiler.out.indent()
+            self.compiler.out.line('fprintf(stderr, "Error: Cannot convert empty string to float\\n");')
+            self.compiler.out.dedent()
+            self.compiler.out.line('} else {')
+            self.compiler.out.indent()
+            self.compiler.out.line('char* endptr;')
+            self.compiler.out.line(f'double val = strtod({expr}, &endptr);')
+            self.compiler.out.line('if (*endptr != \'\\0\') {')
+            self.compiler.out.indent()
+            self.compiler.out.line(f'fprintf(stderr, "Error: Cannot convert \\"" "%s" "\\" to float\\n", {expr});')
+            self.compiler.out.dedent()
+            self.compiler.out.line('} else {')
+            self.compiler.out.indent()
+            self.compiler.out.line(f'{temp_var} = (float)val;')
+            self.compiler.out.dedent()
+            self.compiler.out.line('}  ')
+            self.compiler.out.dedent()
+            self.compiler.out.line('}  ')
+            self.compiler.out.dedent()
+            self.compiler.out.line('}')
             if var_name:
-                code += f'{self.compiler.indent()}#define {var_name} {temp_var}\n'
+                self.compiler.out.line(f'#define {var_name} {temp_var}')
                 self.compiler.variables[var_name] = "float"
         
         elif target_type == "char":
-            code += f'{self.compiler.indent()}if (strlen({expr}) > 0) {{\n'
-            self.compiler.indent_level += 1
-            code += f'{self.compiler.indent()}{expr}[1] = \'\\0\';\n'
-            self.compiler.indent_level -= 1
-            code += f'{self.compiler.indent()}}}  \n'
+            self.compiler.out.line(f'if (strlen({expr}) > 0) {{')
+            self.compiler.out.indent()
+            self.compiler.out.line(f'{expr}[1] = \'\\0\';')
+            self.compiler.out.dedent()
+            self.compiler.out.line('}  ')
         
         elif target_type == "string":
             pass
-        
-        return code
 
     def compile_c_import(self, statement):
         self.compiler.c_imports.add(statement.header_name)
-        return ""
     
     def compile_c_call(self, statement):
         args = ", ".join([self.expr_codegen.compile_expr(arg) for arg in statement.arguments]) if statement.arguments else ""
-        return f'{self.compiler.indent()}{statement.func_name}({args});\n'
+        self.compiler.out.line(f'{statement.func_name}({args});')
     
     def compile_inf(self, statement):
-        code = f'{self.compiler.indent()}while (1) {{\n'
-        self.compiler.indent_level += 1
+        self.compiler.out.line('while (1) {')
+        self.compiler.out.indent()
         for stmt in statement.body:
-            code += self.compile_statement(stmt)
-        self.compiler.indent_level -= 1
-        code += f'{self.compiler.indent()}}}\n'
-        return code
+            self.compile_statement(stmt)
+        self.compiler.out.dedent()
+        self.compiler.out.line('}')
     
     def compile_for(self, statement):
-        iterable = statement.iterable
         counter = statement.counter
         condition = self.expr_codegen.compile_expr(statement.condition)
-        
-        code = ""
+        init = ""
         
         if isinstance(counter, VarDeclaration):
             counter_name = counter.name
-            code += self.compile_var_declaration(counter)
+            if counter.value is None or isinstance(counter.value, (InptCall, ConvertExpression)):
+                self.compile_var_declaration(counter)
+            else:
+                self.compiler.variables[counter_name] = counter.var_type
+                value = self.expr_codegen.compile_expr(counter.value, counter.var_type)
+                init = f"{C_TYPES.get(counter.var_type, 'int')} {counter_name} = {value}"
         else:
             counter_name = counter
         
-        code += f'{self.compiler.indent()}while ({condition}) {{\n'
-        self.compiler.indent_level += 1
+        if independent_iterations(statement):
+            self.compiler.out.line('KATO_CANONICAL_LOOP')
+        self.compiler.out.line(f'for ({init}; {condition}; ++{counter_name}) {{')
+        self.compiler.out.indent()
         
         for stmt in statement.body:
-            code += self.compile_statement(stmt)
-        
-        code += f'{self.compiler.indent()}{counter_name}++;\n'
-        
-        self.compiler.indent_level -= 1
-        code += f'{self.compiler.indent()}}}\n'
+            self.compile_statement(stmt)
         
-        return code
+        self.compiler.out.dedent()
+        self.compiler.out.line('}')
 
     def compile_struct_var_declaration(self, statement):
         struct_type = statement.struct_type
@@ -588,21 +570,20 @@ class StatementCodegen:
         
         self.compiler.variables[var_name] = struct_type
         
-        code = f'{self.compiler.indent()}{struct_type} {var_name} = {{'
+        self.compiler.out.start_line(f'{struct_type} {var_name} = {{')
         field_codes = []
         for field_name, field_value in field_values.items():
             field_codes.append(f'.{field_name} = {self.expr_codegen.compile_expr(field_value)}')
-        code += ', '.join(field_codes)
-        code += '};\n'
-        return code
+        self.compiler.out.write(', '.join(field_codes))
+        self.compiler.out.write('};\n')
     
     def compile_struct_field_assignment(self, statement):
         struct_name = statement.struct_name
         field_name = statement.field_name
         value = self.expr_codegen.compile_expr(statement.value)
-        return f'{self.compiler.indent()}{struct_name}.{field_name} = {value};\n'
+        self.compiler.out.line(f'{struct_name}.{field_name} = {value};')
 
     def compile_pointer_assignment(self, statement):
         pointer_name = statement.pointer
         value = self.expr_codegen.compile_expr(statement.value)
-        return f'{self.compiler.indent()}(*{pointer_name}) = {value};\n'
+        self.compiler.out.line(f'(*{pointer_name}) = {value};')
@@ -1,129 +1,300 @@
-from .codegen import ExpressionCodegen, StatementCodegen, FunctionCodegen
+from concurrent.futures import ProcessPoolExecutor
+
+from .analysis import ProgramAnalyzer
+from .preprocessor import stdlib_functions, stdlib_return_types
+from .type_inference import TypeInference
+from .codegen import Emitter, ExpressionCodegen, StatementCodegen, FunctionCodegen
+from .ir import IREmitter
+
+RUNTIME_HEADERS = ["stdio.h", "string.h", "stdlib.h", "time.h"]
+FEATURE_HEADERS = {
+    "print": ["stdio.h"],
+    "input": ["stdio.h", "string.h", "stdlib.h"],
+    "convert": ["stdio.h", "string.h", "stdlib.h"],
+    "random": ["stdlib.h", "time.h"],
+    "c_call": RUNTIME_HEADERS,
+    "canonical_loop": [],
+    "floor_div": [],
+}
+CANONICAL_LOOP_MACRO = """#if defined(__clang__)
+#define KATO_CANONICAL_LOOP _Pragma("clang loop vectorize(assume_safety)")
+#elif defined(__GNUC__)
+#define KATO_CANONICAL_LOOP _Pragma("GCC ivdep")
+#elif defined(_MSC_VER)
+#define KATO_CANONICAL_LOOP __pragma(loop(ivdep))
+#else
+#define KATO_CANONICAL_LOOP
+#endif
+"""
+FLOOR_DIV_HELPERS = """int kato_floor_div(int a, int b) {
+    int q = a / b;
+    return q - ((a % b != 0) & ((a ^ b) < 0));
+}
+
+double kato_floor_divf(double a, double b) {
+    double q = a / b;
+    if (!(q > -4503599627370496.0 && q < 4503599627370496.0)) return q;
+    double t = (double)(long long)q;
+    return t > q ? t - 1.0 : t;
+}
+"""
+
+worker_compiler = None
+
+
+def init_worker(function_return_types, struct_definitions, stdlib_imports, uses_random):
+    global worker_compiler
+    worker_compiler = CCompiler(None, stdlib_imports=stdlib_imports)
+    worker_compiler.function_return_types = function_return_types
+    worker_compiler.struct_definitions = struct_definitions
+    worker_compiler.uses_random = uses_random
+
+
+def compile_function_batch(functions, ir_functions):
+    worker_compiler.ir_functions = ir_functions
+    return [worker_compiler.generate_function(function) for function in functions]
 
 
 class CCompiler:
-    def __init__(self, ast, stdlib_imports=None, c_imports=None):
+    def __init__(self, ast, stdlib_imports=None, c_imports=None, function_cache=None, jobs=1, function_summaries=None, analysis=None, ir_functions=None):
         self.ast = ast
-        self.indent_level = 0
+        self.out = Emitter()
         self.variables = {}
+        self.return_type = "void"
         self.stdlib_imports = stdlib_imports or set()
         self.c_imports = c_imports or set()
         self.uses_conversion = False
         self.uses_find = False
+        self.uses_random = False
         self.function_return_types = {}
         self.struct_definitions = {}
+        self.function_cache = function_cache
+        self.jobs = jobs
+        self.function_summaries = function_summaries or {}
+        self.analysis = analysis
+        self.ir_functions = ir_functions or {}
         
         self.expr_codegen = ExpressionCodegen(self)
         self.stmt_codegen = StatementCodegen(self, self.expr_codegen)
         self.func_codegen = FunctionCodegen(self, self.stmt_codegen)
-    
-    def indent(self):
-        return "    " * self.indent_level
+        self.ir_emitter = IREmitter(self)
     
     def get_function_return_type(self, func_name):
         return self.function_return_types.get(func_name, "int")
     
-    def compile(self):
-        from parser.ast import FindCall
+    def runtime_headers(self, analysis):
+        headers = set()
+        for feature in analysis.features:
+            headers.update(FEATURE_HEADERS[feature])
+        
+        if "filesystem" in analysis.used_stdlib:
+            from .std.filesystem import FILESYSTEM_HEADERS
+            headers.update(FILESYSTEM_HEADERS)
         
+        if "os" in analysis.used_stdlib:
+            from .std.os import OS_HEADERS
+            headers.update(OS_HEADERS)
+        
+        return headers
+    
+    def generate_function(self, function):
+        out = self.out
+        uses_find = self.uses_find
+        uses_conversion = self.uses_conversion
+        c_imports = self.c_imports
+        self.out = Emitter()
+        self.uses_find = False
+        self.uses_conversion = False
+        self.c_imports = set()
+        
+        self.translate_function(function)
+        
+        entry = {
+            "code": self.out.getvalue(),
+            "uses_find": self.uses_find,
+            "uses_conversion": self.uses_conversion,
+            "c_imports": sorted(self.c_imports),
+        }
+        self.out = out
+        self.uses_find = uses_find
+        self.uses_conversion = uses_conversion
+        self.c_imports = c_imports
+        return entry
+    
+    def emit_function(self, entry):
+        self.uses_find = self.uses_find or entry["uses_find"]
+        self.uses_conversion = self.uses_conversion or entry["uses_conversion"]
+        self.c_imports.update(entry["c_imports"])
+        self.out.write(entry["code"])
+    
+    def translate_function(self, function):
+        ir = self.ir_functions.get(function.name)
+        if ir is None:
+            self.func_codegen.compile_function(function)
+        else:
+            self.ir_emitter.emit_function(function, ir)
+    
+    def compile_function(self, function):
+        if self.function_cache is None:
+            self.translate_function(function)
+            return
+        
+        key = self.function_cache.make_key(function, self)
+        entry = self.function_cache.lookup(key)
+        
+        if entry is None:
+            entry = self.generate_function(function)
+            self.function_cache.store(key, entry)
+        
+        self.emit_function(entry)
+    
+    def compile_functions_parallel(self):
+        entries = [None] * len(self.ast.functions)
+        keys = [None] * len(self.ast.functions)
+        pending = []
+        
+        for index, function in enumerate(self.ast.functions):
+            if self.function_cache is not None:
+                keys[index] = self.function_cache.make_key(function, self)
+                entries[index] = self.function_cache.lookup(keys[index])
+            if entries[index] is None:
+                pending.append(index)
+        
+        if pending:
+            batch_size = max(1, -(-len(pending) // (self.jobs * 4)))
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            tables = (self.function_return_types, self.struct_definitions, self.stdlib_imports, self.uses_random)
+            
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=init_worker, initargs=tables) as executor:
+                functions = [[self.ast.functions[i] for i in batch] for batch in batches]
+                ir_functions = [{function.name: self.ir_functions[function.name] for function in batch_functions if function.name in self.ir_functions}
+                                for batch_functions in functions]
+                results = executor.map(compile_function_batch, functions, ir_functions)
+                for batch, batch_entries in zip(batches, results):
+                    for index, entry in zip(batch, batch_entries):
+                        entries[index] = entry
+                        if self.function_cache is not None:
+                            self.function_cache.store(keys[index], entry)
+        
+        for entry in entries:
+            self.emit_function(entry)
+            self.out.write("\n")
+            self.out.flush()
+    
+    def compile(self, stream=None):
         if hasattr(self.ast, 'c_imports'):
             for c_import in self.ast.c_imports:
                 self.c_imports.add(c_import.header_name)
         
-        def check_for_find(obj):
-            if isinstance(obj, FindCall):
-                self.uses_find = True
-            elif hasattr(obj, '__dict__'):
-                for value in obj.__dict__.values():
-                    if isinstance(value, list):
-                        for item in value:
-                            check_for_find(item)
-                    else:
-                        check_for_find(value)
-        
-        for function in self.ast.functions:
-            check_for_find(function)
+        analysis = self.analysis
+        if analysis is None:
+            analysis = ProgramAnalyzer(stdlib_functions(self.stdlib_imports)).analyze(self.ast)
+        self.uses_find = self.uses_find or analysis.uses_find
+        self.uses_random = "random" in analysis.features
+        headers = self.runtime_headers(analysis)
         
         if hasattr(self.ast, 'structs'):
             for struct in self.ast.structs:
                 self.struct_definitions[struct.name] = struct.fields
         
+        inference = TypeInference(self.ast, self.struct_definitions, stdlib_return_types(self.stdlib_imports), self.function_summaries, analysis)
+        summaries = inference.run()
+        
         for function in self.ast.functions:
+            summary = summaries[function.name]
             if function.params:
-                function.param_types = self.func_codegen.infer_param_types(function, self.ast)
-            function.return_type = self.func_codegen.infer_return_type(function)
+                function.param_types = summary.final_param_types()
+            function.return_type = summary.final_return_type()
             self.function_return_types[function.name] = function.return_type
         
-        c_code = "/* WARNING: This file is auto-generated by Kato compiler.\n"
-        c_code += " * Do not modify this file manually.\n"
-        c_code += " * Any changes will be overwritten on next compilation.\n"
-        c_code += " */\n\n"
-        c_code += "#include <stdio.h>\n"
-        c_code += "#include <string.h>\n"
-        c_code += "#include <stdlib.h>\n"
-        c_code += "#include <time.h>\n"
-        
-        if "os" in self.stdlib_imports:
-            c_code += "#include <windows.h>\n"
-            c_code += "#include <tlhelp32.h>\n"
-            c_code += "#include <psapi.h>\n"
-            c_code += "#include <shellapi.h>\n"
-            c_code += "#include <tlhelp32.h>\n"
+        self.out = Emitter(stream)
+        out = self.out
+        
+        out.write("/* WARNING: This file is auto-generated by Kato compiler.\n")
+        out.write(" * Do not modify this file manually.\n")
+        out.write(" * Any changes will be overwritten on next compilation.\n")
+        out.write(" */\n\n")
+        for header in RUNTIME_HEADERS:
+            if header in headers:
+                out.write(f"#include <{header}>\n")
+        
+        if "os" in analysis.used_stdlib:
+            out.write("#include <windows.h>\n")
+            out.write("#include <tlhelp32.h>\n")
+            out.write("#include <psapi.h>\n")
+            out.write("#include <shellapi.h>\n")
+            out.write("#include <tlhelp32.h>\n")
         
         for c_header in self.c_imports:
-            c_code += f"#include <{c_header}>\n"
+            out.write(f"#include <{c_header}>\n")
+        
+        out.write("\n")
         
-        c_code += "\n"
+        if "canonical_loop" in analysis.features:
+            out.write(CANONICAL_LOOP_MACRO + "\n")
         
         if hasattr(self.ast, 'structs'):
             for struct in self.ast.structs:
-                c_code += f"typedef struct {{\n"
+                out.write(f"typedef struct {{\n")
                 for field_name, field_type in struct.fields.items():
                     c_type = {"int": "int", "float": "float", "char": "char", "string": "char*"}[field_type]
-                    c_code += f"    {c_type} {field_name};\n"
-                c_code += f"}} {struct.name};\n\n"
+                    out.write(f"    {c_type} {field_name};\n")
+                out.write(f"}} {struct.name};\n\n")
+        
+        if "floor_div" in analysis.features:
+            out.write(FLOOR_DIV_HELPERS + "\n")
         
         if self.uses_find:
-            c_code += "int kato_find(void* target, void* pattern);\n\n"
+            out.write("int kato_find(void* target, void* pattern);\n\n")
         
-        if "filesystem" in self.stdlib_imports:
+        if "filesystem" in analysis.used_stdlib:
             from .std.filesystem import get_filesystem_functions
-            c_code += get_filesystem_functions() + "\n"
+            out.write(get_filesystem_functions(analysis.used_stdlib_functions) + "\n")
         
-        if "os" in self.stdlib_imports:
+        if "os" in analysis.used_stdlib:
             from .std.os import get_os_functions
-            c_code += get_os_functions() + "\n"
+            out.write(get_os_functions(analysis.used_stdlib_functions) + "\n")
         
         for function in self.ast.functions:
             if function.name != "main":
-                c_code += self.func_codegen.get_function_signature(function) + ";\n"
+                out.write(self.func_codegen.get_function_signature(function) + ";\n")
         
-        c_code += "\n"
+        out.write("\n")
         
-        for function in self.ast.functions:
-            c_code += self.func_codegen.compile_function(function)
-            c_code += "\n"
+        if self.jobs > 1 and len(self.ast.functions) > 1:
+            self.compile_functions_parallel()
+        else:
+            for function in self.ast.functions:
+                self.compile_function(function)
+                out.write("\n")
+                out.flush()
+        
+        if self.function_cache is not None:
+            self.function_cache.save()
         
         if self.uses_find:
-            c_code += "int kato_find(void* target, void* pattern) {\n"
-            c_code += "    char* t = (char*)target;\n"
-            c_code += "    char* p = (char*)pattern;\n"
-            c_code += "    if (!t || !p) return -1;\n"
-            c_code += "    int t_len = 0, p_len = 0;\n"
-            c_code += "    while (t[t_len]) t_len++;\n"
-            c_code += "    while (p[p_len]) p_len++;\n"
-            c_code += "    if (p_len == 0) return 0;\n"
-            c_code += "    for (int i = 0; i <= t_len - p_len; i++) {\n"
-            c_code += "        int match = 1;\n"
-            c_code += "        for (int j = 0; j < p_len; j++) {\n"
-            c_code += "            if (t[i + j] != p[j]) {\n"
-            c_code += "                match = 0;\n"
-            c_code += "                break;\n"
-            c_code += "            }\n"
-            c_code += "        }\n"
-            c_code += "        if (match) return i;\n"
-            c_code += "    }\n"
-            c_code += "    return -1;\n"
-            c_code += "}\n\n"
-        
-        return c_code
+            out.write("int kato_find(void* target, void* pattern) {\n")
+            out.write("    char* t = (char*)target;\n")
+            out.write("    char* p = (char*)pattern;\n")
+            out.write("    if (!t || !p) return -1;\n")
+            out.write("    int t_len = 0, p_len = 0;\n")
+            out.write("    while (t[t_len]) t_len++;\n")
+            out.write("    while (p[p_len]) p_len++;\n")
+            out.write("    if (p_len == 0) return 0;\n")
+            out.write("    for (int i = 0; i <= t_len - p_len; i++) {\n")
+            out.write("        int match = 1;\n")
+            out.write("        for (int j = 0; j < p_len; j++) {\n")
+            out.write("            if (t[i + j] != p[j]) {\n")
+            out.write("                match = 0;\n")
+            out.write("                break;\n")
+            out.write("            }\n")
+            out.write("        }\n")
+            out.write("        if (match) return i;\n")
+            out.write("    }\n")
+            out.write("    return -1;\n")
+            out.write("}\n\n")
+        
+        if stream is not None:
+            out.flush()
+            return None
+        return out.getvalue()
@@ -0,0 +1,9 @@
+from .nodes import IRFunction, Block
+from .lowering import Lowering, LoweringError
+from .emitter import IREmitter
+from .passes import CopyPropagation, StrengthReduction, AlgebraicSimplifier, CommonSubexpressionElimination
+
+__all__ = [
+    'IRFunction', 'Block', 'Lowering', 'LoweringError', 'IREmitter',
+    'CopyPropagation', 'StrengthReduction', 'AlgebraicSimplifier', 'CommonSubexpressionElimination'
+]
@@ -0,0 +1,449 @@
+from compiler.analysis import PURE
+from compiler.codegen import Emitter
+from .nodes import (
+    C_TYPES, Constant, Undefined, Symbol, Instruction, Copy, Binary, Call, CCall, Find, Load, Store,
+    Address, Deref, PointerStore, FieldLoad, FieldStore, ArrayDecl, ScalarDecl, StructDecl, Print, Input,
+    Jump, Return, Block,
+    IfRegion, LoopRegion, SwitchRegion
+)
+from .ssa import ExpressionTrees, Allocation
+
+INPUT_FORMATS = {"int": "%d", "float": "%f", "char": " %c"}
+STEP_OPERATORS = {"+": "++", "-": "--"}
+
+
+def escape(text):
+    return text.replace('\\', '\\\\').replace('\n', '\\n').replace('\t', '\\t').replace('\r', '\\r').replace('"', '\\"')
+
+
+class IREmitter:
+    def __init__(self, compiler):
+        self.compiler = compiler
+        self.statement_handlers = {
+            Copy: self.emit_copy,
+            Print: self.emit_print,
+            Input: self.emit_input,
+            Store: self.emit_store,
+            PointerStore: self.emit_pointer_store,
+            FieldStore: self.emit_field_store,
+            ArrayDecl: self.emit_array_declaration,
+            ScalarDecl: self.emit_scalar_declaration,
+            StructDecl: self.emit_struct_declaration,
+        }
+        self.expression_handlers = {
+            Binary: self.binary_text,
+            Call: self.call_text,
+            CCall: self.call_text,
+            Find: self.find_text,
+            Load: self.load_text,
+            Address: self.address_text,
+            Deref: self.deref_text,
+            FieldLoad: self.field_load_text,
+        }
+    
+    def emit_function(self, function, ir):
+        self.ir = ir
+        self.trees = ExpressionTrees(ir)
+        self.allocation = Allocation(ir, self.trees)
+        self.live_blocks = set(ir.blocks)
+        self.edge_copies = {}
+        self.labels = set()
+        
+        while True:
+            labels = set(self.labels)
+            self.out = Emitter()
+            self.out.indent()
+            self.loops = []
+            self.breaks = []
+            self.emit_body(ir.body, None, True)
+            if self.labels == labels:
+                break
+        
+        out = self.compiler.out
+        out.line(f"{self.compiler.func_codegen.get_function_signature(function)} {{")
+        out.indent()
+        for name, type_name in self.allocation.declarations:
+            out.line(f"{C_TYPES[type_name]} {name};")
+        if ir.name == "main" and self.compiler.uses_random:
+            out.line("srand(time(NULL));")
+        out.dedent()
+        out.write(self.out.getvalue())
+        out.line("}")
+        self.compiler.c_imports.update(ir.c_imports)
+    
+    def entry(self, item):
+        if isinstance(item, Block):
+            return item
+        if isinstance(item, LoopRegion):
+            return item.init or item.header
+        return None
+    
+    def emit_body(self, items, follow, final=False):
+        for index, item in enumerate(items):
+            last = index + 1 == len(items)
+            next_entry = follow if last else self.entry(items[index + 1])
+            if isinstance(item, Block):
+                if item in self.live_blocks:
+                    self.emit_block(item, next_entry, final and last)
+            elif isinstance(item, IfRegion):
+                self.emit_if(item)
+            elif isinstance(item, LoopRegion):
+                self.emit_loop(item)
+            elif isinstance(item, SwitchRegion):
+                self.emit_switch(item)
+    
+    def emit_block(self, block, follow, final=False):
+        if block in self.labels:
+            self.out.line(f"{self.label(block)}: ;")
+        for statement in self.trees.statements(block):
+            self.emit_statement(statement)
+        
+        terminator = block.terminator
+        if isinstance(terminator, Jump):
+            self.edge(block, terminator.target, follow, terminator.line)
+        elif isinstance(terminator, Return):
+            self.emit_return(terminator, final)
+    
+    def label(self, block):
+        return f"__bb{block.id}"
+    
+    def copies(self, pred, block):
+        key = (pred, block)
+        if key not in self.edge_copies:
+            self.edge_copies[key] = self.allocation.copies(pred, block)
+        return self.edge_copies[key]
+    
+    def write_copies(self, pred, block):
+        for target, source in self.copies(pred, block):
+            self.out.line(f"{target} = {self.source_text(source)};")
+    
+    def source_text(self, source):
+        return source if isinstance(source, str) else self.expr(source)
+    
+    def edge(self, pred, block, follow, line=""):
+        self.write_copies(pred, block)
+        if block is follow:
+            return
+        comment = f" // {line}" if line else ""
+        if self.loops and block is self.loops[-1]:
+            self.out.line(f"continue;{comment}")
+        elif self.breaks and block is self.breaks[-1]:
+            self.out.line(f"break;{comment}")
+        else:
+            self.labels.add(block)
+            self.out.line(f"goto {self.label(block)};{comment}")
+    
+    def quiet(self, pred, block):
+        return block not in self.labels and not self.trees.statements(block) and not self.copies(pred, block)
+    
+    def emit_if(self, region, keyword="if"):
+        branch = region.head.terminator
+        self.out.line(f"{keyword} ({self.expr(branch.operands[0])}) {{")
+        self.emit_arm(region.head, branch.if_true, region.then_body, region.join)
+        
+        else_body = region.else_body
+        if else_body is None:
+            if self.copies(region.head, region.join):
+                self.out.line("} else {")
+                self.out.indent()
+                self.write_copies(region.head, region.join)
+                self.out.dedent()
+        elif len(else_body) == 2 and isinstance(else_body[1], IfRegion) and self.quiet(region.head, branch.if_false):
+            self.emit_if(else_body[1], "} else if")
+            return
+        else:
+            self.out.line("} else {")
+            self.emit_arm(region.head, branch.if_false, else_body, region.join)
+        self.out.line("}")
+    
+    def emit_arm(self, head, entry, body, join):
+        self.out.indent()
+        self.write_copies(head, entry)
+        self.emit_body(body, join)
+        self.out.dedent()
+    
+    def emit_loop(self, region):
+        header = region.header
+        if region.kind == "inf":
+            self.out.line("while (1) {")
+            self.enter_loop(header, region.exit)
+            self.emit_body(region.body, header)
+            self.leave_loop()
+            return
+        
+        test = region.condition[-1] if region.condition else header
+        branch = test.terminator
+        body_entry = branch.if_true
+        latch = region.latch if region.latch in self.live_blocks else None
+        condition = self.expr(branch.operands[0])
+        simple_header = test is header and header not in self.labels and not self.trees.statements(header) and not self.copies(header, region.exit)
+        
+        if simple_header and latch is not None and self.counter_step(region) is not None:
+            counter = self.counter_step(region)
+            increment = "".join(f", {self.assignment_text(statement)}" for statement in self.trees.statements(latch)[1:])
+            init = ""
+            if region.init is not None:
+                init = self.emit_init(region.init, header, counter)
+            if region.canonical:
+                self.out.line("KATO_CANONICAL_LOOP")
+            self.out.line(f"for ({init}; {condition}; ++{counter}{increment}) {{")
+            self.enter_loop(latch, region.exit)
+            self.write_copies(header, body_entry)
+            self.emit_body(region.body, latch)
+            self.leave_loop()
+            return
+        
+        if region.init is not None:
+            self.emit_block(region.init, header)
+        if simple_header:
+            self.out.line(f"while ({condition}) {{")
+            self.enter_loop(header if latch is None else None, region.exit)
+        else:
+            self.out.line("while (1) {")
+            self.enter_loop(header if latch is None else None, region.exit)
+            if region.condition:
+                self.emit_body(region.condition[:-1], test)
+            if test in self.labels:
+                self.out.line(f"{self.label(test)}: ;")
+            for statement in self.trees.statements(test):
+                self.emit_statement(statement)
+            self.out.line(f"if (!{condition}) {{")
+            self.out.indent()
+            self.write_copies(test, region.exit)
+            self.out.line("break;")
+            self.out.dedent()
+            self.out.line("}")
+        self.write_copies(test, body_entry)
+        self.emit_body(region.body, latch or header)
+        if latch is not None:
+            self.emit_block(latch, header)
+        self.leave_loop()
+    
+    def enter_loop(self, continue_target, exit_block):
+        self.out.indent()
+        self.loops.append(continue_target)
+        self.breaks.append(exit_block)
+    
+    def leave_loop(self):
+        self.loops.pop()
+        self.breaks.pop()
+        self.out.dedent()
+        self.out.line("}")
+    
+    def counter_step(self, region):
+        latch = region.latch
+        statements = self.trees.statements(latch)
+        if latch in self.labels or not statements or self.copies(latch, region.header):
+            return None
+        if any(statement.effect != PURE or statement.type is None for statement in statements[1:]):
+            return None
+        step = self.step(statements[0])
+        return step[0] if step is not None and step[1] == "+" else None
+    
+    def step(self, statement):
+        if statement not in self.allocation.parent:
+            return None
+        value = statement
+        if isinstance(statement, Copy) and statement.operands[0] in self.trees.deferred:
+            value = statement.operands[0]
+        if not isinstance(value, Binary) or value.operator not in STEP_OPERATORS:
+            return None
+        counter, amount = value.operands
+        if not isinstance(amount, Constant) or amount.value != 1 or counter not in self.allocation.parent:
+            return None
+        name = self.allocation.name(statement)
+        return (name, value.operator) if self.allocation.name(counter) == name else None
+    
+    def emit_init(self, init, header, counter):
+        if init in self.labels:
+            self.emit_block(init, header)
+            return ""
+        statements = self.trees.statements(init)
+        copies = self.copies(init, header)
+        folded = ""
+        index = next((index for index, (target, _) in enumerate(copies) if target == counter), None)
+        if index is not None and self.source_text(copies[index][1]) not in [target for target, _ in copies[index + 1:]]:
+            folded = f"{counter} = {self.source_text(copies[index][1])}"
+            copies = copies[:index] + copies[index + 1:]
+        elif not copies and statements and statements[-1] in self.allocation.parent and self.allocation.name(statements[-1]) == counter:
+            folded = self.assignment_text(statements[-1])
+            statements = statements[:-1]
+        for statement in statements:
+            self.emit_statement(statement)
+        for target, source in copies:
+            self.out.line(f"{target} = {self.source_text(source)};")
+        return folded
+    
+    def emit_switch(self, region):
+        switch = region.head.terminator
+        self.out.line(f"switch ({self.expr(switch.operands[0])}) {{")
+        self.out.indent()
+        self.breaks.append(region.join)
+        
+        for constant, body in region.cases:
+            self.out.line(f"case {self.expr(constant)}:")
+            self.emit_arm(region.head, body[0], body, None)
+        if region.default_body is not None:
+            self.out.line("default:")
+            self.emit_arm(region.head, switch.default, region.default_body, None)
+        elif self.copies(region.head, region.join):
+            self.out.line("default:")
+            self.out.indent()
+            self.write_copies(region.head, region.join)
+            self.out.line("break;")
+            self.out.dedent()
+        
+        self.breaks.pop()
+        self.out.dedent()
+        self.out.line("}")
+    
+    def emit_return(self, terminator, final):
+        comment = f" // {terminator.line}" if terminator.line else ""
+        if not terminator.operands:
+            if self.ir.return_type != "void":
+                self.out.line(f"return 0;{comment}")
+            elif not final or comment:
+                self.out.line(f"return;{comment}")
+            return
+        
+        value = terminator.operands[0]
+        if isinstance(value, Constant) and value.type == "double" and self.ir.return_type != "float":
+            self.out.line(f"return (int){value.value};{comment}")
+        else:
+            self.out.line(f"return {self.expr(value)};{comment}")
+    
+    def emit_statement(self, statement):
+        handler = self.statement_handlers.get(type(statement))
+        if handler is not None:
+            handler(statement)
+        else:
+            self.emit_assignment(statement)
+    
+    def line(self, statement, text):
+        comment = f" // {statement.line}" if statement.line else ""
+        self.out.line(f"{text};{comment}")
+    
+    def assignment_text(self, statement):
+        if isinstance(statement, Copy):
+            value = self.expr(statement.operands[0])
+        else:
+            value = self.expression_handlers[type(statement)](statement)
+        if statement in self.allocation.parent:
+            return f"{self.allocation.name(statement)} = {value}"
+        return value
+    
+    def emit_copy(self, statement):
+        source = statement.operands[0]
+        if source in self.allocation.parent and self.allocation.name(source) == self.allocation.name(statement):
+            return
+        self.emit_assignment(statement)
+    
+    def emit_assignment(self, statement):
+        step = self.step(statement)
+        if step is not None:
+            self.line(statement, f"{step[0]}{STEP_OPERATORS[step[1]]}")
+        else:
+            self.line(statement, self.assignment_text(statement))
+    
+    def emit_print(self, statement):
+        format_string = escape(statement.format)
+        if statement.operands:
+            arguments = ", ".join(self.expr(argument) for argument in statement.operands)
+            self.line(statement, f'printf("{format_string}", {arguments})')
+        else:
+            self.line(statement, f'printf("{format_string}")')
+    
+    def emit_input(self, statement):
+        name = self.allocation.name(statement)
+        self.line(statement, f"printf({self.expr(statement.operands[0])})")
+        if statement.type in INPUT_FORMATS:
+            self.out.line(f'scanf("{INPUT_FORMATS[statement.type]}", &{name});')
+        elif statement.type == "string":
+            self.out.line(f'{name} = (char*)malloc(4096);')
+            self.out.line(f'fgets({name}, 4096, stdin);')
+            self.out.line(f'{name}[strcspn({name}, "\\n")] = 0;')
+    
+    def emit_store(self, statement):
+        operands = [self.expr(operand) for operand in statement.operands]
+        if len(operands) == 2:
+            self.line(statement, f"{operands[0]} = {operands[1]}")
+        else:
+            self.line(statement, f"{operands[0]}[{operands[1]}] = {operands[2]}")
+    
+    def emit_pointer_store(self, statement):
+        pointer, value = statement.operands
+        self.line(statement, f"(*{self.expr(pointer)}) = {self.expr(value)}")
+    
+    def emit_field_store(self, statement):
+        struct, value = statement.operands
+        self.line(statement, f"{struct.name}.{statement.field} = {self.expr(value)}")
+    
+    def emit_array_declaration(self, statement):
+        array = statement.operands[0]
+        elements = ", ".join(self.expr(element) for element in statement.operands[1:])
+        c_type = C_TYPES.get(array.type, "int")
+        self.line(statement, f"{c_type} {array.name}[{len(statement.operands) - 1}] = {{{elements}}}")
+    
+    def emit_scalar_declaration(self, statement):
+        symbol, value = statement.operands
+        self.line(statement, f"{C_TYPES[symbol.type]} {symbol.name} = {self.expr(value)}")
+    
+    def emit_struct_declaration(self, statement):
+        struct = statement.operands[0]
+        fields = ", ".join(f".{field} = {self.expr(value)}" for field, value in zip(statement.fields, statement.operands[1:]))
+        self.line(statement, f"{struct.type} {struct.name} = {{{fields}}}")
+    
+    def expr(self, value):
+        if isinstance(value, Instruction):
+            if value in self.trees.deferred:
+                return self.expression_handlers[type(value)](value)
+            return self.allocation.name(value)
+        if isinstance(value, Constant):
+            return self.literal(value)
+        if isinstance(value, Symbol):
+            return value.name
+        if isinstance(value, Undefined):
+            return "0"
+        raise ValueError(f"Cannot emit value {value!r}")
+    
+    def literal(self, constant):
+        if constant.type == "string":
+            return f'"{escape(constant.value)}"'
+        if constant.type == "char":
+            return f"'{constant.value[0]}'" if len(constant.value) != 1 else f"'{constant.value}'"
+        return str(constant.value)
+    
+    def binary_text(self, instruction):
+        left, right = instruction.operands
+        if instruction.operator == "//":
+            helper = "kato_floor_divf" if instruction.type in ("float", "double") else "kato_floor_div"
+            return f"{helper}({self.expr(left)}, {self.expr(right)})"
+        return f"({self.expr(left)} {instruction.operator} {self.expr(right)})"
+    
+    def call_text(self, instruction):
+        arguments = [self.expr(argument) for argument in instruction.operands]
+        if instruction.name == "random" and instruction.type is not None:
+            if len(arguments) != 2:
+                return "0"
+            return f"({arguments[0]} + rand() % (({arguments[1]}) - ({arguments[0]}) + 1))"
+        return f"{instruction.name}({', '.join(arguments)})"
+    
+    def find_text(self, instruction):
+        self.compiler.uses_find = True
+        target, pattern = instruction.operands
+        return f"kato_find({self.expr(target)}, {self.expr(pattern)})"
+    
+    def load_text(self, instruction):
+        if len(instruction.operands) == 1:
+            return self.expr(instruction.operands[0])
+        base, index = instruction.operands
+        return f"{self.expr(base)}[{self.expr(index)}]"
+    
+    def address_text(self, instruction):
+        return f"&{instruction.operands[0].name}"
+    
+    def deref_text(self, instruction):
+        return f"(*{self.expr(instruction.operands[0])})"
+    
+    def field_load_text(self, instruction):
+        return f"{instruction.operands[0].name}.{instruction.field}"
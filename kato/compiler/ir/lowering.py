@@ -0,0 +1,693 @@
+import re
+
+from parser.ast import (
+    PrintStatement, ReturnStatement, VarDeclaration, CallStatement, IfStatement, Assignment,
+    WhileStatement, IncrementStatement, DecrementStatement, ArrayDeclaration, ArrayAssignment,
+    SwitchStatement, CImportStatement, CCallStatement, BreakStatement, ContinueStatement,
+    InfStatement, StopStatement, ForStatement, StructVarDeclaration, StructFieldAssignment,
+    StringLiteral, NumberLiteral, FloatLiteral, CharLiteral, Identifier, BinaryOp, InptCall,
+    ArrayAccess, FunctionCall, FindCall, StructAccess, PointerAssignment, AddressOf, Dereference
+)
+from compiler.analysis import AddressScanner, independent_iterations
+from .nodes import (
+    Constant, Undefined, Symbol, Variable, Param, Phi, Copy, Binary, Call, CCall, Find, Load, Store,
+    Address, Deref, PointerStore, FieldLoad, FieldStore, ArrayDecl, ScalarDecl, StructDecl, Print, Input,
+    Jump, Branch, Switch, Return,
+    IfRegion, LoopRegion, SwitchRegion, IRFunction
+)
+from .ssa import remove_unreachable_blocks, remove_dead_phis
+
+INTERPOLATION = re.compile(r'\*([\w\.]+)\*')
+FORMATS = {"int": "%d", "float": "%f", "char": "%c", "string": "%s"}
+DECLARABLE = set(FORMATS) | {name + "*" for name in FORMATS}
+LITERAL_TYPES = {NumberLiteral: "int", FloatLiteral: "double", CharLiteral: "char", StringLiteral: "string"}
+SHORT_CIRCUIT = ("&&", "||")
+NEGATED = {"==": "!=", "!=": "==", "<": ">=", ">": "<=", "<=": ">", ">=": "<"}
+INT_RESULT_CALLS = ("file_exists", "file_write", "file_append", "file_delete", "random")
+
+
+class LoweringError(Exception):
+    pass
+
+
+def source_line(node):
+    try:
+        return node.source_line or ""
+    except AttributeError:
+        return ""
+
+
+class Lowering:
+    def __init__(self, return_types, struct_definitions=None, external_return_types=None):
+        self.return_types = return_types
+        self.struct_definitions = struct_definitions or {}
+        self.external_return_types = external_return_types or {}
+        self.statement_handlers = {
+            PrintStatement: self.lower_print,
+            ReturnStatement: self.lower_return,
+            VarDeclaration: self.lower_var_declaration,
+            CallStatement: self.lower_call,
+            IfStatement: self.lower_if_statement,
+            Assignment: self.lower_assignment,
+            WhileStatement: self.lower_while,
+            IncrementStatement: self.lower_step,
+            DecrementStatement: self.lower_step,
+            ArrayDeclaration: self.lower_array_declaration,
+            ArrayAssignment: self.lower_array_assignment,
+            SwitchStatement: self.lower_switch,
+            CImportStatement: self.lower_c_import,
+            CCallStatement: self.lower_c_call,
+            BreakStatement: self.lower_break,
+            StopStatement: self.lower_break,
+            ContinueStatement: self.lower_continue,
+            InfStatement: self.lower_inf,
+            ForStatement: self.lower_for,
+            StructVarDeclaration: self.lower_struct_declaration,
+            StructFieldAssignment: self.lower_field_assignment,
+            PointerAssignment: self.lower_pointer_assignment,
+        }
+        self.expression_handlers = {
+            StringLiteral: self.lower_literal,
+            NumberLiteral: self.lower_literal,
+            FloatLiteral: self.lower_literal,
+            CharLiteral: self.lower_literal,
+            Identifier: self.lower_identifier,
+            ArrayAccess: self.lower_array_access,
+            BinaryOp: self.lower_binary_op,
+            FunctionCall: self.lower_function_call,
+            FindCall: self.lower_find,
+            StructAccess: self.lower_struct_access,
+            AddressOf: self.lower_address_of,
+            Dereference: self.lower_dereference,
+        }
+    
+    def lower(self, function, param_types, return_type):
+        self.function = IRFunction(function.name, function.params, param_types, return_type)
+        self.scopes = [{}]
+        self.declared = {}
+        self.definitions = {}
+        self.sealed = set()
+        self.incomplete = {}
+        self.loops = []
+        self.breaks = []
+        self.body = []
+        
+        scanner = AddressScanner()
+        scanner.visit_value(function.body)
+        self.addressed = scanner.names
+        
+        entry = self.function.new_block()
+        self.function.entry = entry
+        self.seal(entry)
+        self.start(entry)
+        
+        for param in function.params:
+            param_type = param_types.get(param, "int")
+            if param in self.addressed:
+                self.declare(param, Symbol(param, param_type, "scalar"), param_type)
+                continue
+            variable = Variable(param, param_type)
+            self.declare(param, variable, param_type)
+            self.write(variable, entry, self.emit(Param(variable)))
+        
+        self.lower_statements(function.body)
+        if self.block is not None:
+            self.terminate(Return())
+        
+        self.function.body = self.body
+        self.finish()
+        self.function.passes.append("lower")
+        return self.function
+    
+    def start(self, block):
+        self.block = block
+        self.body.append(block)
+    
+    def emit(self, instruction, line=""):
+        instruction.block = self.block
+        instruction.line = line
+        self.function.number(instruction)
+        self.block.instructions.append(instruction)
+        return instruction
+    
+    def terminate(self, terminator, line=""):
+        terminator.block = self.block
+        terminator.line = line
+        self.block.terminator = terminator
+        for successor in terminator.successors():
+            successor.preds.append(self.block)
+        self.block = None
+    
+    def jump(self, target):
+        if self.block is not None:
+            self.terminate(Jump(target))
+    
+    def nested(self, entry, lower, follow):
+        body, block = self.body, self.block
+        self.body = []
+        self.scopes.append({})
+        self.start(entry)
+        lower()
+        self.jump(follow)
+        nested_body = self.body
+        self.scopes.pop()
+        self.body, self.block = body, block
+        return nested_body
+    
+    def continue_at(self, block):
+        self.seal(block)
+        if block.preds:
+            self.start(block)
+        else:
+            self.block = None
+    
+    def lower_statements(self, statements):
+        for statement in statements:
+            if self.block is None:
+                return
+            handler = self.statement_handlers.get(type(statement))
+            if handler is None:
+                raise LoweringError(f"cannot lower {type(statement).__name__}")
+            handler(statement)
+    
+    def lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        raise LoweringError(f"unknown name '{name}'")
+    
+    def scalar(self, name):
+        variable = self.lookup(name)
+        if not isinstance(variable, Variable):
+            raise LoweringError(f"'{name}' is not a scalar variable")
+        return variable
+    
+    def declare(self, name, value, type_name):
+        self.scopes[-1][name] = value
+        self.declared[name] = type_name
+    
+    def write(self, variable, block, value):
+        self.definitions.setdefault(variable, {})[block] = value
+    
+    def read(self, variable, block):
+        definitions = self.definitions.get(variable, {})
+        if block in definitions:
+            return resolve(definitions[block])
+        return self.read_recursive(variable, block)
+    
+    def read_recursive(self, variable, block):
+        if block not in self.sealed:
+            value = self.new_phi(variable, block)
+            self.incomplete.setdefault(block, {})[variable] = value
+        elif len(block.preds) == 1:
+            value = self.read(variable, block.preds[0])
+        elif not block.preds:
+            value = Undefined(variable.type)
+        else:
+            phi = self.new_phi(variable, block)
+            self.write(variable, block, phi)
+            value = self.add_phi_operands(phi)
+        self.write(variable, block, value)
+        return value
+    
+    def new_phi(self, variable, block):
+        phi = self.function.number(Phi(variable))
+        phi.block = block
+        block.phis.append(phi)
+        return phi
+    
+    def add_phi_operands(self, phi):
+        for pred in phi.block.preds:
+            operand = self.read(phi.variable, pred)
+            phi.operands.append(operand)
+            if isinstance(operand, Phi):
+                operand.users.append(phi)
+        return self.remove_trivial_phi(phi)
+    
+    def remove_trivial_phi(self, phi):
+        same = None
+        for operand in phi.operands:
+            operand = resolve(operand)
+            if operand is same or operand is phi:
+                continue
+            if same is not None:
+                return phi
+            same = operand
+        if same is None:
+            same = Undefined(phi.type)
+        phi.replacement = same
+        for user in phi.users:
+            if user is not phi and user.replacement is None:
+                self.remove_trivial_phi(user)
+        return resolve(same)
+    
+    def seal(self, block):
+        for variable, phi in self.incomplete.pop(block, {}).items():
+            self.add_phi_operands(phi)
+        self.sealed.add(block)
+    
+    def finish(self):
+        function = self.function
+        for block in function.blocks:
+            block.phis = [phi for phi in block.phis if phi.replacement is None]
+            for instruction in block.phis + block.instructions:
+                instruction.operands = [resolve(operand) for operand in instruction.operands]
+            if block.terminator is not None:
+                block.terminator.operands = [resolve(operand) for operand in block.terminator.operands]
+        remove_unreachable_blocks(function)
+        remove_dead_phis(function)
+    
+    def lower_print(self, statement):
+        values = statement.value if isinstance(statement.value, list) else [statement.value]
+        format_parts = []
+        arguments = []
+        
+        for value in values:
+            if isinstance(value, StringLiteral):
+                format_string = value.value
+                for name in INTERPOLATION.findall(format_string):
+                    if '.' in name:
+                        parts = name.split('.')
+                        struct_type = self.declared.get(parts[0])
+                        if struct_type in self.struct_definitions:
+                            field_type = self.struct_definitions[struct_type].get(parts[1])
+                            if field_type in FORMATS:
+                                format_string = format_string.replace(f"*{name}*", FORMATS[field_type], 1)
+                            arguments.append(self.field_load(parts[0], parts[1]))
+                    elif name in self.declared and self.declared[name].endswith("*"):
+                        format_string = format_string.replace(f"*{name}*", FORMATS[self.declared[name][:-1]], 1)
+                        arguments.append(self.emit(Deref(self.lower_name(name))))
+                    elif name in self.declared:
+                        var_type = self.declared[name]
+                        if var_type in FORMATS:
+                            format_string = format_string.replace(f"*{name}*", FORMATS[var_type], 1)
+                        arguments.append(self.lower_name(name))
+                format_parts.append(format_string)
+            elif isinstance(value, NumberLiteral):
+                format_parts.append("%d")
+                arguments.append(self.lower_expression(value))
+            elif isinstance(value, FloatLiteral):
+                format_parts.append("%f")
+                arguments.append(self.lower_expression(value))
+            elif isinstance(value, (Identifier, ArrayAccess)):
+                if isinstance(value, Identifier) and self.declared.get(value.name, "").endswith("*"):
+                    raise LoweringError(f"cannot print pointer '{value.name}'")
+                if value.name in self.declared:
+                    format_parts.append(FORMATS.get(self.declared[value.name], ""))
+                else:
+                    format_parts.append("%s")
+                arguments.append(self.lower_expression(value))
+            elif isinstance(value, BinaryOp):
+                argument = self.lower_expression(value)
+                format_parts.append(self.format(argument.type))
+                arguments.append(argument)
+            elif isinstance(value, FunctionCall):
+                argument = self.lower_expression(value)
+                if value.name == "file_read":
+                    format_parts.append("%s")
+                elif value.name in INT_RESULT_CALLS:
+                    format_parts.append("%d")
+                else:
+                    format_parts.append(self.format(argument.type))
+                arguments.append(argument)
+        
+        self.emit(Print("".join(format_parts), arguments), source_line(statement))
+    
+    def format(self, type_name):
+        return FORMATS.get("float" if type_name == "double" else type_name, "%d")
+    
+    def lower_return(self, statement):
+        value = statement.value
+        line = source_line(statement)
+        if value is None:
+            self.terminate(Return(), line)
+        elif isinstance(value, StringLiteral) and self.function.return_type != "string":
+            self.terminate(Return(Constant(0, "int")), line)
+        else:
+            self.terminate(Return(self.lower_expression(value)), line)
+    
+    def lower_var_declaration(self, statement):
+        if statement.var_type not in DECLARABLE:
+            raise LoweringError(f"cannot lower declaration of type {statement.var_type}")
+        variable = Variable(statement.name, statement.var_type)
+        line = source_line(statement)
+        
+        if statement.name in self.addressed:
+            if isinstance(statement.value, InptCall):
+                raise LoweringError(f"cannot lower input into addressed variable '{statement.name}'")
+            source = self.lower_expression(statement.value)
+            symbol = Symbol(statement.name, statement.var_type, "scalar")
+            self.declare(statement.name, symbol, symbol.type)
+            self.emit(ScalarDecl(symbol, source), line)
+            return symbol
+        
+        if isinstance(statement.value, InptCall):
+            prompt = self.lower_expression(statement.value.prompt)
+            self.declare(statement.name, variable, variable.type)
+            value = self.emit(Input(prompt, variable), line)
+        else:
+            source = self.lower_expression(statement.value)
+            self.declare(statement.name, variable, variable.type)
+            value = self.emit(Copy(source, variable), line)
+        self.write(variable, self.block, value)
+        return variable
+    
+    def lower_call(self, statement):
+        arguments = [self.lower_expression(argument) for argument in statement.arguments]
+        self.emit(Call(statement.func_name, arguments), source_line(statement))
+    
+    def lower_if_statement(self, statement):
+        join = self.function.new_block()
+        self.lower_if(statement.condition, statement.if_body, list(statement.elif_parts), statement.else_body, join)
+        self.continue_at(join)
+    
+    def lower_if(self, condition, if_body, elif_parts, else_body, join):
+        condition = self.lower_expression(condition)
+        head = self.block
+        then_entry = self.function.new_block()
+        else_entry = self.function.new_block() if elif_parts or else_body else join
+        self.terminate(Branch(condition, then_entry, else_entry))
+        self.seal(then_entry)
+        
+        then_body = self.nested(then_entry, lambda: self.lower_statements(if_body), join)
+        else_nested = None
+        if else_entry is not join:
+            self.seal(else_entry)
+            if elif_parts:
+                elif_condition, elif_body = elif_parts[0]
+                lower_else = lambda: self.lower_if(elif_condition, elif_body, elif_parts[1:], else_body, join)
+            else:
+                lower_else = lambda: self.lower_statements(else_body)
+            else_nested = self.nested(else_entry, lower_else, join)
+        
+        self.body.append(IfRegion(head, then_body, else_nested, join))
+    
+    def lower_assignment(self, statement):
+        if isinstance(statement.value, InptCall):
+            raise LoweringError("cannot lower input assignment")
+        source = self.lower_expression(statement.value)
+        self.assign(statement.name, source, source_line(statement))
+    
+    def assign(self, name, value, line=""):
+        target = self.lookup(name)
+        if isinstance(target, Variable):
+            self.write(target, self.block, self.emit(Copy(value, target), line))
+        elif target.kind == "scalar":
+            self.emit(Store(target, None, value), line)
+        else:
+            raise LoweringError(f"'{name}' is not a scalar variable")
+    
+    def lower_step(self, statement):
+        operator = "+" if isinstance(statement, IncrementStatement) else "-"
+        self.increment(statement.name, operator, source_line(statement))
+    
+    def increment(self, name, operator, line=""):
+        step = self.emit(Binary(operator, self.lower_name(name), Constant(1, "int")))
+        self.assign(name, step, line)
+    
+    def lower_while(self, statement):
+        header = self.function.new_block()
+        self.jump(header)
+        condition, condition_body = self.lower_condition(header, statement.condition)
+        body_entry = self.function.new_block()
+        exit_block = self.function.new_block()
+        self.terminate(Branch(condition, body_entry, exit_block))
+        self.seal(body_entry)
+        
+        self.loops.append(header)
+        self.breaks.append(exit_block)
+        body = self.nested(body_entry, lambda: self.lower_statements(statement.body), header)
+        self.loops.pop()
+        self.breaks.pop()
+        
+        self.seal(header)
+        self.body.append(LoopRegion("while", header, body, exit_block, condition=condition_body))
+        self.continue_at(exit_block)
+    
+    def lower_condition(self, header, condition):
+        body, self.body = self.body, []
+        self.start(header)
+        value = self.lower_expression(condition)
+        condition_body, self.body = self.body, body
+        return value, condition_body if len(condition_body) > 1 else None
+    
+    def lower_inf(self, statement):
+        header = self.function.new_block()
+        exit_block = self.function.new_block()
+        self.jump(header)
+        
+        self.loops.append(header)
+        self.breaks.append(exit_block)
+        body = self.nested(header, lambda: self.lower_statements(statement.body), header)
+        self.loops.pop()
+        self.breaks.pop()
+        
+        self.seal(header)
+        self.body.append(LoopRegion("inf", header, body, exit_block))
+        self.continue_at(exit_block)
+    
+    def lower_for(self, statement):
+        self.scopes.append({})
+        init = None
+        if isinstance(statement.counter, VarDeclaration):
+            init = self.function.new_block()
+            self.jump(init)
+            self.seal(init)
+            self.block = init
+            counter = self.lower_var_declaration(statement.counter)
+            if not isinstance(counter, Variable):
+                raise LoweringError(f"for counter '{counter.name}' is addressed")
+        else:
+            counter = self.scalar(statement.counter)
+        
+        header = self.function.new_block()
+        self.jump(header)
+        condition, condition_body = self.lower_condition(header, statement.condition)
+        body_entry = self.function.new_block()
+        latch = self.function.new_block()
+        exit_block = self.function.new_block()
+        self.terminate(Branch(condition, body_entry, exit_block))
+        self.seal(body_entry)
+        
+        self.loops.append(latch)
+        self.breaks.append(exit_block)
+        body = self.nested(body_entry, lambda: self.lower_statements(statement.body), latch)
+        self.loops.pop()
+        self.breaks.pop()
+        
+        self.seal(latch)
+        if latch.preds:
+            self.block = latch
+            self.increment(counter.name, "+")
+            self.jump(header)
+        self.seal(header)
+        self.scopes.pop()
+        
+        canonical = independent_iterations(statement)
+        self.body.append(LoopRegion("for", header, body, exit_block, init, latch, counter, canonical, condition_body))
+        self.continue_at(exit_block)
+    
+    def lower_break(self, statement):
+        if not self.breaks:
+            raise LoweringError("break outside of a loop or switch")
+        self.terminate(Jump(self.breaks[-1]), source_line(statement))
+    
+    def lower_continue(self, statement):
+        if not self.loops:
+            raise LoweringError("continue outside of a loop")
+        self.terminate(Jump(self.loops[-1]), source_line(statement))
+    
+    def lower_array_declaration(self, statement):
+        elements = [self.lower_expression(element) for element in statement.elements]
+        array = Symbol(statement.name, statement.array_type, "array")
+        self.declare(statement.name, array, statement.array_type)
+        self.emit(ArrayDecl(array, elements), source_line(statement))
+    
+    def lower_array_assignment(self, statement):
+        base = self.lower_name(statement.name)
+        index = self.lower_expression(statement.index)
+        value = self.lower_expression(statement.value)
+        self.emit(Store(base, index, value), source_line(statement))
+    
+    def lower_switch(self, statement):
+        value = self.lower_expression(statement.expression)
+        head = self.block
+        join = self.function.new_block()
+        entries = [self.function.new_block() for _ in statement.cases]
+        default_entry = self.function.new_block() if statement.default_body else join
+        cases = [(self.case_value(case.value), entry) for case, entry in zip(statement.cases, entries)]
+        self.terminate(Switch(value, cases, default_entry))
+        
+        self.breaks.append(join)
+        case_bodies = []
+        for (constant, entry), case in zip(cases, statement.cases):
+            self.seal(entry)
+            case_bodies.append((constant, self.nested(entry, lambda: self.lower_statements(case.body), join)))
+        default_body = None
+        if statement.default_body:
+            self.seal(default_entry)
+            default_body = self.nested(default_entry, lambda: self.lower_statements(statement.default_body), join)
+        self.breaks.pop()
+        
+        self.body.append(SwitchRegion(head, case_bodies, default_body, join))
+        self.continue_at(join)
+    
+    def case_value(self, value):
+        if type(value) not in LITERAL_TYPES:
+            raise LoweringError("switch case is not a literal")
+        return self.lower_literal(value)
+    
+    def lower_c_import(self, statement):
+        self.function.c_imports.add(statement.header_name)
+    
+    def lower_c_call(self, statement):
+        arguments = [self.lower_expression(argument) for argument in statement.arguments or []]
+        self.emit(CCall(statement.func_name, arguments))
+    
+    def lower_struct_declaration(self, statement):
+        if statement.struct_type not in self.struct_definitions:
+            raise LoweringError(f"unknown struct '{statement.struct_type}'")
+        values = [self.lower_expression(value) for value in statement.field_values.values()]
+        struct = Symbol(statement.name, statement.struct_type, "struct")
+        self.declare(statement.name, struct, statement.struct_type)
+        self.emit(StructDecl(struct, statement.field_values.keys(), values))
+    
+    def lower_pointer_assignment(self, statement):
+        pointer = self.pointer(statement.pointer)
+        value = self.lower_expression(statement.value)
+        self.emit(PointerStore(pointer, value), source_line(statement))
+    
+    def pointer(self, name):
+        pointer = self.lower_name(name)
+        if not pointer.type.endswith("*"):
+            raise LoweringError(f"'{name}' is not a pointer")
+        return pointer
+    
+    def lower_field_assignment(self, statement):
+        struct = self.struct(statement.struct_name)
+        value = self.lower_expression(statement.value)
+        self.emit(FieldStore(struct, statement.field_name, value))
+    
+    def struct(self, name):
+        struct = self.lookup(name)
+        if not isinstance(struct, Symbol) or struct.kind != "struct":
+            raise LoweringError(f"'{name}' is not a struct")
+        return struct
+    
+    def lower_expression(self, expr):
+        if expr is None:
+            return Constant(0, "int")
+        handler = self.expression_handlers.get(type(expr))
+        if handler is None:
+            raise LoweringError(f"cannot lower {type(expr).__name__}")
+        return handler(expr)
+    
+    def lower_literal(self, expr):
+        return Constant(expr.value, LITERAL_TYPES[type(expr)])
+    
+    def lower_name(self, name):
+        value = self.lookup(name)
+        if isinstance(value, Variable):
+            return self.read(value, self.block)
+        if value.kind == "scalar":
+            return self.emit(Load(value, None, value.type))
+        return value
+    
+    def lower_identifier(self, expr):
+        return self.lower_name(expr.name)
+    
+    def lower_array_access(self, expr):
+        base = self.lower_name(expr.name)
+        index = self.lower_expression(expr.index)
+        element_type = base.type
+        if not isinstance(base, Symbol) and base.type == "string":
+            element_type = "char"
+        if element_type not in FORMATS:
+            raise LoweringError(f"cannot index '{expr.name}'")
+        return self.emit(Load(base, index, element_type))
+    
+    def lower_binary_op(self, expr):
+        left = self.lower_expression(expr.left)
+        if expr.operator in SHORT_CIRCUIT:
+            return self.lower_short_circuit(expr.operator, left, expr.right)
+        right = self.lower_expression(expr.right)
+        return self.emit(Binary(expr.operator, left, right))
+    
+    def lower_short_circuit(self, operator, left, right):
+        if operator == "||":
+            left = self.negate(left)
+        head = self.block
+        right_entry = self.function.new_block()
+        join = self.function.new_block()
+        self.terminate(Branch(left, right_entry, join))
+        self.seal(right_entry)
+        
+        body, self.body = self.body, []
+        self.start(right_entry)
+        value = self.truth(self.lower_expression(right))
+        self.jump(join)
+        right_body, self.body = self.body, body
+        self.body.append(IfRegion(head, right_body, None, join))
+        self.seal(join)
+        self.start(join)
+        
+        result = self.function.number(Phi(Variable(None, "int")))
+        result.variable = None
+        result.block = join
+        result.operands = [Constant(int(operator == "||"), "int"), value]
+        join.phis.append(result)
+        return result
+    
+    def truth(self, value):
+        if isinstance(value, Binary) and value.operator in NEGATED:
+            return value
+        return self.emit(Binary("!=", value, Constant(0, "int")))
+    
+    def negate(self, value):
+        if isinstance(value, Binary) and value.operator in NEGATED and not any(operand.type in ("float", "double") for operand in value.operands):
+            return self.emit(Binary(NEGATED[value.operator], *value.operands))
+        return self.emit(Binary("==", value, Constant(0, "int")))
+    
+    def lower_function_call(self, expr):
+        if expr.name in self.return_types:
+            return_type = self.return_types[expr.name]
+            if return_type == "void":
+                raise LoweringError(f"void function '{expr.name}' used in expression")
+        else:
+            return_type = self.external_return_types.get(expr.name)
+        if return_type not in FORMATS:
+            return_type = "int"
+        arguments = [self.lower_expression(argument) for argument in expr.arguments]
+        return self.emit(Call(expr.name, arguments, return_type))
+    
+    def lower_find(self, expr):
+        target = self.lower_expression(expr.target)
+        pattern = self.lower_expression(expr.pattern)
+        return self.emit(Find(target, pattern))
+    
+    def lower_address_of(self, expr):
+        if not isinstance(expr.operand, Identifier):
+            raise LoweringError(f"cannot take the address of {type(expr.operand).__name__}")
+        symbol = self.lookup(expr.operand.name)
+        if not isinstance(symbol, Symbol) or symbol.kind != "scalar":
+            raise LoweringError(f"cannot take the address of '{expr.operand.name}'")
+        return self.emit(Address(symbol))
+    
+    def lower_dereference(self, expr):
+        if not isinstance(expr.operand, Identifier):
+            raise LoweringError(f"cannot dereference {type(expr.operand).__name__}")
+        return self.emit(Deref(self.pointer(expr.operand.name)))
+    
+    def lower_struct_access(self, expr):
+        return self.field_load(expr.struct_name, expr.field_name)
+    
+    def field_load(self, name, field):
+        struct = self.struct(name)
+        field_type = self.struct_definitions[struct.type].get(field, "int")
+        return self.emit(FieldLoad(struct, field, field_type))
+
+
+def resolve(value):
+    while isinstance(value, Phi) and value.replacement is not None:
+        value = value.replacement
+    return value
@@ -0,0 +1,392 @@
+from compiler.analysis import PURE, READS, WRITES
+
+C_TYPES = {
+    "int": "int", "float": "float", "double": "double", "char": "char", "string": "char*",
+    "int*": "int*", "float*": "float*", "char*": "char*", "string*": "char**"
+}
+ARITHMETIC = {"+", "-", "*", "/", "%", "//"}
+TRAPPING = {"/", "%", "//"}
+
+
+def binary_type(operator, left, right):
+    if operator not in ARITHMETIC:
+        return "int"
+    if "string" in (left, right):
+        return "string"
+    if "double" in (left, right):
+        return "double"
+    if "float" in (left, right):
+        return "float"
+    return "int"
+
+
+class Value:
+    type = "int"
+
+
+class Constant(Value):
+    def __init__(self, value, type):
+        self.value = value
+        self.type = type
+    
+    def __repr__(self):
+        return repr(self.value)
+
+
+class Undefined(Value):
+    def __init__(self, type):
+        self.type = type
+    
+    def __repr__(self):
+        return "undef"
+
+
+class Symbol(Value):
+    def __init__(self, name, type, kind):
+        self.name = name
+        self.type = type
+        self.kind = kind
+    
+    def __repr__(self):
+        return f"@{self.name}"
+
+
+class Variable:
+    def __init__(self, name, type):
+        self.name = name
+        self.type = type
+
+
+class Instruction(Value):
+    effect = PURE
+    
+    def __init__(self, operands, type=None):
+        self.operands = list(operands)
+        self.type = type
+        self.id = None
+        self.block = None
+        self.variable = None
+        self.line = ""
+    
+    def __repr__(self):
+        if self.variable is not None:
+            return f"%{self.variable.name}.{self.id}"
+        return f"%{self.id}"
+    
+    def describe(self):
+        return f"{type(self).__name__.lower()} {', '.join(map(repr, self.operands))}"
+
+
+class Param(Instruction):
+    def __init__(self, variable):
+        super().__init__((), variable.type)
+        self.variable = variable
+
+
+class Phi(Instruction):
+    def __init__(self, variable):
+        super().__init__((), variable.type)
+        self.variable = variable
+        self.replacement = None
+        self.users = []
+
+
+class Copy(Instruction):
+    def __init__(self, source, variable):
+        super().__init__((source,), variable.type)
+        self.variable = variable
+
+
+class Binary(Instruction):
+    def __init__(self, operator, left, right):
+        super().__init__((left, right), binary_type(operator, left.type, right.type))
+        self.operator = operator
+        if operator in TRAPPING and not isinstance(right, Constant):
+            self.effect = READS
+    
+    def describe(self):
+        return f"{self.operands[0]!r} {self.operator} {self.operands[1]!r}"
+
+
+class Call(Instruction):
+    effect = WRITES
+    
+    def __init__(self, name, arguments, type=None):
+        super().__init__(arguments, type)
+        self.name = name
+    
+    def describe(self):
+        return f"call {self.name}({', '.join(map(repr, self.operands))})"
+
+
+class CCall(Call):
+    pass
+
+
+class Find(Instruction):
+    effect = READS
+    
+    def __init__(self, target, pattern):
+        super().__init__((target, pattern), "int")
+
+
+class Load(Instruction):
+    effect = READS
+    
+    def __init__(self, base, index, type):
+        super().__init__((base,) if index is None else (base, index), type)
+
+
+class Store(Instruction):
+    effect = WRITES
+    
+    def __init__(self, base, index, value):
+        super().__init__((base, value) if index is None else (base, index, value))
+
+
+class Address(Instruction):
+    def __init__(self, symbol):
+        super().__init__((symbol,), symbol.type + "*")
+
+
+class Deref(Instruction):
+    effect = READS
+    
+    def __init__(self, pointer):
+        super().__init__((pointer,), pointer.type[:-1])
+
+
+class PointerStore(Instruction):
+    effect = WRITES
+    
+    def __init__(self, pointer, value):
+        super().__init__((pointer, value))
+
+
+class FieldLoad(Instruction):
+    effect = READS
+    
+    def __init__(self, struct, field, type):
+        super().__init__((struct,), type)
+        self.field = field
+    
+    def describe(self):
+        return f"fieldload {self.operands[0]!r}.{self.field}"
+
+
+class FieldStore(Instruction):
+    effect = WRITES
+    
+    def __init__(self, struct, field, value):
+        super().__init__((struct, value))
+        self.field = field
+    
+    def describe(self):
+        return f"fieldstore {self.operands[0]!r}.{self.field}, {self.operands[1]!r}"
+
+
+class ArrayDecl(Instruction):
+    effect = WRITES
+    
+    def __init__(self, array, elements):
+        super().__init__([array] + list(elements))
+
+
+class ScalarDecl(Instruction):
+    effect = WRITES
+    
+    def __init__(self, symbol, value):
+        super().__init__((symbol, value))
+
+
+class StructDecl(Instruction):
+    effect = WRITES
+    
+    def __init__(self, struct, fields, values):
+        super().__init__([struct] + list(values))
+        self.fields = list(fields)
+
+
+class Print(Instruction):
+    effect = WRITES
+    
+    def __init__(self, format, arguments):
+        super().__init__(arguments)
+        self.format = format
+    
+    def describe(self):
+        return f"print {self.format!r}{''.join(', ' + repr(arg) for arg in self.operands)}"
+
+
+class Input(Instruction):
+    effect = WRITES
+    
+    def __init__(self, prompt, variable):
+        super().__init__((prompt,), variable.type)
+        self.variable = variable
+
+
+class Terminator:
+    def __init__(self, operands=()):
+        self.operands = list(operands)
+        self.block = None
+        self.line = ""
+    
+    def successors(self):
+        return []
+
+
+class Jump(Terminator):
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+    
+    def successors(self):
+        return [self.target]
+    
+    def describe(self):
+        return f"jump {self.target!r}"
+
+
+class Branch(Terminator):
+    def __init__(self, condition, if_true, if_false):
+        super().__init__((condition,))
+        self.if_true = if_true
+        self.if_false = if_false
+    
+    def successors(self):
+        return [self.if_true, self.if_false]
+    
+    def describe(self):
+        return f"branch {self.operands[0]!r}, {self.if_true!r}, {self.if_false!r}"
+
+
+class Switch(Terminator):
+    def __init__(self, value, cases, default):
+        super().__init__((value,))
+        self.cases = cases
+        self.default = default
+    
+    def successors(self):
+        return [block for _, block in self.cases] + [self.default]
+    
+    def describe(self):
+        cases = ", ".join(f"{value!r}: {block!r}" for value, block in self.cases)
+        return f"switch {self.operands[0]!r} [{cases}] default {self.default!r}"
+
+
+class Return(Terminator):
+    def __init__(self, value=None):
+        super().__init__(() if value is None else (value,))
+    
+    def describe(self):
+        return f"return {self.operands[0]!r}" if self.operands else "return"
+
+
+class Block:
+    def __init__(self, id):
+        self.id = id
+        self.phis = []
+        self.instructions = []
+        self.terminator = None
+        self.preds = []
+    
+    def __repr__(self):
+        return f"b{self.id}"
+    
+    def __getstate__(self):
+        return {"id": self.id}
+    
+    def __setstate__(self, state):
+        self.__init__(state["id"])
+    
+    def successors(self):
+        if self.terminator is None:
+            return []
+        return self.terminator.successors()
+
+
+class IfRegion:
+    def __init__(self, head, then_body, else_body, join):
+        self.head = head
+        self.then_body = then_body
+        self.else_body = else_body
+        self.join = join
+
+
+class LoopRegion:
+    def __init__(self, kind, header, body, exit, init=None, latch=None, counter=None, canonical=False, condition=None):
+        self.kind = kind
+        self.header = header
+        self.body = body
+        self.exit = exit
+        self.init = init
+        self.latch = latch
+        self.counter = counter
+        self.canonical = canonical
+        self.condition = condition
+
+
+class SwitchRegion:
+    def __init__(self, head, cases, default_body, join):
+        self.head = head
+        self.cases = cases
+        self.default_body = default_body
+        self.join = join
+
+
+class IRFunction:
+    def __init__(self, name, params, param_types, return_type):
+        self.name = name
+        self.params = list(params)
+        self.param_types = dict(param_types)
+        self.return_type = return_type
+        self.blocks = []
+        self.entry = None
+        self.body = []
+        self.c_imports = set()
+        self.passes = []
+        self.next_id = 0
+        self.next_block = 0
+    
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["contents"] = [(block.phis, block.instructions, block.terminator, block.preds) for block in self.blocks]
+        return state
+    
+    def __setstate__(self, state):
+        contents = state.pop("contents")
+        self.__dict__.update(state)
+        for block, (phis, instructions, terminator, preds) in zip(self.blocks, contents):
+            block.phis, block.instructions, block.terminator, block.preds = phis, instructions, terminator, preds
+    
+    def new_block(self):
+        block = Block(self.next_block)
+        self.next_block += 1
+        self.blocks.append(block)
+        return block
+    
+    def number(self, instruction):
+        instruction.id = self.next_id
+        self.next_id += 1
+        return instruction
+    
+    def instructions(self):
+        for block in self.blocks:
+            yield from block.phis
+            yield from block.instructions
+    
+    def dump(self):
+        lines = [f"function {self.name}({', '.join(self.params)}) -> {self.return_type}"]
+        for block in self.blocks:
+            preds = ", ".join(map(repr, block.preds))
+            lines.append(f"  {block!r}:" + (f"  ; preds {preds}" if preds else ""))
+            for phi in block.phis:
+                operands = ", ".join(f"{pred!r}: {value!r}" for pred, value in zip(block.preds, phi.operands))
+                lines.append(f"    {phi!r} = phi {operands}")
+            for instruction in block.instructions:
+                prefix = f"{instruction!r} = " if instruction.type is not None else ""
+                lines.append(f"    {prefix}{instruction.describe()}")
+            if block.terminator is not None:
+                lines.append(f"    {block.terminator.describe()}")
+        return "\n".join(lines)
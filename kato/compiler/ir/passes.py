@@ -0,0 +1,338 @@
+from compiler.analysis import WRITES
+from .nodes import Instruction, Constant, Undefined, Variable, Phi, Copy, Binary, Address, Load, Deref, FieldLoad, Find, Print
+from .ssa import reverse_postorder, dominator_tree, dominators, natural_loop
+
+COMMUTATIVE = {"+", "*", "==", "!="}
+FLOATING = ("float", "double")
+NUMERIC = ("int", "float", "double")
+MEMORY_READS = (Load, Deref, FieldLoad, Find)
+BOOLEAN_OPERATORS = {"==", "!=", "<", ">", "<=", ">=", "&&", "||"}
+NON_NEGATIVE_OPERATORS = {"+", "*", "/", "%", "//", ">>", "&"}
+SHIFTS = {"*": "<<", "/": ">>", "//": ">>"}
+INT_MIN = -2 ** 31
+INT_MAX = 2 ** 31 - 1
+
+
+def replace_uses(function, replacements):
+    for block in function.blocks:
+        for instruction in block.phis + block.instructions:
+            instruction.operands = [replacement(operand, replacements) for operand in instruction.operands]
+        if block.terminator is not None:
+            block.terminator.operands = [replacement(operand, replacements) for operand in block.terminator.operands]
+
+
+def replacement(value, replacements):
+    while value in replacements:
+        value = replacements[value]
+    return value
+
+
+def is_constant(value, number):
+    return isinstance(value, Constant) and value.type == "int" and value.value == number
+
+
+def power_of_two(value):
+    if isinstance(value, Constant) and value.type == "int" and value.value > 0 and value.value & (value.value - 1) == 0:
+        return value.value.bit_length() - 1
+    return None
+
+
+def non_negative(value, proven):
+    if isinstance(value, Constant):
+        return value.type == "int" and value.value >= 0
+    if isinstance(value, Undefined):
+        return True
+    return value in proven
+
+
+def proves_non_negative(instruction, proven):
+    if isinstance(instruction, Binary):
+        if instruction.operator in BOOLEAN_OPERATORS:
+            return True
+        return instruction.operator in NON_NEGATIVE_OPERATORS and all(non_negative(operand, proven) for operand in instruction.operands)
+    if isinstance(instruction, (Phi, Copy)):
+        return all(non_negative(operand, proven) for operand in instruction.operands)
+    return False
+
+
+def non_negative_values(function):
+    proven = {instruction for instruction in function.instructions() if instruction.type == "int"}
+    changed = True
+    while changed:
+        changed = False
+        for instruction in list(proven):
+            if not proves_non_negative(instruction, proven):
+                proven.discard(instruction)
+                changed = True
+    return proven
+
+
+
+class CopyPropagation:
+    def __init__(self):
+        self.propagated = 0
+    
+    def propagate_function(self, function):
+        replacements = {}
+        for block in function.blocks:
+            kept = []
+            for instruction in block.instructions:
+                if isinstance(instruction, Copy) and self.propagates(instruction):
+                    source = instruction.operands[0]
+                    if isinstance(source, Instruction) and source.variable is None:
+                        source.variable = instruction.variable
+                        source.line = source.line or instruction.line
+                    replacements[instruction] = source
+                else:
+                    kept.append(instruction)
+            block.instructions = kept
+        
+        replace_uses(function, replacements)
+        self.propagated += len(replacements)
+        function.passes.append("copy_prop")
+    
+    def propagates(self, copy):
+        return copy.operands[0].type == copy.type
+
+
+class AlgebraicSimplifier:
+    def __init__(self):
+        self.simplified = 0
+    
+    def simplify_function(self, function):
+        replacements = {}
+        self.proven = non_negative_values(function)
+        for block in reverse_postorder(function):
+            kept = []
+            for instruction in block.instructions:
+                instruction.operands = [replacement(operand, replacements) for operand in instruction.operands]
+                value = self.simplify(instruction) if isinstance(instruction, Binary) else None
+                if value is None:
+                    kept.append(instruction)
+                    continue
+                if isinstance(value, Instruction) and value.variable is None:
+                    value.variable = instruction.variable
+                    value.line = value.line or instruction.line
+                replacements[instruction] = value
+            block.instructions = kept
+        
+        replace_uses(function, replacements)
+        self.simplified += len(replacements)
+        function.passes.append("simplify")
+    
+    def simplify(self, instruction):
+        left, right = instruction.operands
+        operator = instruction.operator
+        if instruction.type in NUMERIC:
+            value = self.identity(operator, left, right)
+            if value is not None and value.type == instruction.type:
+                return value
+        if instruction.type != "int" or left.type != "int" or right.type != "int":
+            return None
+        
+        if operator == "*" and (is_constant(left, 0) or is_constant(right, 0)) or operator == "-" and left is right:
+            return Constant(0, "int")
+        if operator == "//" and is_constant(right, 1):
+            return left
+        if operator == "*" and power_of_two(left) is not None:
+            left, right = right, left
+        
+        shift = power_of_two(right)
+        if shift is not None and non_negative(left, self.proven):
+            if operator in SHIFTS:
+                return self.rewrite(instruction, SHIFTS[operator], left, Constant(shift, "int"))
+            if operator == "%":
+                return self.rewrite(instruction, "&", left, Constant(right.value - 1, "int"))
+        if operator == "//" and non_negative(left, self.proven) and non_negative(right, self.proven):
+            return self.rewrite(instruction, "/", left, right)
+        return None
+    
+    def rewrite(self, instruction, operator, left, right):
+        instruction.operator = operator
+        instruction.operands = [left, right]
+        self.simplified += 1
+        return None
+    
+    def identity(self, operator, left, right):
+        if operator in ("+", "-") and is_constant(right, 0) or operator in ("*", "/") and is_constant(right, 1):
+            return left
+        if operator == "+" and is_constant(left, 0) or operator == "*" and is_constant(left, 1):
+            return right
+        return None
+
+
+class StrengthReduction:
+    def __init__(self):
+        self.reduced = 0
+    
+    def reduce_function(self, function):
+        self.function = function
+        self.replacements = {}
+        for header, body in self.loops(function).items():
+            for phi in list(header.phis):
+                self.reduce_induction(phi, body)
+        
+        for block in function.blocks:
+            block.instructions = [instruction for instruction in block.instructions if instruction not in self.replacements]
+        replace_uses(function, self.replacements)
+        self.reduced += len(self.replacements)
+        function.passes.append("strength_reduce")
+    
+    def loops(self, function):
+        dominance = dominators(function)
+        loops = {}
+        for block in function.blocks:
+            for successor in block.successors():
+                if successor in dominance.get(block, ()):
+                    loops.setdefault(successor, set()).update(natural_loop(successor, block))
+        return loops
+    
+    def reduce_induction(self, phi, body):
+        header = phi.block
+        steps = {}
+        for index, pred in enumerate(header.preds):
+            if pred in body:
+                step = self.step(phi, phi.operands[index])
+                if step is None:
+                    return
+                steps[index] = step
+        if phi.type != "int" or not steps:
+            return
+        
+        reduced = {}
+        for block in self.function.blocks:
+            if block not in body:
+                continue
+            for instruction in block.instructions:
+                factor = self.factor(instruction, phi)
+                if factor is None or instruction in self.replacements:
+                    continue
+                if any(not INT_MIN <= step * factor <= INT_MAX for _, step in steps.values()):
+                    continue
+                if factor not in reduced:
+                    reduced[factor] = self.induction(phi, factor, steps)
+                self.replacements[instruction] = reduced[factor]
+    
+    def step(self, phi, value):
+        if value is phi:
+            return (None, 0)
+        if not isinstance(value, Binary) or value.operator not in ("+", "-"):
+            return None
+        left, right = value.operands
+        if value.operator == "+" and left is not phi:
+            left, right = right, left
+        if left is not phi or not isinstance(right, Constant) or right.type != "int":
+            return None
+        return (value, right.value if value.operator == "+" else -right.value)
+    
+    def factor(self, instruction, phi):
+        if not isinstance(instruction, Binary) or instruction.operator != "*" or instruction.type != "int":
+            return None
+        left, right = instruction.operands
+        if left is not phi:
+            left, right = right, left
+        if left is not phi or not isinstance(right, Constant) or right.type != "int" or right.value in (0, 1):
+            return None
+        return right.value
+    
+    def induction(self, phi, factor, steps):
+        header = phi.block
+        reduced = self.function.number(Phi(Variable(None, "int")))
+        reduced.variable = None
+        reduced.block = header
+        header.phis.append(reduced)
+        
+        updates = {}
+        for index, pred in enumerate(header.preds):
+            if index not in steps:
+                reduced.operands.append(self.scaled(phi.operands[index], factor, pred))
+                continue
+            update, step = steps[index]
+            if update is None:
+                reduced.operands.append(reduced)
+                continue
+            if update not in updates:
+                operator = "+" if step * factor >= 0 else "-"
+                increment = Binary(operator, reduced, Constant(abs(step * factor), "int"))
+                updates[update] = self.place(increment, update.block, update.block.instructions.index(update) + 1)
+            reduced.operands.append(updates[update])
+        return reduced
+    
+    def scaled(self, value, factor, pred):
+        if isinstance(value, Constant) and value.type == "int" and INT_MIN <= value.value * factor <= INT_MAX:
+            return Constant(value.value * factor, "int")
+        return self.place(Binary("*", value, Constant(factor, "int")), pred, len(pred.instructions))
+    
+    def place(self, instruction, block, index):
+        self.function.number(instruction)
+        instruction.block = block
+        block.instructions.insert(index, instruction)
+        return instruction
+
+
+class CommonSubexpressionElimination:
+    def __init__(self):
+        self.eliminated = 0
+    
+    def eliminate_function(self, function):
+        self.replacements = {}
+        self.available = {}
+        children = dominator_tree(function)
+        
+        pending = [function.entry]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, list):
+                for key in item:
+                    del self.available[key]
+                continue
+            pending.append(self.number_block(item))
+            pending.extend(reversed(children[item]))
+        
+        replace_uses(function, self.replacements)
+        self.eliminated += len(self.replacements)
+        function.passes.append("cse")
+    
+    def number_block(self, block):
+        added = []
+        memory = {}
+        kept = []
+        
+        for instruction in block.instructions:
+            instruction.operands = [replacement(operand, self.replacements) for operand in instruction.operands]
+            if instruction.effect == WRITES and not isinstance(instruction, Print):
+                memory = {}
+            
+            key = self.key(instruction)
+            table = memory if isinstance(instruction, MEMORY_READS) else self.available
+            if key is not None and key in table:
+                self.replacements[instruction] = table[key]
+                continue
+            
+            kept.append(instruction)
+            if key is not None:
+                table[key] = instruction
+                if table is self.available:
+                    added.append(key)
+        
+        block.instructions = kept
+        return added
+    
+    def key(self, instruction):
+        operands = [self.operand_key(operand) for operand in instruction.operands]
+        if isinstance(instruction, Binary):
+            if instruction.type in FLOATING:
+                return None
+            if instruction.operator in COMMUTATIVE:
+                operands.sort(key=repr)
+            return (Binary, instruction.operator, tuple(operands))
+        if isinstance(instruction, FieldLoad):
+            return (FieldLoad, instruction.field, tuple(operands))
+        if isinstance(instruction, (Address,) + MEMORY_READS):
+            return (type(instruction), tuple(operands))
+        return None
+    
+    def operand_key(self, value):
+        if isinstance(value, Constant):
+            return (value.type, value.value)
+        return value
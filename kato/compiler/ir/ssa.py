@@ -0,0 +1,395 @@
+from compiler.analysis import PURE, WRITES
+from .nodes import Symbol, Instruction, Param, Phi, Copy, Input
+
+
+def remove_pred(block, pred):
+    while pred in block.preds:
+        index = block.preds.index(pred)
+        del block.preds[index]
+        for phi in block.phis:
+            del phi.operands[index]
+
+
+def remove_unreachable_blocks(function):
+    reachable = set()
+    pending = [function.entry]
+    while pending:
+        block = pending.pop()
+        if block not in reachable:
+            reachable.add(block)
+            pending.extend(block.successors())
+    
+    for block in function.blocks:
+        if block not in reachable:
+            for successor in block.successors():
+                remove_pred(successor, block)
+    function.blocks = [block for block in function.blocks if block in reachable]
+
+
+def remove_dead_phis(function):
+    live = set()
+    pending = []
+    for block in function.blocks:
+        for instruction in block.instructions:
+            pending.extend(instruction.operands)
+        if block.terminator is not None:
+            pending.extend(block.terminator.operands)
+    
+    while pending:
+        value = pending.pop()
+        if isinstance(value, Phi) and value not in live:
+            live.add(value)
+            pending.extend(value.operands)
+    
+    for block in function.blocks:
+        block.phis = [phi for phi in block.phis if phi in live]
+
+
+def reverse_postorder(function):
+    order = []
+    visited = {function.entry}
+    stack = [(function.entry, iter(function.entry.successors()))]
+    while stack:
+        block, successors = stack[-1]
+        for successor in successors:
+            if successor not in visited:
+                visited.add(successor)
+                stack.append((successor, iter(successor.successors())))
+                break
+        else:
+            stack.pop()
+            order.append(block)
+    order.reverse()
+    return order
+
+
+def intersect(first, second, idom, position):
+    while first is not second:
+        while position[first] > position[second]:
+            first = idom[first]
+        while position[second] > position[first]:
+            second = idom[second]
+    return first
+
+
+def dominator_tree(function):
+    order = reverse_postorder(function)
+    position = {block: index for index, block in enumerate(order)}
+    idom = {function.entry: function.entry}
+    
+    changed = True
+    while changed:
+        changed = False
+        for block in order[1:]:
+            preds = [pred for pred in block.preds if pred in idom]
+            dominator = preds[0]
+            for pred in preds[1:]:
+                dominator = intersect(pred, dominator, idom, position)
+            if idom.get(block) is not dominator:
+                idom[block] = dominator
+                changed = True
+    
+    children = {block: [] for block in order}
+    for block in order[1:]:
+        children[idom[block]].append(block)
+    return children
+
+
+def dominators(function):
+    children = dominator_tree(function)
+    result = {function.entry: {function.entry}}
+    pending = [function.entry]
+    while pending:
+        block = pending.pop()
+        for child in children[block]:
+            result[child] = result[block] | {child}
+            pending.append(child)
+    return result
+
+
+def natural_loop(header, latch):
+    body = {header}
+    pending = [latch]
+    while pending:
+        block = pending.pop()
+        if block not in body:
+            body.add(block)
+            pending.extend(block.preds)
+    return body
+
+
+def conflicts(first, second):
+    if first == WRITES:
+        return second != PURE
+    return second == WRITES and first != PURE
+
+
+class ExpressionTrees:
+    def __init__(self, function):
+        self.function = function
+        self.useful = set()
+        self.users = {}
+        self.deferred = set()
+        self.mark_useful()
+        
+        for block in function.blocks:
+            for instruction in block.instructions:
+                if self.deferrable(instruction):
+                    self.deferred.add(instruction)
+        
+        while any(self.reorder_conflicts(block) for block in function.blocks):
+            pass
+    
+    def mark_useful(self):
+        pending = []
+        for block in self.function.blocks:
+            for instruction in block.instructions:
+                if instruction.effect == WRITES or isinstance(instruction, Param):
+                    pending.append(instruction)
+            if block.terminator is not None:
+                pending.append(block.terminator)
+        
+        while pending:
+            user = pending.pop()
+            if user in self.useful:
+                continue
+            self.useful.add(user)
+            for operand in user.operands:
+                if isinstance(operand, Instruction):
+                    self.users.setdefault(operand, []).append(user)
+                    pending.append(operand)
+    
+    def deferrable(self, instruction):
+        if instruction.variable is not None or instruction.type is None or instruction not in self.useful:
+            return False
+        users = self.users.get(instruction, ())
+        return len(users) == 1 and users[0].block is instruction.block and not isinstance(users[0], Phi)
+    
+    def root(self, instruction):
+        while instruction in self.deferred:
+            instruction = self.users[instruction][0]
+        return instruction
+    
+    def reorder_conflicts(self, block):
+        instructions = block.instructions
+        positions = {instruction: index for index, instruction in enumerate(instructions)}
+        
+        for index, instruction in enumerate(instructions):
+            if instruction not in self.deferred or instruction.effect == PURE:
+                continue
+            root = self.root(instruction)
+            for other in instructions[index + 1:positions.get(root, len(instructions))]:
+                if other in self.useful and self.root(other) is not root and conflicts(instruction.effect, other.effect):
+                    self.deferred.discard(instruction)
+                    return True
+        return False
+    
+    def statements(self, block):
+        return [instruction for instruction in block.instructions
+                if instruction in self.useful and instruction not in self.deferred and not isinstance(instruction, Param)]
+    
+    def has_storage(self, instruction):
+        if instruction not in self.useful or instruction in self.deferred or instruction.type is None:
+            return False
+        return instruction in self.users or isinstance(instruction, (Param, Input))
+    
+    def leaves(self, user):
+        for operand in user.operands:
+            if operand in self.deferred:
+                yield from self.leaves(operand)
+            elif isinstance(operand, Instruction):
+                yield operand
+
+
+class Allocation:
+    def __init__(self, function, trees):
+        self.function = function
+        self.trees = trees
+        self.parent = {}
+        self.members = {}
+        self.adjacent = {}
+        self.names = {}
+        self.declarations = []
+        self.temporaries = 0
+        
+        self.compute_liveness()
+        self.build_interference()
+        self.coalesce_phis()
+        self.assign_names()
+    
+    def storage(self):
+        for block in self.function.blocks:
+            for instruction in block.phis + block.instructions:
+                if self.trees.has_storage(instruction):
+                    yield instruction
+    
+    def phi_uses(self, block):
+        uses = set()
+        for successor in block.successors():
+            index = successor.preds.index(block)
+            for phi in successor.phis:
+                if isinstance(phi.operands[index], Instruction):
+                    uses.add(phi.operands[index])
+        return uses
+    
+    def compute_liveness(self):
+        trees = self.trees
+        blocks = self.function.blocks
+        self.exposed = {}
+        self.defined = {}
+        
+        for block in blocks:
+            exposed = set()
+            defined = set(block.phis)
+            for user in trees.statements(block) + ([block.terminator] if block.terminator else []):
+                exposed.update(leaf for leaf in trees.leaves(user) if leaf not in defined)
+                defined.add(user)
+            self.exposed[block] = exposed
+            self.defined[block] = defined
+        
+        self.live_in = {block: set() for block in blocks}
+        self.live_out = {block: set() for block in blocks}
+        changed = True
+        while changed:
+            changed = False
+            for block in reversed(blocks):
+                live_out = self.phi_uses(block)
+                for successor in block.successors():
+                    live_out |= self.live_in[successor]
+                live_in = self.exposed[block] | (live_out - self.defined[block])
+                if live_out != self.live_out[block] or live_in != self.live_in[block]:
+                    self.live_out[block] = live_out
+                    self.live_in[block] = live_in
+                    changed = True
+    
+    def interfere(self, first, second):
+        self.adjacent.setdefault(first, set()).add(second)
+        self.adjacent.setdefault(second, set()).add(first)
+    
+    def build_interference(self):
+        trees = self.trees
+        for value in self.storage():
+            self.parent[value] = value
+            self.members[value] = [value]
+            self.adjacent.setdefault(value, set())
+        
+        for block in self.function.blocks:
+            live = set(self.live_out[block])
+            if block.terminator is not None:
+                live.update(trees.leaves(block.terminator))
+            
+            for statement in reversed(trees.statements(block)):
+                if statement in self.parent:
+                    source = statement.operands[0] if isinstance(statement, Copy) else None
+                    for value in live:
+                        if value is not statement and value is not source:
+                            self.interfere(statement, value)
+                    live.discard(statement)
+                live.update(trees.leaves(statement))
+            
+            defined = list(block.phis)
+            if block is self.function.entry:
+                defined.extend(instruction for instruction in block.instructions if isinstance(instruction, Param))
+            for value in defined:
+                for other in live | set(defined):
+                    if other is not value:
+                        self.interfere(value, other)
+    
+    def find(self, value):
+        while self.parent[value] is not value:
+            self.parent[value] = self.parent[self.parent[value]]
+            value = self.parent[value]
+        return value
+    
+    def union(self, first, second):
+        first, second = self.find(first), self.find(second)
+        if first is second:
+            return True
+        if first.type != second.type or any(member in self.adjacent[first] for member in self.members[second]):
+            return False
+        if second.id < first.id:
+            first, second = second, first
+        self.parent[second] = first
+        self.members[first].extend(self.members.pop(second))
+        self.adjacent[first] |= self.adjacent[second]
+        return True
+    
+    def coalesce_phis(self):
+        for block in self.function.blocks:
+            for phi in block.phis:
+                if phi not in self.parent:
+                    continue
+                for operand in phi.operands:
+                    if operand in self.parent:
+                        self.union(phi, operand)
+    
+    def assign_names(self):
+        taken = set()
+        for block in self.function.blocks:
+            for instruction in block.instructions:
+                for operand in instruction.operands:
+                    if isinstance(operand, Symbol):
+                        taken.add(operand.name)
+        
+        groups = {}
+        roots = sorted((root for root in self.members), key=lambda root: (not isinstance(root, Param), root.id))
+        for root in roots:
+            if self.find(root) is not root:
+                continue
+            variables = [member.variable for member in self.members[root] if member.variable is not None]
+            if not variables:
+                self.names[root] = self.temporary(root.type, "t")
+                continue
+            base = variables[0].name
+            if any(self.union(group, root) for group in groups.get(base, ())):
+                continue
+            name = base
+            if isinstance(root, Param):
+                taken.add(name)
+            else:
+                suffix = 0
+                while name in taken:
+                    suffix += 1
+                    name = f"{base}__{suffix}"
+                taken.add(name)
+                self.declarations.append((name, root.type))
+            groups.setdefault(base, []).append(root)
+            self.names[root] = name
+    
+    def temporary(self, type_name, prefix):
+        self.temporaries += 1
+        name = f"__{prefix}{self.temporaries}"
+        self.declarations.append((name, type_name))
+        return name
+    
+    def name(self, value):
+        return self.names[self.find(value)]
+    
+    def copies(self, pred, block):
+        index = block.preds.index(pred)
+        moves = []
+        for phi in block.phis:
+            if phi not in self.parent:
+                continue
+            source = phi.operands[index]
+            target = self.name(phi)
+            if source in self.parent:
+                source = self.name(source)
+                if source == target:
+                    continue
+            moves.append((target, source, phi.type))
+        
+        ordered = []
+        while moves:
+            for move in moves:
+                if not any(other[1] == move[0] for other in moves if other is not move):
+                    ordered.append(move[:2])
+                    moves.remove(move)
+                    break
+            else:
+                target, _, type_name = moves[0]
+                temporary = self.temporary(type_name, "swap")
+                ordered.append((temporary, target))
+                moves = [(other_target, temporary if other_source == target else other_source, other_type)
+                         for other_target, other_source, other_type in moves]
+        return ordered
@@ -1,23 +1,1352 @@
+import re
+import struct
+import time
+
 from parser.ast import (
-    Program, Function, PrintStatement, ReturnStatement,
-    VarDeclaration, CallStatement
+    ASTNode, Program, Function, PrintStatement, ReturnStatement,
+    VarDeclaration, Assignment, CallStatement, IfStatement, SwitchStatement, ArrayDeclaration, StructVarDeclaration,
+    BreakStatement, ContinueStatement, StopStatement, InfStatement,
+    NumberLiteral, FloatLiteral, CharLiteral, StringLiteral, Identifier, FunctionCall, BinaryOp,
+    NodeVisitor, NodeTransformer
 )
+from .analysis import ProgramAnalyzer, AddressScanner, reachable_functions, call_order, EffectAnalysis, PURE, WRITES
+from .preprocessor import stdlib_return_types, stdlib_effects
+from .type_inference import TypeInference
+from .ir import Lowering, LoweringError, CopyPropagation, StrengthReduction, AlgebraicSimplifier, CommonSubexpressionElimination
+
+INT_MIN = -2 ** 31
+INT_MAX = 2 ** 31 - 1
+COMPARISONS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b,
+    ">=": lambda a, b: a >= b,
+}
+DECLARATIONS = (VarDeclaration, ArrayDeclaration, StructVarDeclaration)
+TERMINATORS = (ReturnStatement, BreakStatement, ContinueStatement, StopStatement)
+INTERPOLATION = re.compile(r'\*([\w\.]+)\*')
+INLINED_NAME = re.compile(r'^__inl\d+_')
+LITERALS = (NumberLiteral, FloatLiteral, CharLiteral, StringLiteral)
+INLINE_THRESHOLD = 40
+INLINE_THRESHOLDS = {2: INLINE_THRESHOLD, 3: 3 * INLINE_THRESHOLD}
+OPT_LEVELS = (0, 1, 2, 3)
+DEFAULT_OPT_LEVEL = 2
+ANALYSES = ("call_graph", "types", "effects")
+HOISTED_TYPES = ("int", "float", "char")
+SHORT_CIRCUIT = ("&&", "||")
+
+
+def c_int_div(a, b):
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
+
+
+def to_single(value):
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+
+def is_single(value):
+    try:
+        return to_single(value) == value
+    except OverflowError:
+        return False
+
+
+class AssignmentScanner(NodeVisitor):
+    def __init__(self):
+        self.declarations = {}
+        self.assigned = set()
+    
+    def visit_VarDeclaration(self, node):
+        self.declarations[node.name] = self.declarations.get(node.name, 0) + 1
+        self.generic_visit(node)
+    
+    def visit_Assignment(self, node):
+        self.assigned.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_IncrementStatement(self, node):
+        self.assigned.add(node.name)
+    
+    def visit_DecrementStatement(self, node):
+        self.assigned.add(node.name)
+    
+    def visit_ConvertStatement(self, node):
+        if isinstance(node.expression, Identifier):
+            self.assigned.add(node.expression.name)
+        self.generic_visit(node)
+    
+    def visit_AddressOf(self, node):
+        if isinstance(node.operand, Identifier):
+            self.assigned.add(node.operand.name)
+        self.generic_visit(node)
+    
+    def visit_ForStatement(self, node):
+        self.assigned.add(node.counter.name if isinstance(node.counter, VarDeclaration) else node.counter)
+        self.generic_visit(node)
+
+
+class ConstantFolder(NodeTransformer):
+    def __init__(self):
+        self.constants = {}
+        self.single = {}
+        self.stable = set()
+    
+    def fold_function(self, function):
+        scanner = AssignmentScanner()
+        scanner.visit_value(function.body)
+        self.constants = {}
+        self.single = {}
+        self.stable = {name for name, count in scanner.declarations.items() if count == 1}
+        self.stable -= scanner.assigned
+        self.stable -= set(function.params)
+        function.body = self.transform_value(function.body)
+        return function
+    
+    def literal(self, value, single=False):
+        if isinstance(value, float):
+            node = FloatLiteral(value)
+            if single:
+                self.single[id(node)] = node
+            return node
+        return NumberLiteral(value)
+    
+    def constant_value(self, node):
+        if type(node) is NumberLiteral:
+            if isinstance(node.value, int) and INT_MIN <= node.value <= INT_MAX:
+                return node.value
+        elif type(node) is FloatLiteral:
+            return node.value
+        return None
+    
+    def visit_Identifier(self, node):
+        constant = self.constants.get(node.name)
+        if constant is None:
+            return node
+        return self.literal(*constant)
+    
+    def visit_ConvertExpression(self, node):
+        return node
+    
+    def visit_FindCall(self, node):
+        return node
+    
+    def visit_VarDeclaration(self, node):
+        self.generic_visit(node)
+        
+        if node.name in self.stable and node.var_type in ("int", "float"):
+            value = self.constant_value(node.value)
+            if value is not None:
+                if node.var_type == "int":
+                    value = int(value)
+                    if INT_MIN <= value <= INT_MAX:
+                        self.constants[node.name] = (value, False)
+                elif is_single(float(value)):
+                    self.constants[node.name] = (float(value), True)
+        
+        return node
+    
+    def visit_BinaryOp(self, node):
+        self.generic_visit(node)
+        
+        left = self.constant_value(node.left)
+        right = self.constant_value(node.right)
+        operator = node.operator
+        
+        if operator == "&&" and left is not None and not left:
+            return NumberLiteral(0)
+        if operator == "||" and left is not None and left:
+            return NumberLiteral(1)
+        if left is None or right is None:
+            return node
+        
+        if operator in COMPARISONS:
+            return NumberLiteral(int(COMPARISONS[operator](left, right)))
+        if operator == "&&":
+            return NumberLiteral(int(bool(right)))
+        if operator == "||":
+            return NumberLiteral(int(bool(right)))
+        
+        if isinstance(left, int) and isinstance(right, int):
+            if operator == "+":
+                result = left + right
+            elif operator == "-":
+                result = left - right
+            elif operator == "*":
+                result = left * right
+            elif operator == "/" and right != 0:
+                result = c_int_div(left, right)
+            elif operator == "%" and right != 0:
+                result = left - c_int_div(left, right) * right
+            elif operator == "//" and right != 0:
+                result = left // right
+            else:
+                return node
+            if INT_MIN <= result <= INT_MAX:
+                return NumberLiteral(result)
+            return node
+        
+        if operator == "+":
+            result = float(left) + float(right)
+        elif operator == "-":
+            result = float(left) - float(right)
+        elif operator == "*":
+            result = float(left) * float(right)
+        elif operator == "/" and right != 0:
+            result = float(left) / float(right)
+        else:
+            return node
+        
+        if result != result or result in (float('inf'), float('-inf')):
+            return node
+        
+        left_double = type(node.left) is FloatLiteral and id(node.left) not in self.single
+        right_double = type(node.right) is FloatLiteral and id(node.right) not in self.single
+        if left_double or right_double:
+            return FloatLiteral(result)
+        if not is_single(result):
+            return node
+        return self.literal(result, True)
+    
+    def constant_truth(self, condition):
+        value = self.constant_value(condition)
+        if value is None:
+            return None
+        return bool(value)
+    
+    def inline_block(self, node, body):
+        if any(isinstance(statement, DECLARATIONS) for statement in body):
+            node.condition = NumberLiteral(1)
+            node.if_body = body
+            node.elif_parts = []
+            node.else_body = None
+            return node
+        return list(body)
+    
+    def visit_IfStatement(self, node):
+        self.generic_visit(node)
+        
+        live = []
+        else_body = node.else_body
+        
+        for condition, body in [(node.condition, node.if_body)] + list(node.elif_parts):
+            truth = self.constant_truth(condition)
+            if truth is None:
+                live.append((condition, body))
+            elif truth:
+                else_body = body
+                break
+        
+        if not live:
+            return self.inline_block(node, else_body or [])
+        
+        node.condition, node.if_body = live[0]
+        node.elif_parts = live[1:]
+        node.else_body = else_body
+        return node
+    
+    def visit_WhileStatement(self, node):
+        self.generic_visit(node)
+        
+        if self.constant_truth(node.condition) is False:
+            return None
+        return node
+
+
+class SideEffectScanner(NodeVisitor):
+    def __init__(self):
+        self.found = False
+    
+    def visit_FunctionCall(self, node):
+        self.found = True
+    
+    def visit_InptCall(self, node):
+        self.found = True
+
+
+def has_side_effects(node):
+    scanner = SideEffectScanner()
+    scanner.visit_value(node)
+    return scanner.found
+
+
+class UsageScanner(NodeVisitor):
+    def __init__(self):
+        self.reads = {}
+        self.blocked = set()
+        self.callees = set()
+    
+    def read(self, name):
+        self.reads[name] = self.reads.get(name, 0) + 1
+    
+    def visit_Identifier(self, node):
+        self.read(node.name)
+    
+    def visit_FunctionCall(self, node):
+        self.callees.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_CallStatement(self, node):
+        self.callees.add(node.func_name)
+        self.generic_visit(node)
+    
+    def visit_StringLiteral(self, node):
+        for name in INTERPOLATION.findall(node.value):
+            self.read(name.split('.')[0])
+    
+    def visit_ArrayAccess(self, node):
+        self.read(node.name)
+        self.generic_visit(node)
+    
+    def visit_StructAccess(self, node):
+        self.read(node.struct_name)
+    
+    def visit_StructFieldAssignment(self, node):
+        self.read(node.struct_name)
+        self.generic_visit(node)
+    
+    def visit_PointerAssignment(self, node):
+        self.read(node.pointer)
+        self.generic_visit(node)
+    
+    def visit_ConvertStatement(self, node):
+        if isinstance(node.expression, Identifier):
+            self.blocked.add(node.expression.name)
+        self.generic_visit(node)
+    
+    def visit_ForStatement(self, node):
+        self.read(node.iterable)
+        self.blocked.add(node.counter.name if isinstance(node.counter, VarDeclaration) else node.counter)
+        self.generic_visit(node)
+    
+    def visit_Assignment(self, node):
+        if has_side_effects(node.value):
+            self.blocked.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_ArrayAssignment(self, node):
+        if has_side_effects(node.index) or has_side_effects(node.value):
+            self.blocked.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_VarDeclaration(self, node):
+        if has_side_effects(node.value):
+            self.blocked.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_ArrayDeclaration(self, node):
+        if has_side_effects(node.elements):
+            self.blocked.add(node.name)
+        self.generic_visit(node)
+
+
+class DeclarationCollector(NodeVisitor):
+    def __init__(self):
+        self.names = set()
+    
+    def visit_VarDeclaration(self, node):
+        self.names.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_ArrayDeclaration(self, node):
+        self.names.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_ForStatement(self, node):
+        self.visit_value(node.body)
+
+
+class DeadCodeEliminator(NodeTransformer):
+    def __init__(self):
+        self.stats = {
+            "unreachable_statements": 0,
+            "unused_variables": 0,
+            "dead_stores": 0,
+            "empty_loops": 0,
+            "empty_branches": 0,
+        }
+        self.dead = set()
+        self.reads = {}
+        self.changed = False
+        self.callees = {}
+    
+    def eliminate_function(self, function):
+        while True:
+            scanner = UsageScanner()
+            scanner.visit_value(function.body)
+            self.reads = scanner.reads
+            self.dead = set()
+            self.changed = False
+            
+            for name in self.declared_names(function.body):
+                if name not in scanner.reads and name not in scanner.blocked and name not in function.params:
+                    self.dead.add(name)
+            
+            function.body = self.transform_value(function.body)
+            if not self.changed:
+                self.callees[function.name] = scanner.callees
+                return function
+    
+    def declared_names(self, body):
+        collector = DeclarationCollector()
+        collector.visit_value(body)
+        return collector.names
+    
+    def transform_value(self, value):
+        value = super().transform_value(value)
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                if isinstance(item, TERMINATORS) and index + 1 < len(value):
+                    self.stats["unreachable_statements"] += len(value) - index - 1
+                    self.changed = True
+                    return value[:index + 1]
+        return value
+    
+    def remove(self, counter):
+        self.stats[counter] += 1
+        self.changed = True
+        return None
+    
+    def visit_VarDeclaration(self, node):
+        if node.name in self.dead:
+            return self.remove("unused_variables")
+        return node
+    
+    def visit_ArrayDeclaration(self, node):
+        if node.name in self.dead:
+            return self.remove("unused_variables")
+        return node
+    
+    def visit_Assignment(self, node):
+        if node.name in self.dead:
+            return self.remove("dead_stores")
+        return node
+    
+    def visit_ArrayAssignment(self, node):
+        if node.name in self.dead:
+            return self.remove("dead_stores")
+        return node
+    
+    def visit_IncrementStatement(self, node):
+        if node.name in self.dead:
+            return self.remove("dead_stores")
+        return node
+    
+    def visit_DecrementStatement(self, node):
+        if node.name in self.dead:
+            return self.remove("dead_stores")
+        return node
+    
+    def visit_WhileStatement(self, node):
+        self.generic_visit(node)
+        if node.body or has_side_effects(node.condition):
+            return node
+        if type(node.condition) in (NumberLiteral, FloatLiteral):
+            return node
+        return self.remove("empty_loops")
+    
+    def visit_ForStatement(self, node):
+        node.body = self.transform_value(node.body)
+        if node.body or not isinstance(node.counter, VarDeclaration):
+            return node
+        if has_side_effects(node.condition) or has_side_effects(node.counter.value):
+            return node
+        scanner = UsageScanner()
+        scanner.visit_value(node.condition)
+        if scanner.reads.get(node.counter.name, 0) < self.reads.get(node.counter.name, 0):
+            return node
+        return self.remove("empty_loops")
+    
+    def visit_IfStatement(self, node):
+        self.generic_visit(node)
+        
+        if node.else_body is not None and not node.else_body:
+            node.else_body = None
+            self.stats["empty_branches"] += 1
+            self.changed = True
+        
+        if node.else_body is None:
+            while node.elif_parts and not node.elif_parts[-1][1] and not has_side_effects(node.elif_parts[-1][0]):
+                node.elif_parts = node.elif_parts[:-1]
+                self.stats["empty_branches"] += 1
+                self.changed = True
+            
+            if not node.elif_parts and not node.if_body and not has_side_effects(node.condition):
+                return self.remove("empty_branches")
+        
+        return node
+    
+    def visit_SwitchStatement(self, node):
+        self.generic_visit(node)
+        
+        if node.default_body or has_side_effects(node.expression):
+            return node
+        if any(case.body for case in node.cases):
+            return node
+        return self.remove("empty_branches")
+
+
+def copy_location(node, source):
+    if hasattr(source, 'line_number'):
+        node.line_number = source.line_number
+        node.source_lines = source.source_lines
+    return node
+
+
+def clone_node(value):
+    if isinstance(value, ASTNode):
+        node = object.__new__(type(value))
+        for name in ASTNode.__slots__:
+            if hasattr(value, name):
+                setattr(node, name, getattr(value, name))
+        for name in type(value).__slots__:
+            if hasattr(value, name):
+                setattr(node, name, clone_node(getattr(value, name)))
+        return node
+    elif isinstance(value, list):
+        return [clone_node(item) for item in value]
+    elif isinstance(value, tuple):
+        return tuple(clone_node(item) for item in value)
+    elif isinstance(value, dict):
+        return {key: clone_node(item) for key, item in value.items()}
+    return value
+
+
+class InlineScanner(NodeVisitor):
+    def __init__(self, params):
+        self.params = set(params)
+        self.size = 0
+        self.blocked = False
+        self.loop_depth = 0
+        self.uses = {param: 0 for param in params}
+        self.looped = set()
+        self.named = set()
+        self.locals = {}
+        self.arrays = set()
+        self.interpolated = set()
+    
+    def visit(self, node):
+        self.size += 1
+        return NodeVisitor.visit(self, node)
+    
+    def block(self, node):
+        self.blocked = True
+    
+    visit_ReturnStatement = block
+    visit_ForStatement = block
+    visit_ConvertStatement = block
+    visit_ConvertExpression = block
+    visit_PointerAssignment = block
+    visit_AddressOf = block
+    visit_Dereference = block
+    
+    def name_use(self, name):
+        if name in self.params:
+            self.named.add(name)
+    
+    def store(self, name):
+        if name in self.params:
+            self.blocked = True
+    
+    def declare(self, name, local_type):
+        if name in self.params or name in self.locals:
+            self.blocked = True
+        self.locals[name] = local_type
+    
+    def loop(self, node):
+        self.loop_depth += 1
+        self.generic_visit(node)
+        self.loop_depth -= 1
+    
+    visit_WhileStatement = loop
+    visit_InfStatement = loop
+    
+    def jump(self, node):
+        if not self.loop_depth:
+            self.blocked = True
+    
+    visit_BreakStatement = jump
+    visit_ContinueStatement = jump
+    visit_StopStatement = jump
+    
+    def visit_Identifier(self, node):
+        if node.name in self.params:
+            self.uses[node.name] += 1
+            if self.loop_depth:
+                self.looped.add(node.name)
+    
+    def visit_ArrayAccess(self, node):
+        self.name_use(node.name)
+        self.generic_visit(node)
+    
+    def visit_StructAccess(self, node):
+        self.name_use(node.struct_name)
+    
+    def visit_PrintStatement(self, node):
+        values = node.value if isinstance(node.value, list) else [node.value]
+        for value in values:
+            if isinstance(value, StringLiteral):
+                for name in INTERPOLATION.findall(value.value):
+                    name = name.split('.')[0]
+                    self.name_use(name)
+                    self.interpolated.add(name)
+            elif isinstance(value, Identifier):
+                self.name_use(value.name)
+        self.generic_visit(node)
+    
+    def visit_Assignment(self, node):
+        self.store(node.name)
+        self.generic_visit(node)
+    
+    def visit_ArrayAssignment(self, node):
+        self.store(node.name)
+        self.generic_visit(node)
+    
+    def visit_StructFieldAssignment(self, node):
+        self.store(node.struct_name)
+        self.generic_visit(node)
+    
+    def visit_IncrementStatement(self, node):
+        self.store(node.name)
+    
+    def visit_DecrementStatement(self, node):
+        self.store(node.name)
+    
+    def visit_VarDeclaration(self, node):
+        self.declare(node.name, node.var_type)
+        self.generic_visit(node)
+    
+    def visit_ArrayDeclaration(self, node):
+        self.declare(node.name, node.array_type)
+        self.arrays.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_StructVarDeclaration(self, node):
+        self.declare(node.name, node.struct_type)
+        self.generic_visit(node)
+
+
+class InlineCandidate:
+    def __init__(self, function, body, result, scanner):
+        self.name = function.name
+        self.params = list(function.params)
+        self.body = body
+        self.result = result
+        self.uses = scanner.uses
+        self.looped = scanner.looped
+        self.named = scanner.named
+        self.locals = scanner.locals
+        self.arrays = scanner.arrays
+
+
+class InlineRenamer(NodeTransformer):
+    def __init__(self, names, arguments):
+        self.names = names
+        self.arguments = arguments
+    
+    def rename(self, name):
+        return self.names.get(name, name)
+    
+    def visit_Identifier(self, node):
+        if node.name in self.arguments:
+            return clone_node(self.arguments[node.name])
+        node.name = self.rename(node.name)
+        return node
+    
+    def visit_ArrayAccess(self, node):
+        node.name = self.rename(node.name)
+        return self.generic_visit(node)
+    
+    def visit_StructAccess(self, node):
+        node.struct_name = self.rename(node.struct_name)
+        return node
+    
+    def visit_PrintStatement(self, node):
+        values = node.value if isinstance(node.value, list) else [node.value]
+        for value in values:
+            if isinstance(value, StringLiteral):
+                value.value = INTERPOLATION.sub(self.rename_interpolation, value.value)
+        return self.generic_visit(node)
+    
+    def rename_interpolation(self, match):
+        parts = match.group(1).split('.')
+        parts[0] = self.rename(parts[0])
+        return '*' + '.'.join(parts) + '*'
+    
+    def rename_node(self, node):
+        node.name = self.rename(node.name)
+        return self.generic_visit(node)
+    
+    visit_Assignment = rename_node
+    visit_ArrayAssignment = rename_node
+    visit_IncrementStatement = rename_node
+    visit_DecrementStatement = rename_node
+    visit_VarDeclaration = rename_node
+    visit_ArrayDeclaration = rename_node
+    visit_StructVarDeclaration = rename_node
+    
+    def visit_StructFieldAssignment(self, node):
+        node.struct_name = self.rename(node.struct_name)
+        return self.generic_visit(node)
+
+
+class Inliner(NodeTransformer):
+    def __init__(self, callees, inference, threshold=INLINE_THRESHOLD):
+        self.callees = callees
+        self.inference = inference
+        self.summaries = inference.summaries
+        self.threshold = threshold
+        self.candidates = {}
+        self.inlined = 0
+        self.counter = 0
+    
+    def add_candidate(self, function):
+        if function.name == "main" or len(set(function.params)) != len(function.params):
+            return
+        if any(function.name in reachable_functions(self.callees, callee) for callee in self.callees.get(function.name, ())):
+            return
+        
+        body = list(function.body)
+        result = None
+        if body and isinstance(body[-1], ReturnStatement):
+            result = body.pop().value
+        
+        scanner = InlineScanner(function.params)
+        scanner.visit_value(body)
+        if result is not None:
+            scanner.visit(result)
+        if scanner.blocked or scanner.size > self.threshold:
+            return
+        if any(name not in scanner.params and name not in scanner.locals for name in scanner.interpolated):
+            return
+        
+        self.candidates[function.name] = InlineCandidate(function, clone_node(body), clone_node(result), scanner)
+    
+    def inline_function(self, function):
+        inlined = self.inlined
+        self.counter = 0
+        env, arrays = self.inference.environment(function.name)
+        self.env = env
+        self.arrays = set(arrays)
+        function.body = self.transform_value(function.body)
+        return self.inlined != inlined
+    
+    def bind_arguments(self, candidate, arguments):
+        if len(arguments) != len(candidate.params):
+            return None
+        
+        param_types = self.summaries[candidate.name].final_param_types()
+        names = {}
+        substitutions = {}
+        
+        for param, argument in zip(candidate.params, arguments):
+            if isinstance(argument, Identifier) and argument.name not in self.arrays:
+                if self.inference.expression_type(argument, self.env, self.arrays) != param_types[param]:
+                    return None
+                names[param] = argument.name
+                continue
+            
+            if param in candidate.named or has_side_effects(argument):
+                return None
+            if isinstance(argument, StringLiteral) and INTERPOLATION.search(argument.value):
+                return None
+            if candidate.uses[param] == 0:
+                continue
+            if self.inference.expression_type(argument, self.env, self.arrays) != param_types[param]:
+                return None
+            if not isinstance(argument, LITERALS) and (candidate.uses[param] > 1 or param in candidate.looped):
+                return None
+            substitutions[param] = argument
+        
+        self.counter += 1
+        for name, local_type in candidate.locals.items():
+            names[name] = f"__inl{self.counter}_{INLINED_NAME.sub('', name)}"
+            self.env[names[name]] = local_type
+            if name in candidate.arrays:
+                self.arrays.add(names[name])
+        
+        return InlineRenamer(names, substitutions)
+    
+    def expand(self, name, arguments, needs_value):
+        candidate = self.candidates.get(name)
+        if candidate is None or (needs_value and candidate.result is None):
+            return None
+        
+        renamer = self.bind_arguments(candidate, arguments)
+        if renamer is None:
+            return None
+        
+        body = renamer.transform_value(clone_node(candidate.body))
+        result = renamer.transform_value(clone_node(candidate.result))
+        self.inlined += 1
+        return body, result
+    
+    def visit_FunctionCall(self, node):
+        self.generic_visit(node)
+        candidate = self.candidates.get(node.name)
+        if candidate is None or candidate.body:
+            return node
+        
+        expansion = self.expand(node.name, node.arguments, True)
+        if expansion is None:
+            return node
+        return expansion[1]
+    
+    def expand_statement(self, node):
+        self.generic_visit(node)
+        if not isinstance(node.value, FunctionCall):
+            return node
+        
+        expansion = self.expand(node.value.name, node.value.arguments, not isinstance(node, ReturnStatement))
+        if expansion is None:
+            return node
+        
+        body, result = expansion
+        node.value = result
+        return body + [node]
+    
+    visit_VarDeclaration = expand_statement
+    visit_Assignment = expand_statement
+    visit_ReturnStatement = expand_statement
+    
+    def visit_CallStatement(self, node):
+        self.generic_visit(node)
+        candidate = self.candidates.get(node.func_name)
+        if candidate is None or (candidate.result is not None and has_side_effects(candidate.result) and not isinstance(candidate.result, FunctionCall)):
+            return node
+        
+        expansion = self.expand(node.func_name, node.arguments, False)
+        if expansion is None:
+            return node
+        
+        body, result = expansion
+        if isinstance(result, FunctionCall):
+            body.append(copy_location(CallStatement(result.name, result.arguments), node))
+        return body
+    
+    def visit_PrintStatement(self, node):
+        if isinstance(node.value, list):
+            node.value = [self.print_value(value) for value in node.value]
+        else:
+            node.value = self.print_value(node.value)
+        return node
+    
+    def print_value(self, value):
+        if isinstance(value, FunctionCall):
+            value.arguments = self.transform_value(value.arguments)
+            return value
+        return self.transform_value(value)
+    
+    def visit_ForStatement(self, node):
+        if isinstance(node.counter, VarDeclaration):
+            node.counter.value = self.transform_value(node.counter.value)
+        if node.condition is not None:
+            node.condition = self.transform_value(node.condition)
+        node.body = self.transform_value(node.body)
+        return node
+
+
+class LoopScanner(NodeVisitor):
+    def __init__(self):
+        self.modified = set()
+        self.escaping = set()
+    
+    def modify(self, node):
+        self.modified.add(node.name)
+        self.generic_visit(node)
+    
+    visit_Assignment = modify
+    visit_ArrayAssignment = modify
+    visit_IncrementStatement = modify
+    visit_DecrementStatement = modify
+    visit_VarDeclaration = modify
+    visit_ArrayDeclaration = modify
+    visit_StructVarDeclaration = modify
+    
+    def visit_StructFieldAssignment(self, node):
+        self.modified.add(node.struct_name)
+        self.generic_visit(node)
+    
+    def visit_ConvertStatement(self, node):
+        if isinstance(node.expression, Identifier):
+            self.modified.add(node.expression.name)
+        self.generic_visit(node)
+    
+    def visit_ForStatement(self, node):
+        self.modified.add(node.counter.name if isinstance(node.counter, VarDeclaration) else node.counter)
+        self.generic_visit(node)
+    
+    def escape(self, node):
+        for argument in node.arguments:
+            if isinstance(argument, Identifier):
+                self.escaping.add(argument.name)
+        self.generic_visit(node)
+    
+    visit_FunctionCall = escape
+    visit_CallStatement = escape
+    visit_CCallStatement = escape
+
+
+class InvariantScanner(NodeVisitor):
+    def __init__(self):
+        self.names = set()
+        self.blocked = False
+        self.floats = False
+    
+    def visit_Identifier(self, node):
+        self.names.add(node.name)
+    
+    def visit_ArrayAccess(self, node):
+        self.names.add(node.name)
+        self.generic_visit(node)
+    
+    def visit_StructAccess(self, node):
+        self.names.add(node.struct_name)
+    
+    def visit_FloatLiteral(self, node):
+        self.floats = True
+    
+    def block(self, node):
+        self.blocked = True
+    
+    visit_InptCall = block
+    visit_ConvertExpression = block
+    visit_Dereference = block
+    visit_AddressOf = block
+
+
+class InvariantHoister(NodeTransformer):
+    def __init__(self, motion, loop, modified):
+        self.motion = motion
+        self.loop = loop
+        self.modified = modified
+        self.speculative = False
+        self.declarations = []
+    
+    def hoist_loop(self):
+        loop = self.loop
+        if getattr(loop, 'condition', None) is not None:
+            loop.condition = self.transform_value(loop.condition)
+        self.speculative = True
+        loop.body = self.transform_value(loop.body)
+        return self.declarations
+    
+    def hoist(self, node):
+        scanner = InvariantScanner()
+        scanner.visit(node)
+        if scanner.blocked or scanner.names & self.modified:
+            return None
+        
+        effect, speculatable = self.motion.effects.scan(node)
+        if effect != PURE or (self.speculative and not speculatable):
+            return None
+        
+        expr_type = self.motion.inference.expression_type(node, self.motion.env, self.motion.arrays)
+        if expr_type not in HOISTED_TYPES or (expr_type == "float" and scanner.floats):
+            return None
+        
+        declaration = self.motion.temporary(expr_type, node, self.loop)
+        self.declarations.append(declaration)
+        return Identifier(declaration.name)
+    
+    def hoist_expression(self, node):
+        hoisted = self.hoist(node)
+        if hoisted is not None:
+            return hoisted
+        return self.generic_visit(node)
+    
+    visit_FunctionCall = hoist_expression
+    visit_FindCall = hoist_expression
+    visit_StructAccess = hoist_expression
+    visit_ArrayAccess = hoist_expression
+    
+    def visit_BinaryOp(self, node):
+        hoisted = self.hoist(node)
+        if hoisted is not None:
+            return hoisted
+        
+        node.left = self.transform_value(node.left)
+        speculative = self.speculative
+        if node.operator in SHORT_CIRCUIT:
+            self.speculative = True
+        node.right = self.transform_value(node.right)
+        self.speculative = speculative
+        return node
+    
+    def visit_PrintStatement(self, node):
+        if isinstance(node.value, list):
+            node.value = [self.print_value(value) for value in node.value]
+        else:
+            node.value = self.print_value(node.value)
+        return node
+    
+    def print_value(self, value):
+        if isinstance(value, (FunctionCall, BinaryOp)):
+            return self.generic_visit(value)
+        return self.transform_value(value)
+    
+    def keep(self, node):
+        return node
+    
+    visit_InptCall = keep
+    visit_ConvertExpression = keep
+    visit_ConvertStatement = keep
+
+
+class LoopInvariantMotion(NodeTransformer):
+    def __init__(self, effects, inference):
+        self.effects = effects
+        self.inference = inference
+        self.hoisted = 0
+    
+    def hoist_function(self, function):
+        env, arrays = self.inference.environment(function.name)
+        self.env = env
+        self.arrays = arrays
+        self.counter = 0
+        
+        scanner = AddressScanner()
+        scanner.visit_value(function.body)
+        self.address_taken = scanner.names
+        
+        function.body = self.transform_value(function.body)
+        return function
+    
+    def temporary(self, expr_type, value, loop):
+        self.counter += 1
+        self.hoisted += 1
+        name = f"__licm{self.counter}"
+        self.env[name] = expr_type
+        
+        return copy_location(VarDeclaration(expr_type, name, value), loop)
+    
+    def visit_loop(self, node):
+        self.generic_visit(node)
+        
+        scanner = LoopScanner()
+        scanner.visit(node)
+        modified = scanner.modified
+        if self.effects.scan(node)[0] == WRITES:
+            modified = modified | scanner.escaping | self.address_taken
+        
+        declarations = InvariantHoister(self, node, modified).hoist_loop()
+        if not declarations:
+            return node
+        return declarations + [node]
+    
+    visit_WhileStatement = visit_loop
+    visit_ForStatement = visit_loop
+    visit_InfStatement = visit_loop
+
+
+class TailCallEliminator(NodeTransformer):
+    def __init__(self, inference):
+        self.summaries = inference.summaries
+        self.eliminated = 0
+    
+    def eliminate_function(self, function):
+        params = function.params
+        if len(set(params)) != len(params) or function.name not in self.summaries:
+            return function
+        self.param_types = self.summaries[function.name].final_param_types()
+        if any(self.param_types.get(param) not in HOISTED_TYPES for param in params):
+            return function
+        
+        scanner = AddressScanner()
+        scanner.visit_value(function.body)
+        if scanner.names:
+            return function
+        
+        self.function = function
+        self.counter = 0
+        body = self.transform_value(function.body)
+        if self.summaries[function.name].final_return_type() == "void":
+            self.tail_calls(body)
+        if self.counter == 0:
+            return function
+        
+        if not body or not isinstance(body[-1], TERMINATORS):
+            body.append(copy_location(BreakStatement(), function))
+        function.body = [copy_location(InfStatement(body), function)]
+        return function
+    
+    def visit_ReturnStatement(self, node):
+        call = node.value
+        if not isinstance(call, FunctionCall) or call.name != self.function.name or len(call.arguments) != len(self.function.params):
+            return node
+        
+        return self.jump(call.arguments, node)
+    
+    def tail_calls(self, body):
+        last = body[-1] if body else None
+        if isinstance(last, CallStatement) and last.func_name == self.function.name and len(last.arguments) == len(self.function.params):
+            body[-1:] = self.jump(last.arguments, last)
+        elif isinstance(last, IfStatement):
+            for part in [last.if_body] + [part for _, part in last.elif_parts] + [last.else_body]:
+                if part:
+                    self.tail_calls(part)
+        elif isinstance(last, SwitchStatement):
+            for case in last.cases:
+                self.tail_calls(case.body)
+            if last.default_body:
+                self.tail_calls(last.default_body)
+    
+    def jump(self, arguments, node):
+        self.counter += 1
+        self.eliminated += 1
+        return self.rebind(arguments, node) + [copy_location(ContinueStatement(), node)]
+    
+    def rebind(self, arguments, node):
+        changed = [(param, argument) for param, argument in zip(self.function.params, arguments)
+                   if not (isinstance(argument, Identifier) and argument.name == param)]
+        
+        reads = {}
+        for param, argument in changed:
+            scanner = UsageScanner()
+            scanner.visit(argument)
+            reads[param] = scanner.reads
+        
+        saved = []
+        direct = []
+        for param, argument in changed:
+            if any(param in reads[other] for other, _ in changed if other != param):
+                saved.append((param, argument))
+            else:
+                direct.append((param, argument))
+        
+        statements = []
+        for param, argument in saved:
+            name = f"__tail{self.counter}_{param}"
+            statements.append(copy_location(VarDeclaration(self.param_types[param], name, argument), node))
+        for param, argument in direct:
+            statements.append(copy_location(Assignment(param, argument), node))
+        for param, _ in saved:
+            statements.append(copy_location(Assignment(param, Identifier(f"__tail{self.counter}_{param}")), node))
+        return statements
+    
+    def visit_loop(self, node):
+        return node
+    
+    visit_WhileStatement = visit_loop
+    visit_ForStatement = visit_loop
+    visit_InfStatement = visit_loop
+
+
+class Pass:
+    def __init__(self, name, level, run, requires=(), invalidates=(), requires_passes=()):
+        self.name = name
+        self.level = level
+        self.run = run
+        self.requires = requires
+        self.invalidates = invalidates
+        self.requires_passes = requires_passes
+
+
+class NodeCounter(NodeVisitor):
+    def __init__(self):
+        self.count = 0
+    
+    def visit(self, node):
+        self.count += 1
+        return NodeVisitor.visit(self, node)
+
+
+def count_nodes(value):
+    counter = NodeCounter()
+    counter.visit_value(value)
+    return counter.count
+
+
+class PassManager:
+    def __init__(self, level=DEFAULT_OPT_LEVEL, timing=False):
+        self.level = level
+        self.timing = timing
+        self.passes = []
+        self.analyses = {}
+        self.results = {}
+        self.executed = []
+        self.skipped = []
+        self.timings = []
+    
+    def register_analysis(self, name, build):
+        self.analyses[name] = build
+    
+    def register(self, name, level, run, requires=(), invalidates=ANALYSES, requires_passes=()):
+        for analysis in requires:
+            if analysis not in self.analyses:
+                raise ValueError(f"Pass '{name}' requires unknown analysis '{analysis}'")
+        registered = [optimization_pass.name for optimization_pass in self.passes]
+        for prerequisite in requires_passes:
+            if prerequisite not in registered:
+                raise ValueError(f"Pass '{name}' requires pass '{prerequisite}', which must be registered before it")
+        self.passes.append(Pass(name, level, run, requires, invalidates, requires_passes))
+    
+    def analysis(self, name):
+        if name not in self.results:
+            start = time.perf_counter()
+            self.results[name] = self.analyses[name]()
+            self.timings.append((f"[{name}]", time.perf_counter() - start, None, None))
+        return self.results[name]
+    
+    def run(self, target):
+        for optimization_pass in self.passes:
+            if optimization_pass.level > self.level:
+                continue
+            
+            missing = [name for name in optimization_pass.requires_passes if name not in self.executed]
+            if missing:
+                self.skipped.append((optimization_pass.name, missing))
+                continue
+            
+            for analysis in optimization_pass.requires:
+                self.analysis(analysis)
+            
+            nodes_before = count_nodes(target.functions) if self.timing else None
+            start = time.perf_counter()
+            optimization_pass.run()
+            elapsed = time.perf_counter() - start
+            nodes_after = count_nodes(target.functions) if self.timing else None
+            
+            self.executed.append(optimization_pass.name)
+            self.timings.append((optimization_pass.name, elapsed, nodes_before, nodes_after))
+            for analysis in optimization_pass.invalidates:
+                self.results.pop(analysis, None)
+    
+    def timing_report(self):
+        lines = []
+        total = 0.0
+        for name, elapsed, nodes_before, nodes_after in self.timings:
+            total += elapsed
+            line = f"{name:<16} {elapsed * 1000:>10.3f} ms"
+            if nodes_before is not None:
+                line += f"  {nodes_before:>8} -> {nodes_after} nodes"
+            lines.append(line)
+        lines.append(f"{'total':<16} {total * 1000:>10.3f} ms")
+        for name, missing in self.skipped:
+            lines.append(f"{name:<16} skipped: requires pass {', '.join(missing)}")
+        return lines
 
 
 class Optimizer:
-    def __init__(self, ast):
+    def __init__(self, ast, stdlib_imports=None, function_summaries=None, level=DEFAULT_OPT_LEVEL, timing=False):
         self.ast = ast
+        self.stdlib_imports = stdlib_imports or []
+        self.function_summaries = dict(function_summaries or {})
+        self.level = level
+        self.functions = list(ast.functions)
+        self.stats = {}
+        self.pass_stats = {}
+        self.ir_functions = {}
+        self.folder = ConstantFolder()
+        self.eliminator = DeadCodeEliminator()
+        
+        self.manager = PassManager(level, timing)
+        self.manager.register_analysis("call_graph", self.call_graph)
+        self.manager.register_analysis("types", self.type_inference)
+        self.manager.register_analysis("effects", self.effects)
+        self.manager.register("fold", 1, self.fold_constants)
+        self.manager.register("dce", 1, self.eliminate_dead_code)
+        self.manager.register("tail_calls", 0, self.eliminate_tail_calls, requires=("types",))
+        self.manager.register("inline", 2, self.inline_functions, requires=("call_graph", "types"))
+        self.manager.register("tree_shake", 1, self.remove_unreachable_functions, requires=("call_graph",))
+        self.manager.register("licm", 2, self.hoist_loop_invariants, requires=("types", "effects"), invalidates=("types",))
+        self.manager.register("lower", 1, self.lower_functions, requires=("types",), invalidates=())
+        self.manager.register("copy_prop", 1, self.propagate_copies, invalidates=(), requires_passes=("lower",))
+        self.manager.register("strength_reduce", 2, self.reduce_strength, invalidates=(), requires_passes=("lower",))
+        self.manager.register("simplify", 1, self.simplify_arithmetic, invalidates=(), requires_passes=("lower",))
+        self.manager.register("cse", 1, self.eliminate_common_subexpressions, invalidates=(), requires_passes=("lower",))
     
     def optimize(self):
-        optimized_functions = []
+        self.manager.run(self)
         
-        for function in self.ast.functions:
-            if function.name == "main":
-                optimized_functions.append(self.optimize_main(function))
-            else:
-                optimized_functions.append(function)
+        if "dce" in self.manager.executed:
+            self.stats = dict(self.eliminator.stats)
+        self.stats.update(self.pass_stats)
         
-        optimized_program = Program(optimized_functions)
+        return self.program(self.functions)
+    
+    def fold_constants(self):
+        self.functions = [self.folder.fold_function(function) for function in self.functions]
+    
+    def eliminate_dead_code(self):
+        self.functions = [self.eliminator.eliminate_function(function) for function in self.functions]
+    
+    def eliminate_tail_calls(self):
+        eliminator = TailCallEliminator(self.manager.analysis("types"))
+        for function in self.functions:
+            eliminator.eliminate_function(function)
+        self.pass_stats["eliminated_tail_calls"] = eliminator.eliminated
+    
+    def inline_functions(self):
+        callees = self.manager.analysis("call_graph")
+        inliner = Inliner(callees, self.manager.analysis("types"), INLINE_THRESHOLDS[self.level])
+        functions_by_name = {function.name: function for function in self.functions}
+        
+        for name in call_order(callees, functions_by_name):
+            function = functions_by_name[name]
+            if inliner.inline_function(function):
+                self.folder.fold_function(function)
+                self.eliminator.eliminate_function(function)
+            inliner.add_candidate(function)
+        
+        self.pass_stats["inlined_calls"] = inliner.inlined
+    
+    def remove_unreachable_functions(self):
+        if not any(function.name == "main" for function in self.functions):
+            return
+        
+        reachable = reachable_functions(self.manager.analysis("call_graph"), "main")
+        self.pass_stats["unreachable_functions"] = len(self.functions) - len(reachable)
+        self.functions = [function for function in self.functions if function.name in reachable]
+    
+    def hoist_loop_invariants(self):
+        motion = LoopInvariantMotion(self.manager.analysis("effects"), self.manager.analysis("types"))
+        for function in self.functions:
+            motion.hoist_function(function)
+        self.pass_stats["hoisted_expressions"] = motion.hoisted
+    
+    def lower_functions(self):
+        summaries = self.manager.analysis("types").summaries
+        return_types = {name: summary.final_return_type() for name, summary in summaries.items()}
+        lowering = Lowering(return_types, self.struct_definitions(), stdlib_return_types(self.stdlib_imports))
+        
+        self.ir_functions = {}
+        for function in self.functions:
+            summary = summaries[function.name]
+            try:
+                self.ir_functions[function.name] = lowering.lower(function, summary.final_param_types(), summary.final_return_type())
+            except LoweringError:
+                continue
+        self.pass_stats["lowered_functions"] = len(self.ir_functions)
+    
+    def propagate_copies(self):
+        propagation = CopyPropagation()
+        for ir in self.ir_functions.values():
+            propagation.propagate_function(ir)
+        self.pass_stats["propagated_copies"] = propagation.propagated
+    
+    def reduce_strength(self):
+        reduction = StrengthReduction()
+        for ir in self.ir_functions.values():
+            reduction.reduce_function(ir)
+        self.pass_stats["reduced_inductions"] = reduction.reduced
+    
+    def simplify_arithmetic(self):
+        simplifier = AlgebraicSimplifier()
+        for ir in self.ir_functions.values():
+            simplifier.simplify_function(ir)
+        self.pass_stats["simplified_expressions"] = simplifier.simplified
+    
+    def eliminate_common_subexpressions(self):
+        elimination = CommonSubexpressionElimination()
+        for ir in self.ir_functions.values():
+            elimination.eliminate_function(ir)
+        self.pass_stats["eliminated_subexpressions"] = elimination.eliminated
+    
+    def program(self, functions):
+        optimized_program = Program(functions)
         
         if hasattr(self.ast, 'c_imports'):
             optimized_program.c_imports = self.ast.c_imports
@@ -27,17 +1356,20 @@ class Optimizer:
         
         return optimized_program
     
-    def optimize_main(self, function):
-        optimized_body = []
-        found_return = False
-        
-        for statement in function.body:
-            if found_return:
-                break
-            
-            optimized_body.append(statement)
-            
-            if isinstance(statement, ReturnStatement):
-                found_return = True
-        
-        return Function(function.name, function.params, optimized_body)
+    def call_graph(self):
+        return ProgramAnalyzer().analyze(self.program(self.functions)).callees
+    
+    def struct_definitions(self):
+        struct_definitions = {}
+        for struct in getattr(self.ast, 'structs', None) or []:
+            struct_definitions[struct.name] = struct.fields
+        return struct_definitions
+    
+    def type_inference(self):
+        inference = TypeInference(self.program(self.functions), self.struct_definitions(), stdlib_return_types(self.stdlib_imports), self.function_summaries)
+        inference.run()
+        self.function_summaries.update(inference.summaries)
+        return inference
+    
+    def effects(self):
+        return EffectAnalysis(self.functions, stdlib_effects(self.stdlib_imports))
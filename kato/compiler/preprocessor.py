@@ -1,7 +1,10 @@
 import os
+import hashlib
 from pathlib import Path
+from parser.ast import NodeVisitor
 from parser.errors import KatoSyntaxError, KatoWarning
-from parser.ast import CallStatement, IfStatement, WhileStatement, PrintStatement, ReturnStatement, VarDeclaration, Assignment, BinaryOp, InptCall, FunctionCall
+from .analysis import ProgramAnalyzer
+from .type_inference import TypeInference, FunctionSummary
 
 STDLIBS = {
     "filesystem": "compiler.std.filesystem",
@@ -9,8 +12,49 @@ STDLIBS = {
 }
 
 
+def stdlib_functions(stdlib_imports):
+    functions = {}
+    for stdlib_name in stdlib_imports:
+        if stdlib_name == "filesystem":
+            from compiler.std.filesystem import FILESYSTEM_FUNCTIONS
+            functions[stdlib_name] = FILESYSTEM_FUNCTIONS
+        elif stdlib_name == "os":
+            from compiler.std.os import OS_FUNCTIONS
+            functions[stdlib_name] = OS_FUNCTIONS
+    return functions
+
+
+def stdlib_return_types(stdlib_imports):
+    return_types = {}
+    for functions in stdlib_functions(stdlib_imports).values():
+        for func_name, func_info in functions.items():
+            return_types[func_name] = func_info["return_type"]
+    return return_types
+
+
+def stdlib_effects(stdlib_imports):
+    effects = {}
+    for functions in stdlib_functions(stdlib_imports).values():
+        for func_name, func_info in functions.items():
+            effects[func_name] = func_info["effects"]
+    return effects
+
+
+class CallRenamer(NodeVisitor):
+    def __init__(self, names):
+        self.names = names
+    
+    def visit_FunctionCall(self, node):
+        node.name = self.names.get(node.name, node.name)
+        self.generic_visit(node)
+    
+    def visit_CallStatement(self, node):
+        node.func_name = self.names.get(node.func_name, node.func_name)
+        self.generic_visit(node)
+
+
 class Preprocessor:
-    def __init__(self, main_file_path):
+    def __init__(self, main_file_path, cache=None):
         self.main_file_path = Path(main_file_path)
         self.base_dir = self.main_file_path.parent
         self.processed_files = set()
@@ -20,6 +64,14 @@ class Preprocessor:
         self.all_functions = []
         self.stdlib_imports = set()
         self.c_imports = set()
+        self.module_hashes = {}
+        self.module_cache = {}
+        self.summary_cache = {}
+        self.analysis_cache = {}
+        self.function_summaries = {}
+        self.support_functions = {}
+        self.export_paths = {}
+        self.cache = cache
     
     def process(self, source_code):
         imports = self.extract_imports(source_code)
@@ -41,10 +93,33 @@ class Preprocessor:
             else:
                 self.process_import(import_path)
         
+        self.link_support_functions()
+        
         source_without_imports = self.remove_imports(source_code)
         
         return source_without_imports, self.imported_functions, self.imported_function_return_types
     
+    def collect_dependencies(self, source_code):
+        dependencies = []
+        
+        for import_path in self.extract_imports(source_code):
+            if import_path in STDLIBS:
+                continue
+            kh_path = self.base_dir / import_path
+            if not kh_path.exists() or kh_path in dependencies:
+                continue
+            dependencies.append(kh_path)
+            
+            with open(kh_path, 'r', encoding='utf-8') as f:
+                kh_content = f.read()
+            
+            for export_info in self.parse_kh_file(kh_content, kh_path):
+                kato_path = kh_path.parent / export_info[2]
+                if kato_path.exists() and kato_path not in dependencies:
+                    dependencies.append(kato_path)
+        
+        return dependencies
+    
     def extract_imports(self, source_code):
         imports = []
         lines = source_code.split('\n')
@@ -138,17 +213,7 @@ class Preprocessor:
         
         self.processed_files.add(file_key)
         
-        with open(kato_path, 'r', encoding='utf-8') as f:
-            kato_content = f.read()
-        
-        from lexer.lexer import Lexer
-        from parser.parser import Parser
-        
-        lexer = Lexer(kato_content)
-        tokens = lexer.tokenize()
-        
-        parser = Parser(tokens, kato_content)
-        ast = parser.parse()
+        ast = self.load_module(kato_path)
         
         if export_type == 'struct':
             found = False
@@ -187,10 +252,12 @@ class Preprocessor:
                         )
                     
                     self.imported_functions[func.name] = func
+                    self.export_paths[func.name] = kato_path.resolve()
                     self.all_functions.append(func)
                     
-                    return_type = self.infer_return_type(func.body)
-                    self.imported_function_return_types[func.name] = return_type
+                    summaries = self.module_summaries(kato_path)
+                    self.function_summaries[func.name] = summaries[func.name]
+                    self.imported_function_return_types[func.name] = summaries[func.name].final_return_type()
                     
                     break
             
@@ -200,108 +267,102 @@ class Preprocessor:
                     1, 1
                 )
     
-    def check_unused_imports(self, ast, imported_functions, source_code):
-        used_stdlib = set()
-        used_functions = set()
+    def link_support_functions(self):
+        modules = {}
+        for func_name, kato_path in self.export_paths.items():
+            modules.setdefault(kato_path, []).append(func_name)
+        
+        taken = set(self.imported_functions)
+        for kato_path, exported in modules.items():
+            analysis = self.module_analysis(kato_path)
+            helpers = set()
+            for func_name in exported:
+                helpers |= analysis.reachable_from(func_name)
+            helpers -= set(exported) | {"main"}
+            if not helpers:
+                continue
+            
+            names = {}
+            for func_name in sorted(helpers):
+                support_name = f"{kato_path.stem}__{func_name}"
+                if support_name in taken:
+                    raise KatoSyntaxError(
+                        f"Helper function '{func_name}' from {kato_path.name} conflicts with '{support_name}'",
+                        1, 1
+                    )
+                taken.add(support_name)
+                names[func_name] = support_name
+            
+            renamer = CallRenamer(names)
+            summaries = self.module_summaries(kato_path)
+            module_functions = {function.name: function for function in self.load_module(kato_path).functions}
+            for func_name in exported:
+                renamer.visit(self.imported_functions[func_name])
+            for func_name, support_name in names.items():
+                function = module_functions[func_name]
+                renamer.visit(function)
+                function.name = support_name
+                self.support_functions[(kato_path, func_name)] = function
+                self.all_functions.append(function)
+                self.function_summaries[support_name] = summaries[func_name]
+    
+    def load_module(self, kato_path):
+        resolved_path = str(kato_path.resolve())
+        content_hash = self.module_hashes.get(resolved_path)
+        
+        if content_hash is None:
+            with open(kato_path, 'r', encoding='utf-8') as f:
+                kato_content = f.read()
+            content_hash = hashlib.sha256(kato_content.encode('utf-8')).hexdigest()
+            self.module_hashes[resolved_path] = content_hash
+            
+            cache_key = (resolved_path, content_hash)
+            if cache_key not in self.module_cache:
+                from lexer.lexer import Lexer
+                from parser.parser import Parser
+                
+                lexer = Lexer(kato_content)
+                parser = Parser(lexer.generate_tokens(), kato_content)
+                self.module_cache[cache_key] = parser.parse()
+        
+        return self.module_cache[(resolved_path, content_hash)]
+    
+    def module_summaries(self, kato_path):
+        ast = self.load_module(kato_path)
+        content_hash = self.module_hashes[str(kato_path.resolve())]
+        summaries = self.summary_cache.get(content_hash)
+        
+        if summaries is None:
+            stored = self.cache.load_summaries(content_hash) if self.cache is not None else None
+            if stored is not None:
+                summaries = {name: FunctionSummary.from_dict(data) for name, data in stored.items()}
+            else:
+                struct_definitions = {struct.name: struct.fields for struct in getattr(ast, 'structs', [])}
+                summaries = TypeInference(ast, struct_definitions, analysis=self.module_analysis(kato_path)).run()
+                if self.cache is not None:
+                    self.cache.store_summaries(content_hash, {name: summary.to_dict() for name, summary in summaries.items()})
+            self.summary_cache[content_hash] = summaries
         
-        stdlib_functions = {}
-        for stdlib_name in self.stdlib_imports:
-            if stdlib_name == "filesystem":
-                from compiler.std.filesystem import FILESYSTEM_FUNCTIONS
-                stdlib_functions[stdlib_name] = FILESYSTEM_FUNCTIONS
-            elif stdlib_name == "os":
-                from compiler.std.os import OS_FUNCTIONS
-                stdlib_functions[stdlib_name] = OS_FUNCTIONS
-        
-        def check_expr(expr):
-            if expr is None:
-                return
-            if isinstance(expr, list):
-                for item in expr:
-                    check_expr(item)
-            elif isinstance(expr, BinaryOp):
-                check_expr(expr.left)
-                check_expr(expr.right)
-            elif isinstance(expr, InptCall):
-                check_expr(expr.prompt)
-            elif isinstance(expr, FunctionCall):
-                func_name = expr.name
-                for stdlib_name, funcs in stdlib_functions.items():
-                    if func_name in funcs:
-                        used_stdlib.add(stdlib_name)
-                if func_name in imported_functions:
-                    used_functions.add(func_name)
-                if expr.arguments:
-                    for arg in expr.arguments:
-                        check_expr(arg)
-        
-        def check_stmt(statement):
-            if isinstance(statement, CallStatement):
-                func_name = statement.func_name
-                for stdlib_name, funcs in stdlib_functions.items():
-                    if func_name in funcs:
-                        used_stdlib.add(stdlib_name)
-                if func_name in imported_functions:
-                    used_functions.add(func_name)
-                if statement.arguments:
-                    for arg in statement.arguments:
-                        check_expr(arg)
-            elif isinstance(statement, IfStatement):
-                check_expr(statement.condition)
-                for stmt in statement.if_body:
-                    check_stmt(stmt)
-                for elif_condition, elif_body in statement.elif_parts:
-                    check_expr(elif_condition)
-                    for stmt in elif_body:
-                        check_stmt(stmt)
-                if statement.else_body:
-                    for stmt in statement.else_body:
-                        check_stmt(stmt)
-            elif isinstance(statement, WhileStatement):
-                check_expr(statement.condition)
-                for stmt in statement.body:
-                    check_stmt(stmt)
-            elif isinstance(statement, PrintStatement):
-                check_expr(statement.value)
-            elif isinstance(statement, ReturnStatement):
-                check_expr(statement.value)
-            elif isinstance(statement, VarDeclaration):
-                check_expr(statement.value)
-            elif isinstance(statement, Assignment):
-                check_expr(statement.value)
-        
-        for function in ast.functions:
-            for statement in function.body:
-                check_stmt(statement)
+        return summaries
+    
+    def module_analysis(self, kato_path):
+        ast = self.load_module(kato_path)
+        content_hash = self.module_hashes[str(kato_path.resolve())]
+        
+        if content_hash not in self.analysis_cache:
+            self.analysis_cache[content_hash] = ProgramAnalyzer().analyze(ast)
         
+        return self.analysis_cache[content_hash]
+    
+    def check_unused_imports(self, analysis, imported_functions, source_code):
         for stdlib_name in self.stdlib_imports:
-            if stdlib_name not in used_stdlib:
+            if stdlib_name not in analysis.used_stdlib:
                 line = self.import_lines.get(stdlib_name, 1)
                 warning = KatoWarning(f"Unused import: '{stdlib_name}'", line, 1, source_code)
                 print(warning.format_warning())
         
         for func_name in imported_functions.keys():
-            if func_name not in used_functions:
+            if func_name not in analysis.called_functions:
                 line = 1
                 warning = KatoWarning(f"Unused imported function: '{func_name}'", line, 1, source_code)
                 print(warning.format_warning())
-    
-    def infer_return_type(self, body):
-        from parser.ast import ReturnStatement, StringLiteral, CharLiteral, FloatLiteral, Identifier
-        
-        has_return_with_value = False
-        
-        for statement in body:
-            if isinstance(statement, ReturnStatement):
-                if statement.value:
-                    has_return_with_value = True
-                    if isinstance(statement.value, StringLiteral):
-                        return "string"
-                    elif isinstance(statement.value, CharLiteral):
-                        return "char"
-                    elif isinstance(statement.value, FloatLiteral):
-                        return "float"
-                    elif isinstance(statement.value, Identifier):
-                        return "int"
-        
-        return "void" if not has_return_with_value else "int"
@@ -1,6 +1,9 @@
+FILESYSTEM_HEADERS = ["stdio.h", "stdlib.h"]
+
 FILESYSTEM_FUNCTIONS = {
     "file_read": {
         "return_type": "string",
+        "effects": "reads",
         "params": ["string"],
         "c_code": """
 char* file_read(const char* filename) {
@@ -21,6 +24,7 @@ char* file_read(const char* filename) {
     },
     "file_write": {
         "return_type": "int",
+        "effects": "writes",
         "params": ["string", "string"],
         "c_code": """
 int file_write(const char* filename, const char* content) {
@@ -36,6 +40,7 @@ int file_write(const char* filename, const char* content) {
     },
     "file_append": {
         "return_type": "int",
+        "effects": "writes",
         "params": ["string", "string"],
         "c_code": """
 int file_append(const char* filename, const char* content) {
@@ -51,6 +56,7 @@ int file_append(const char* filename, const char* content) {
     },
     "file_exists": {
         "return_type": "int",
+        "effects": "reads",
         "params": ["string"],
         "c_code": """
 int file_exists(const char* filename) {
@@ -65,6 +71,7 @@ int file_exists(const char* filename) {
     },
     "file_delete": {
         "return_type": "int",
+        "effects": "writes",
         "params": ["string"],
         "c_code": """
 int file_delete(const char* filename) {
@@ -77,8 +84,9 @@ int file_delete(const char* filename) {
 def get_filesystem_includes():
     return ""
 
-def get_filesystem_functions():
+def get_filesystem_functions(used=None):
     code = ""
     for func_name, func_info in FILESYSTEM_FUNCTIONS.items():
-        code += func_info["c_code"] + "\n"
+        if used is None or func_name in used:
+            code += func_info["c_code"] + "\n"
     return code
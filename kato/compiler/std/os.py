@@ -1,6 +1,9 @@
+OS_HEADERS = ["stdio.h", "string.h", "stdlib.h"]
+
 OS_FUNCTIONS = {
     "os_kill": {
         "return_type": "int",
+        "effects": "writes",
         "params": ["int"],
         "c_code": """
 int os_kill(int pid) {
@@ -16,6 +19,7 @@ int os_kill(int pid) {
     },
     "os_list_processes": {
         "return_type": "string",
+        "effects": "reads",
         "params": [],
         "c_code": """
 char* os_list_processes() {
@@ -41,6 +45,7 @@ char* os_list_processes() {
     },
     "os_run": {
         "return_type": "int",
+        "effects": "writes",
         "params": ["string"],
         "c_code": """
 int os_run(const char* path) {
@@ -62,6 +67,7 @@ int os_run(const char* path) {
     },
     "os_process_exists": {
         "return_type": "int",
+        "effects": "reads",
         "params": ["int"],
         "c_code": """
 int os_process_exists(int pid) {
@@ -78,6 +84,7 @@ int os_process_exists(int pid) {
     },
     "os_get_pid": {
         "return_type": "int",
+        "effects": "none",
         "params": [],
         "c_code": """
 int os_get_pid() {
@@ -87,6 +94,7 @@ int os_get_pid() {
     },
     "os_system": {
         "return_type": "string",
+        "effects": "writes",
         "params": ["string"],
         "c_code": """
 char* os_system(const char* command) {
@@ -105,6 +113,7 @@ char* os_system(const char* command) {
     },
     "os_cmd": {
         "return_type": "string",
+        "effects": "writes",
         "params": ["string"],
         "c_code": """
 char* os_cmd(const char* command) {
@@ -125,6 +134,7 @@ char* os_cmd(const char* command) {
     },
     "os_is_admin": {
         "return_type": "int",
+        "effects": "reads",
         "params": [],
         "c_code": """
 int os_is_admin() {
@@ -141,6 +151,7 @@ int os_is_admin() {
     },
     "os_runas": {
         "return_type": "int",
+        "effects": "writes",
         "params": ["string"],
         "c_code": """
 int os_runas(const char* mode) {
@@ -167,8 +178,9 @@ int os_runas(const char* mode) {
 def get_os_includes():
     return ""
 
-def get_os_functions():
+def get_os_functions(used=None):
     code = ""
     for func_name, func_info in OS_FUNCTIONS.items():
-        code += func_info["c_code"] + "\n"
+        if used is None or func_name in used:
+            code += func_info["c_code"] + "\n"
     return code
@@ -0,0 +1,167 @@
+from collections import deque
+
+from parser.ast import (
+    StringLiteral, NumberLiteral, FloatLiteral, CharLiteral, Identifier, BinaryOp, ArrayAccess,
+    FunctionCall, ConvertExpression, FindCall, StructAccess
+)
+from .analysis import ProgramAnalyzer
+
+TYPE_RANK = {"int": 0, "float": 1, "char": 2, "string": 3}
+ARITHMETIC_OPERATORS = {"+", "-", "*", "/", "%", "//"}
+LITERAL_TYPES = {
+    NumberLiteral: "int",
+    FloatLiteral: "float",
+    CharLiteral: "char",
+    StringLiteral: "string",
+    FindCall: "int",
+}
+
+
+def join_types(current, new):
+    if new is None or new == current:
+        return current
+    if current is None:
+        return new
+    if TYPE_RANK[new] > TYPE_RANK[current]:
+        return new
+    return current
+
+
+class FunctionSummary:
+    def __init__(self, params, param_types=None, return_type=None, returns_value=False):
+        self.params = list(params)
+        self.param_types = dict(param_types) if param_types else {param: None for param in params}
+        self.return_type = return_type
+        self.returns_value = returns_value
+    
+    def final_param_types(self):
+        return {param: self.param_types.get(param) or "int" for param in self.params}
+    
+    def final_return_type(self):
+        if not self.returns_value:
+            return "void"
+        return self.return_type or "int"
+    
+    def to_dict(self):
+        return {
+            "params": self.params,
+            "param_types": self.param_types,
+            "return_type": self.return_type,
+            "returns_value": self.returns_value,
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["params"], data["param_types"], data["return_type"], data["returns_value"])
+
+
+class TypeInference:
+    def __init__(self, program, struct_definitions=None, external_return_types=None, known_summaries=None, analysis=None):
+        self.functions = {function.name: function for function in program.functions}
+        self.struct_definitions = struct_definitions or {}
+        self.external_return_types = external_return_types or {}
+        self.analysis = analysis or ProgramAnalyzer().analyze(program)
+        self.summaries = {}
+        
+        for name, function in self.functions.items():
+            known = (known_summaries or {}).get(name)
+            if known is not None and known.params == list(function.params):
+                self.summaries[name] = FunctionSummary(known.params, known.param_types, known.return_type, known.returns_value)
+            else:
+                self.summaries[name] = FunctionSummary(function.params)
+    
+    def run(self):
+        worklist = deque(self.functions)
+        queued = set(worklist)
+        
+        while worklist:
+            name = worklist.popleft()
+            queued.discard(name)
+            
+            for changed in self.update(name):
+                if changed not in queued:
+                    queued.add(changed)
+                    worklist.append(changed)
+        
+        return self.summaries
+    
+    def environment(self, name):
+        facts = self.analysis.functions[name]
+        env = dict(self.summaries[name].param_types)
+        env.update(facts.locals)
+        return env, facts.arrays
+    
+    def update(self, name):
+        summary = self.summaries[name]
+        facts = self.analysis.functions[name]
+        env, arrays = self.environment(name)
+        changed = []
+        
+        for callee, arguments in self.analysis.calls_from(name):
+            callee_summary = self.summaries.get(callee)
+            if callee_summary is None:
+                continue
+            updated = False
+            for param, argument in zip(callee_summary.params, arguments):
+                new_type = join_types(callee_summary.param_types[param], self.expression_type(argument, env, arrays))
+                if new_type != callee_summary.param_types[param]:
+                    callee_summary.param_types[param] = new_type
+                    updated = True
+            if updated:
+                changed.append(callee)
+        
+        return_type = summary.return_type
+        for value in facts.returns:
+            return_type = join_types(return_type, self.expression_type(value, env, arrays))
+        
+        returns_value = summary.returns_value or bool(facts.returns)
+        if name == "main":
+            return_type = "int"
+            returns_value = True
+        
+        if return_type != summary.return_type or returns_value != summary.returns_value:
+            summary.return_type = return_type
+            summary.returns_value = returns_value
+            changed.extend(self.analysis.callers_of(name))
+        
+        return changed
+    
+    def expression_type(self, expr, env, arrays=()):
+        expr_type = type(expr)
+        
+        if expr_type in LITERAL_TYPES:
+            return LITERAL_TYPES[expr_type]
+        elif expr_type is Identifier:
+            return self.scalar(env.get(expr.name))
+        elif expr_type is ArrayAccess:
+            element_type = self.scalar(env.get(expr.name))
+            if element_type == "string" and expr.name not in arrays:
+                return "char"
+            return element_type
+        elif expr_type is BinaryOp:
+            if expr.operator not in ARITHMETIC_OPERATORS:
+                return "int"
+            left = self.expression_type(expr.left, env, arrays)
+            right = self.expression_type(expr.right, env, arrays)
+            if left == "float" or right == "float":
+                return "float"
+            if left is None and right is None:
+                return None
+            return join_types(left, right) if "string" in (left, right) else "int"
+        elif expr_type is FunctionCall:
+            summary = self.summaries.get(expr.name)
+            if summary is not None:
+                return summary.return_type
+            return self.scalar(self.external_return_types.get(expr.name))
+        elif expr_type is ConvertExpression:
+            return self.scalar(expr.target_type)
+        elif expr_type is StructAccess:
+            fields = self.struct_definitions.get(env.get(expr.struct_name), {})
+            return self.scalar(fields.get(expr.field_name))
+        
+        return None
+    
+    def scalar(self, type_name):
+        if type_name in TYPE_RANK:
+            return type_name
+        return None
@@ -1,25 +1,137 @@
-from .tokens import tokens as token_map
+import re
+from bisect import bisect_right
+
+from .tokens import (
+    KIND_NAMES, KEYWORD_KINDS,
+    EOF, IDENTIFIER, NUMBER, FLOAT_NUMBER, STRING, CHAR, C_IMPORT, C_CALL,
+    LBRACE, RBRACE, LPAREN, RPAREN, LBRACKET, RBRACKET, SEMICOLON,
+    EQUALS, EQUAL_EQUAL, COMMA, COLON, ASTERISK, PLUS, PLUS_PLUS, MINUS, MINUS_MINUS,
+    SLASH, DOUBLE_SLASH, PERCENT, LESS, LESS_EQUAL, GREATER, GREATER_EQUAL,
+    NOT_EQUAL, AMPERSAND, AND, OR, DOT
+)
+
+
+ENGINES = ("regex", "scan")
+
+TOKEN_PATTERN = re.compile(r'''
+    (?P<ws>[ \t\r\n]+)
+  | (?P<double_slash>//)
+  | (?P<string>"(?:[^"\\\n]|\\[\s\S])*"|'(?:[^'\\\n]|\\[\s\S])*')
+  | (?P<number>\d+(?:\.\d*)?)
+  | (?P<c_name>c\.\w*)
+  | (?P<name>[^\W\d]\w*)
+  | (?P<operator>==|\+\+|--|<=|>=|!=|&&|\|\||[{}()\[\];=,:*+\-/%<>&.])
+  | (?P<quote>["'])
+  | (?P<unknown>[\s\S])
+''', re.VERBOSE)
+
+ESCAPE_PATTERN = re.compile(r'\\([\s\S])')
+
+NEWLINE_PATTERN = re.compile(r'\n')
+
+ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+OPERATORS = {
+    '{': LBRACE,
+    '}': RBRACE,
+    '(': LPAREN,
+    ')': RPAREN,
+    '[': LBRACKET,
+    ']': RBRACKET,
+    ';': SEMICOLON,
+    '=': EQUALS,
+    '==': EQUAL_EQUAL,
+    ',': COMMA,
+    ':': COLON,
+    '*': ASTERISK,
+    '+': PLUS,
+    '++': PLUS_PLUS,
+    '-': MINUS,
+    '--': MINUS_MINUS,
+    '/': SLASH,
+    '%': PERCENT,
+    '<': LESS,
+    '<=': LESS_EQUAL,
+    '>': GREATER,
+    '>=': GREATER_EQUAL,
+    '!=': NOT_EQUAL,
+    '&': AMPERSAND,
+    '&&': AND,
+    '||': OR,
+    '.': DOT,
+}
+
+COMMENT_AFTER = (SEMICOLON, LBRACE, RBRACE)
+
+
+class SourceBuffer:
+    __slots__ = ("text", "line_starts")
+    
+    def __init__(self, text):
+        self.text = text
+        self.line_starts = None
+    
+    def position(self, offset):
+        if self.line_starts is None:
+            self.line_starts = [0] + [m.end() for m in NEWLINE_PATTERN.finditer(self.text)]
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
 
 
 class Token:
-    def __init__(self, type, value, line, column):
-        self.type = type
-        self.value = value
-        self.line = line
-        self.column = column
+    __slots__ = ("kind", "start", "end", "buffer")
+    
+    def __init__(self, kind, start, end, buffer):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.buffer = buffer
+    
+    @property
+    def type(self):
+        return KIND_NAMES[self.kind]
+    
+    @property
+    def value(self):
+        if self.kind == EOF:
+            return None
+        text = self.buffer.text[self.start:self.end]
+        if self.kind == NUMBER:
+            return int(text)
+        if self.kind == FLOAT_NUMBER:
+            return float(text)
+        if text[0] in '"\'':
+            value = text[1:-1]
+            if '\\' in value:
+                value = ESCAPE_PATTERN.sub(lambda e: ESCAPES.get(e.group(1), e.group(1)), value)
+            return value
+        return text
+    
+    @property
+    def line(self):
+        return self.buffer.position(self.start)[0]
+    
+    @property
+    def column(self):
+        return self.buffer.position(self.start)[1]
     
     def __repr__(self):
-        return f"Token({self.type}, {repr(self.value)}, {self.line}:{self.column})"
+        line, column = self.buffer.position(self.start)
+        return f"Token({self.type}, {repr(self.value)}, {line}:{column})"
 
 
 class Lexer:
-    def __init__(self, source_code):
+    def __init__(self, source_code, engine="regex"):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown lexer engine '{engine}', expected one of: {', '.join(ENGINES)}")
         self.source = source_code
+        self.buffer = SourceBuffer(source_code)
+        self.engine = engine
         self.pos = 0
         self.line = 1
         self.column = 1
         self.tokens = []
-        self.keywords = token_map.tokens
+        self.keywords = KEYWORD_KINDS
     
     def current_char(self):
         if self.pos >= len(self.source):
@@ -53,35 +165,21 @@ class Lexer:
                 self.advance()
     
     def read_string(self):
+        start = self.pos
         start_line = self.line
         start_column = self.column
         quote_char = self.current_char()
         self.advance()
         
-        string_value = ""
         while self.current_char() and self.current_char() != quote_char:
             if self.current_char() == '\n':
                 quote_type = "single quote (')" if quote_char == "'" else "double quote (\")"
                 raise SyntaxError(f"Unclosed {quote_type} at line {start_line}, column {start_column}")
             if self.current_char() == '\\':
                 self.advance()
-                escape_char = self.current_char()
-                if escape_char == 'n':
-                    string_value += '\n'
-                elif escape_char == 't':
-                    string_value += '\t'
-                elif escape_char == 'r':
-                    string_value += '\r'
-                elif escape_char == '\\':
-                    string_value += '\\'
-                elif escape_char == quote_char:
-                    string_value += quote_char
-                else:
-                    string_value += escape_char
-                self.advance()
-            else:
-                string_value += self.current_char()
-                self.advance()
+                if self.current_char() is None:
+                    break
+            self.advance()
         
         if self.current_char() == quote_char:
             self.advance()
@@ -90,14 +188,12 @@ class Lexer:
             raise SyntaxError(f"Unclosed {quote_type} at line {start_line}, column {start_column}")
         
         if quote_char == "'":
-            return Token("CHAR", string_value, start_line, start_column)
+            return Token(CHAR, start, self.pos, self.buffer)
         else:
-            return Token("STRING", string_value, start_line, start_column)
+            return Token(STRING, start, self.pos, self.buffer)
     
     def read_number(self):
-        start_line = self.line
-        start_column = self.column
-        number_str = ""
+        start = self.pos
         is_float = False
         
         while self.current_char() and (self.current_char().isdigit() or self.current_char() == '.'):
@@ -105,42 +201,97 @@ class Lexer:
                 if is_float:
                     break
                 is_float = True
-            number_str += self.current_char()
             self.advance()
         
         if is_float:
-            return Token("FLOAT_NUMBER", float(number_str), start_line, start_column)
+            return Token(FLOAT_NUMBER, start, self.pos, self.buffer)
         else:
-            return Token("NUMBER", int(number_str), start_line, start_column)
+            return Token(NUMBER, start, self.pos, self.buffer)
     
     def read_identifier(self):
-        start_line = self.line
-        start_column = self.column
-        identifier = ""
+        start = self.pos
         
         while self.current_char() and (self.current_char().isalnum() or self.current_char() == '_'):
-            identifier += self.current_char()
             self.advance()
+        identifier = self.source[start:self.pos]
         
         if identifier == "c" and self.current_char() == '.':
             self.advance()
-            next_part = ""
             while self.current_char() and (self.current_char().isalnum() or self.current_char() == '_'):
-                next_part += self.current_char()
                 self.advance()
             
-            if next_part == "import":
-                return Token("C_IMPORT", "c.import", start_line, start_column)
+            if self.source[start:self.pos] == "c.import":
+                return Token(C_IMPORT, start, self.pos, self.buffer)
             else:
-                return Token("C_CALL", f"c.{next_part}", start_line, start_column)
+                return Token(C_CALL, start, self.pos, self.buffer)
         
         if identifier in self.keywords:
-            token_type = self.keywords[identifier]
-            return Token(token_type, identifier, start_line, start_column)
+            return Token(self.keywords[identifier], start, self.pos, self.buffer)
         else:
-            return Token("IDENTIFIER", identifier, start_line, start_column)
+            return Token(IDENTIFIER, start, self.pos, self.buffer)
     
     def tokenize(self):
+        if self.engine == "scan":
+            return self.tokenize_scan()
+        self.tokens.extend(self.generate_regex())
+        return self.tokens
+    
+    def generate_tokens(self):
+        if self.engine == "scan":
+            return iter(self.tokenize_scan())
+        return self.generate_regex()
+    
+    def generate_regex(self):
+        source = self.source
+        buffer = self.buffer
+        length = len(source)
+        keywords = self.keywords
+        match = TOKEN_PATTERN.match
+        last_kind = None
+        pos = 0
+        
+        while pos < length:
+            m = match(source, pos)
+            kind = m.lastgroup
+            end = m.end()
+            token = None
+            
+            if kind == "ws":
+                pass
+            elif kind == "name":
+                token = Token(keywords.get(m.group(), IDENTIFIER), pos, end, buffer)
+            elif kind == "operator":
+                token = Token(OPERATORS[m.group()], pos, end, buffer)
+            elif kind == "number":
+                token = Token(FLOAT_NUMBER if '.' in m.group() else NUMBER, pos, end, buffer)
+            elif kind == "string":
+                token = Token(CHAR if source[pos] == "'" else STRING, pos, end, buffer)
+            elif kind == "double_slash":
+                if last_kind is None or last_kind in COMMENT_AFTER:
+                    end = source.find('\n', pos)
+                    end = length if end == -1 else end + 1
+                else:
+                    token = Token(DOUBLE_SLASH, pos, end, buffer)
+            elif kind == "c_name":
+                token = Token(C_IMPORT if m.group() == "c.import" else C_CALL, pos, end, buffer)
+            elif kind == "quote":
+                line, column = buffer.position(pos)
+                quote_type = "single quote (')" if m.group() == "'" else "double quote (\")"
+                raise SyntaxError(f"Unclosed {quote_type} at line {line}, column {column}")
+            else:
+                line, column = buffer.position(pos)
+                raise SyntaxError(f"Dude, what even is '{m.group()}' at {line}:{column}? I have no idea what you want from me here.")
+            
+            pos = end
+            if token is not None:
+                last_kind = token.kind
+                yield token
+        
+        self.pos = pos
+        self.line, self.column = buffer.position(pos)
+        yield Token(EOF, pos, pos, buffer)
+    
+    def tokenize_scan(self):
         while self.current_char():
             self.skip_whitespace()
             
@@ -148,11 +299,12 @@ class Lexer:
                 break
             
             if self.current_char() == '/' and self.peek_char() == '/':
-                if not self.tokens or self.tokens[-1].type in ["SEMICOLON", "LBRACE", "RBRACE"]:
+                if not self.tokens or self.tokens[-1].kind in COMMENT_AFTER:
                     self.skip_comment()
                     continue
             
             char = self.current_char()
+            start = self.pos
             start_line = self.line
             start_column = self.column
             
@@ -163,113 +315,113 @@ class Lexer:
             elif char.isalpha() or char == '_':
                 self.tokens.append(self.read_identifier())
             elif char == '{':
-                self.tokens.append(Token("LBRACE", char, start_line, start_column))
+                self.tokens.append(Token(LBRACE, start, start + 1, self.buffer))
                 self.advance()
             elif char == '}':
-                self.tokens.append(Token("RBRACE", char, start_line, start_column))
+                self.tokens.append(Token(RBRACE, start, start + 1, self.buffer))
                 self.advance()
             elif char == '(':
-                self.tokens.append(Token("LPAREN", char, start_line, start_column))
+                self.tokens.append(Token(LPAREN, start, start + 1, self.buffer))
                 self.advance()
             elif char == ')':
-                self.tokens.append(Token("RPAREN", char, start_line, start_column))
+                self.tokens.append(Token(RPAREN, start, start + 1, self.buffer))
                 self.advance()
             elif char == '[':
-                self.tokens.append(Token("LBRACKET", char, start_line, start_column))
+                self.tokens.append(Token(LBRACKET, start, start + 1, self.buffer))
                 self.advance()
             elif char == ']':
-                self.tokens.append(Token("RBRACKET", char, start_line, start_column))
+                self.tokens.append(Token(RBRACKET, start, start + 1, self.buffer))
                 self.advance()
             elif char == ';':
-                self.tokens.append(Token("SEMICOLON", char, start_line, start_column))
+                self.tokens.append(Token(SEMICOLON, start, start + 1, self.buffer))
                 self.advance()
             elif char == '=':
                 if self.peek_char() == '=':
-                    self.tokens.append(Token("EQUAL_EQUAL", "==", start_line, start_column))
+                    self.tokens.append(Token(EQUAL_EQUAL, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
-                    self.tokens.append(Token("EQUALS", char, start_line, start_column))
+                    self.tokens.append(Token(EQUALS, start, start + 1, self.buffer))
                     self.advance()
             elif char == ',':
-                self.tokens.append(Token("COMMA", char, start_line, start_column))
+                self.tokens.append(Token(COMMA, start, start + 1, self.buffer))
                 self.advance()
             elif char == ':':
-                self.tokens.append(Token("COLON", char, start_line, start_column))
+                self.tokens.append(Token(COLON, start, start + 1, self.buffer))
                 self.advance()
             elif char == '*':
-                self.tokens.append(Token("ASTERISK", char, start_line, start_column))
+                self.tokens.append(Token(ASTERISK, start, start + 1, self.buffer))
                 self.advance()
             elif char == '+':
                 if self.peek_char() == '+':
-                    self.tokens.append(Token("PLUS_PLUS", "++", start_line, start_column))
+                    self.tokens.append(Token(PLUS_PLUS, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
-                    self.tokens.append(Token("PLUS", char, start_line, start_column))
+                    self.tokens.append(Token(PLUS, start, start + 1, self.buffer))
                     self.advance()
             elif char == '-':
                 if self.peek_char() == '-':
-                    self.tokens.append(Token("MINUS_MINUS", "--", start_line, start_column))
+                    self.tokens.append(Token(MINUS_MINUS, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
-                    self.tokens.append(Token("MINUS", char, start_line, start_column))
+                    self.tokens.append(Token(MINUS, start, start + 1, self.buffer))
                     self.advance()
             elif char == '/':
                 if self.peek_char() == '/':
-                    self.tokens.append(Token("DOUBLE_SLASH", "//", start_line, start_column))
+                    self.tokens.append(Token(DOUBLE_SLASH, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
-                    self.tokens.append(Token("SLASH", char, start_line, start_column))
+                    self.tokens.append(Token(SLASH, start, start + 1, self.buffer))
                     self.advance()
             elif char == '%':
-                self.tokens.append(Token("PERCENT", char, start_line, start_column))
+                self.tokens.append(Token(PERCENT, start, start + 1, self.buffer))
                 self.advance()
             elif char == '<':
                 if self.peek_char() == '=':
-                    self.tokens.append(Token("LESS_EQUAL", "<=", start_line, start_column))
+                    self.tokens.append(Token(LESS_EQUAL, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
-                    self.tokens.append(Token("LESS", char, start_line, start_column))
+                    self.tokens.append(Token(LESS, start, start + 1, self.buffer))
                     self.advance()
             elif char == '>':
                 if self.peek_char() == '=':
-                    self.tokens.append(Token("GREATER_EQUAL", ">=", start_line, start_column))
+                    self.tokens.append(Token(GREATER_EQUAL, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
-                    self.tokens.append(Token("GREATER", char, start_line, start_column))
+                    self.tokens.append(Token(GREATER, start, start + 1, self.buffer))
                     self.advance()
             elif char == '!':
                 if self.peek_char() == '=':
-                    self.tokens.append(Token("NOT_EQUAL", "!=", start_line, start_column))
+                    self.tokens.append(Token(NOT_EQUAL, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
                     raise SyntaxError(f"Dude, what even is '{char}' at {start_line}:{start_column}? I have no idea what you want from me here.")
             elif char == '&':
                 if self.peek_char() == '&':
-                    self.tokens.append(Token("AND", "&&", start_line, start_column))
+                    self.tokens.append(Token(AND, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
-                    self.tokens.append(Token("AMPERSAND", char, start_line, start_column))
+                    self.tokens.append(Token(AMPERSAND, start, start + 1, self.buffer))
                     self.advance()
             elif char == '|':
                 if self.peek_char() == '|':
-                    self.tokens.append(Token("OR", "||", start_line, start_column))
+                    self.tokens.append(Token(OR, start, start + 2, self.buffer))
                     self.advance()
                     self.advance()
                 else:
                     raise SyntaxError(f"Dude, what even is '{char}' at {start_line}:{start_column}? I have no idea what you want from me here.")
             elif char == '.':
-                self.tokens.append(Token("DOT", char, start_line, start_column))
+                self.tokens.append(Token(DOT, start, start + 1, self.buffer))
                 self.advance()
             else:
                 raise SyntaxError(f"Dude, what even is '{char}' at {start_line}:{start_column}? I have no idea what you want from me here.")
         
-        self.tokens.append(Token("EOF", None, self.line, self.column))
+        self.tokens.append(Token(EOF, self.pos, self.pos, self.buffer))
         return self.tokens
@@ -27,4 +27,138 @@ class tokens:
         "for": "FOR",
         "find": "FIND",
         "struct": "STRUCT",
-    }
\ No newline at end of file
+    }
+
+KIND_NAMES = (
+    "EOF",
+    "IDENTIFIER",
+    "NUMBER",
+    "FLOAT_NUMBER",
+    "STRING",
+    "CHAR",
+    "C_IMPORT",
+    "C_CALL",
+    "FUNCTION",
+    "PRINT",
+    "RETURN",
+    "VAR",
+    "MASS",
+    "INT",
+    "FLOAT",
+    "STRING_TYPE",
+    "CALL",
+    "INPT",
+    "IF",
+    "ELIF",
+    "ELSE",
+    "WHILE",
+    "IMPORT",
+    "SWITCH",
+    "CASE",
+    "DEFAULT",
+    "CONVERT",
+    "BREAK",
+    "CONTINUE",
+    "INF",
+    "STOP",
+    "FOR",
+    "FIND",
+    "STRUCT",
+    "LBRACE",
+    "RBRACE",
+    "LPAREN",
+    "RPAREN",
+    "LBRACKET",
+    "RBRACKET",
+    "SEMICOLON",
+    "EQUALS",
+    "EQUAL_EQUAL",
+    "COMMA",
+    "COLON",
+    "ASTERISK",
+    "PLUS",
+    "PLUS_PLUS",
+    "MINUS",
+    "MINUS_MINUS",
+    "SLASH",
+    "DOUBLE_SLASH",
+    "PERCENT",
+    "LESS",
+    "LESS_EQUAL",
+    "GREATER",
+    "GREATER_EQUAL",
+    "NOT_EQUAL",
+    "AMPERSAND",
+    "AND",
+    "OR",
+    "DOT",
+)
+
+KINDS = {name: kind for kind, name in enumerate(KIND_NAMES)}
+
+EOF = KINDS["EOF"]
+IDENTIFIER = KINDS["IDENTIFIER"]
+NUMBER = KINDS["NUMBER"]
+FLOAT_NUMBER = KINDS["FLOAT_NUMBER"]
+STRING = KINDS["STRING"]
+CHAR = KINDS["CHAR"]
+C_IMPORT = KINDS["C_IMPORT"]
+C_CALL = KINDS["C_CALL"]
+FUNCTION = KINDS["FUNCTION"]
+PRINT = KINDS["PRINT"]
+RETURN = KINDS["RETURN"]
+VAR = KINDS["VAR"]
+MASS = KINDS["MASS"]
+INT = KINDS["INT"]
+FLOAT = KINDS["FLOAT"]
+STRING_TYPE = KINDS["STRING_TYPE"]
+CALL = KINDS["CALL"]
+INPT = KINDS["INPT"]
+IF = KINDS["IF"]
+ELIF = KINDS["ELIF"]
+ELSE = KINDS["ELSE"]
+WHILE = KINDS["WHILE"]
+IMPORT = KINDS["IMPORT"]
+SWITCH = KINDS["SWITCH"]
+CASE = KINDS["CASE"]
+DEFAULT = KINDS["DEFAULT"]
+CONVERT = KINDS["CONVERT"]
+BREAK = KINDS["BREAK"]
+CONTINUE = KINDS["CONTINUE"]
+INF = KINDS["INF"]
+STOP = KINDS["STOP"]
+FOR = KINDS["FOR"]
+FIND = KINDS["FIND"]
+STRUCT = KINDS["STRUCT"]
+LBRACE = KINDS["LBRACE"]
+RBRACE = KINDS["RBRACE"]
+LPAREN = KINDS["LPAREN"]
+RPAREN = KINDS["RPAREN"]
+LBRACKET = KINDS["LBRACKET"]
+RBRACKET = KINDS["RBRACKET"]
+SEMICOLON = KINDS["SEMICOLON"]
+EQUALS = KINDS["EQUALS"]
+EQUAL_EQUAL = KINDS["EQUAL_EQUAL"]
+COMMA = KINDS["COMMA"]
+COLON = KINDS["COLON"]
+ASTERISK = KINDS["ASTERISK"]
+PLUS = KINDS["PLUS"]
+PLUS_PLUS = KINDS["PLUS_PLUS"]
+MINUS = KINDS["MINUS"]
+MINUS_MINUS = KINDS["MINUS_MINUS"]
+SLASH = KINDS["SLASH"]
+DOUBLE_SLASH = KINDS["DOUBLE_SLASH"]
+PERCENT = KINDS["PERCENT"]
+LESS = KINDS["LESS"]
+LESS_EQUAL = KINDS["LESS_EQUAL"]
+GREATER = KINDS["GREATER"]
+GREATER_EQUAL = KINDS["GREATER_EQUAL"]
+NOT_EQUAL = KINDS["NOT_EQUAL"]
+AMPERSAND = KINDS["AMPERSAND"]
+AND = KINDS["AND"]
+OR = KINDS["OR"]
+DOT = KINDS["DOT"]
+
+KEYWORD_KINDS = {word: KINDS[name] for word, name in tokens.tokens.items()}
+
+TYPE_KINDS = frozenset((INT, FLOAT, CHAR, STRING_TYPE))
@@ -4,11 +4,14 @@ import os
 import subprocess
 from pathlib import Path
 
-from lexer.lexer import Lexer
+from lexer.lexer import Lexer, ENGINES
 from parser.parser import Parser
+from parser.ast import ASTNode, NodeVisitor, iter_fields
 from parser.errors import KatoSyntaxError
 from compiler.compiler import CCompiler
-from compiler.optimizer import Optimizer
+from compiler.optimizer import Optimizer, OPT_LEVELS, DEFAULT_OPT_LEVEL
+from compiler.analysis import ProgramAnalyzer
+from compiler.cache import CompilationCache, FunctionCodeCache
 
 
 def find_c_compiler(force_tcc=False):
@@ -42,7 +45,11 @@ def find_c_compiler(force_tcc=False):
     return None
 
 
-def compile_c_to_exe(c_file, output_file, c_imports=None, stdlib_imports=None, force_tcc=False):
+C_OPT_FLAGS = {0: "-O0", 1: "-O1", 2: "-O2", 3: "-O3"}
+MSVC_OPT_FLAGS = {0: "/Od", 1: "/O1", 2: "/O2", 3: "/Ox"}
+
+
+def compile_c_to_exe(c_file, output_file, c_imports=None, stdlib_imports=None, force_tcc=False, opt_level=DEFAULT_OPT_LEVEL):
     compiler = find_c_compiler(force_tcc)
     
     if not compiler:
@@ -55,11 +62,11 @@ def compile_c_to_exe(c_file, output_file, c_imports=None, stdlib_imports=None, f
         is_msvc = compiler == 'cl'
         
         if is_msvc:
-            cmd = [compiler, c_file, f'/Fe{output_file}']
+            cmd = [compiler, MSVC_OPT_FLAGS[opt_level], c_file, f'/Fe{output_file}']
             if stdlib_imports and "os" in stdlib_imports:
                 cmd.extend(['advapi32.lib', 'shell32.lib'])
         else:
-            cmd = [compiler, c_file, '-o', output_file]
+            cmd = [compiler, C_OPT_FLAGS[opt_level], c_file, '-o', output_file]
             if stdlib_imports and "os" in stdlib_imports:
                 cmd.extend(['-ladvapi32', '-lshell32'])
         
@@ -78,39 +85,104 @@ def compile_c_to_exe(c_file, output_file, c_imports=None, stdlib_imports=None, f
         return False
 
 
-def print_ast(node, indent=0):
+def binary_output_name(args, input_path):
+    if args.output:
+        output_name = args.output
+    else:
+        output_name = input_path.stem
+    
+    if sys.platform == 'win32':
+        return f"{output_name}.exe"
+    return output_name
+
+
+def compilation_cache_key(cache, input_path, source_code, args):
+    from compiler.preprocessor import Preprocessor, STDLIBS
+    
+    preprocessor = Preprocessor(input_path)
+    stdlib_imports = [name for name in preprocessor.extract_imports(source_code) if name in STDLIBS]
+    dependencies = preprocessor.collect_dependencies(source_code)
+    flags = {"lexer": args.lexer, "tcc": args.tcc, "opt_level": args.opt_level}
+    return cache.make_key(source_code, dependencies, stdlib_imports, flags), stdlib_imports
+
+
+def print_cache_stats(cache):
+    stats = cache.stats()
+    print(f"Cache directory: {cache.cache_dir}")
+    print(f"Entries: {stats['entries']}")
+    print(f"Function packs: {stats['function_packs']}")
+    print(f"Type summaries: {stats['summary_files']}")
+    print(f"Size: {stats['size']} bytes")
+    print(f"Hits: {stats.get('hits', 0)}")
+    print(f"Misses: {stats.get('misses', 0)}")
+
+
+def echo_tokens(tokens):
+    for token in tokens:
+        print(token)
+        yield token
+
+
+class ASTPrinter(NodeVisitor):
+    def __init__(self):
+        self.depth = 0
     
-    prefix = "  " * indent
+    def visit_nested(self, key, items, prefix):
+        print(f"{prefix}  {key}:")
+        self.depth += 2
+        for item in items:
+            self.visit(item)
+        self.depth -= 2
     
-    if hasattr(node, '__class__'):
-        class_name = node.__class__.__name__
-        print(f"{prefix}{class_name}")
+    def generic_visit(self, node):
+        prefix = "  " * self.depth
+        print(f"{prefix}{node.__class__.__name__}")
         
-        if hasattr(node, '__dict__'):
-            for key, value in node.__dict__.items():
+        if isinstance(node, ASTNode):
+            for key, value in iter_fields(node):
                 if isinstance(value, list):
-                    print(f"{prefix}  {key}:")
-                    for item in value:
-                        print_ast(item, indent + 2)
-                elif hasattr(value, '__class__') and hasattr(value, '__dict__'):
-                    print(f"{prefix}  {key}:")
-                    print_ast(value, indent + 2)
+                    self.visit_nested(key, value, prefix)
+                elif isinstance(value, ASTNode):
+                    self.visit_nested(key, [value], prefix)
                 else:
                     print(f"{prefix}  {key}: {repr(value)}")
 
 
+def print_ast(node):
+    ASTPrinter().visit(node)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Kato compiler - compiles .kato files to C and optionally to .exe')
-    parser.add_argument('input_file', help='Input .kato file')
+    parser.add_argument('input_file', nargs='?', help='Input .kato file')
     parser.add_argument('-o', '--output', help='Output binary name (without extension)', default=None)
     parser.add_argument('-c', '--c-only', action='store_true', help='Generate C code only, do not compile to binary')
     parser.add_argument('-c2kato', '--c2kato', action='store_true', help='Convert C code to Kato')
     parser.add_argument('-debug', '--debug', action='store_true', help='Show AST')
     parser.add_argument('-adv_debug', '--advanced-debug', action='store_true', help='Show tokens, AST, and C code')
     parser.add_argument('-tcc', '--tcc', action='store_true', help='Force compilation using TCC')
+    parser.add_argument('-lexer', '--lexer', choices=ENGINES, default='regex', help='Tokenizer engine (default: regex)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Generate C for functions in N worker processes (default: 1)')
+    parser.add_argument('-O', dest='opt_level', type=int, choices=OPT_LEVELS, default=DEFAULT_OPT_LEVEL, help=f'Optimization level for Kato passes and the C compiler (default: {DEFAULT_OPT_LEVEL})')
+    parser.add_argument('--print-pass-times', action='store_true', help='Show wall time and node counts for each optimizer pass')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the compilation cache')
+    parser.add_argument('--cache-stats', action='store_true', help='Show compilation cache statistics and exit')
+    parser.add_argument('--clear-cache', action='store_true', help='Remove all cached compilations and exit')
     
     args = parser.parse_args()
     
+    if args.cache_stats or args.clear_cache:
+        cache = CompilationCache()
+        if args.clear_cache:
+            cache.clear()
+            print(f"Cache cleared: {cache.cache_dir}")
+        if args.cache_stats:
+            print_cache_stats(cache)
+        return
+    
+    if args.input_file is None:
+        parser.error("the following arguments are required: input_file")
+    
     input_path = Path(args.input_file)
     
     if not input_path.exists():
@@ -162,21 +234,43 @@ def main():
         return
     
     try:
-        from compiler.preprocessor import Preprocessor
+        from compiler.preprocessor import Preprocessor, stdlib_functions
         
-        preprocessor = Preprocessor(input_path)
+        cache = None
+        if not (args.no_cache or args.debug or args.advanced_debug):
+            cache = CompilationCache()
+            cache_key, stdlib_imports = compilation_cache_key(cache, input_path, source_code, args)
+            c_code = cache.lookup(cache_key)
+            
+            if c_code is not None:
+                c_file = input_path.with_suffix('.c')
+                with open(c_file, 'w', encoding='utf-8') as f:
+                    f.write(c_code)
+                
+                print(f"C code generated: {c_file} (cached)")
+                
+                if args.c_only:
+                    print("C-only mode: skipping binary compilation")
+                    return
+                
+                output_file = binary_output_name(args, input_path)
+                if cache.restore_binary(cache_key, output_file):
+                    print(f"Successfully compiled: {output_file} (cached)")
+                elif compile_c_to_exe(str(c_file), output_file, None, stdlib_imports, args.tcc, args.opt_level):
+                    cache.store(cache_key, binary=output_file)
+                return
+        
+        preprocessor = Preprocessor(input_path, cache=cache)
         processed_source, imported_functions, imported_function_return_types = preprocessor.process(source_code)
         
-        lexer = Lexer(processed_source)
-        tokens = lexer.tokenize()
+        lexer = Lexer(processed_source, engine=args.lexer)
+        tokens = lexer.generate_tokens()
         
         if args.advanced_debug:
             print("\n" + "="*60)
             print("TOKENS:")
             print("="*60)
-            for token in tokens:
-                print(token)
-            print()
+            tokens = echo_tokens(tokens)
         
         parser_obj = Parser(tokens, processed_source)
         
@@ -203,9 +297,15 @@ def main():
         
         ast = parser_obj.parse()
         
+        if args.advanced_debug:
+            print()
+        
         for func_name, func in imported_functions.items():
             ast.functions.insert(0, func)
         
+        for func_name, func in preprocessor.support_functions.items():
+            ast.functions.insert(0, func)
+        
         if preprocessor.imported_structs:
             if not hasattr(ast, 'structs'):
                 ast.structs = []
@@ -221,50 +321,78 @@ def main():
             print_ast(ast)
             print()
         
-        optimizer = Optimizer(ast)
+        source_analysis = ProgramAnalyzer(stdlib_functions(preprocessor.stdlib_imports)).analyze(ast)
+        preprocessor.check_unused_imports(source_analysis, imported_functions, source_code)
+        
+        optimizer = Optimizer(ast, stdlib_imports=preprocessor.stdlib_imports, function_summaries=preprocessor.function_summaries, level=args.opt_level, timing=args.print_pass_times)
         optimized_ast = optimizer.optimize()
         
+        if args.print_pass_times:
+            print("="*60)
+            print(f"PASS TIMES (-O{args.opt_level}):")
+            print("="*60)
+            for line in optimizer.manager.timing_report():
+                print(line)
+            print()
+        
         if args.debug or args.advanced_debug:
             print("\n" + "="*60)
             print("AST (After Optimization):")
             print("="*60)
             print_ast(optimized_ast)
             print()
-        
-        
-        preprocessor.check_unused_imports(optimized_ast, imported_functions, source_code)
-        
-        compiler = CCompiler(optimized_ast, stdlib_imports=preprocessor.stdlib_imports, c_imports=preprocessor.c_imports)
-        c_code = compiler.compile()
-        
-        if args.advanced_debug:
-            print("\n" + "="*60)
-            print("C CODE:")
+            
+            if optimizer.ir_functions:
+                print("="*60)
+                print("IR:")
+                print("="*60)
+                for ir in optimizer.ir_functions.values():
+                    print(ir.dump())
+                    print()
+            
+            print("="*60)
+            print("OPTIMIZER STATS:")
             print("="*60)
-            print(c_code)
+            for name, count in optimizer.stats.items():
+                print(f"{name}: {count}")
             print()
         
+        
+        analysis = ProgramAnalyzer(stdlib_functions(preprocessor.stdlib_imports)).analyze(optimized_ast)
+        
+        function_cache = FunctionCodeCache(cache, input_path.resolve()) if cache is not None else None
+        compiler = CCompiler(optimized_ast, stdlib_imports=preprocessor.stdlib_imports, c_imports=preprocessor.c_imports, function_cache=function_cache, jobs=args.jobs, function_summaries=optimizer.function_summaries, analysis=analysis, ir_functions=optimizer.ir_functions)
         c_file = input_path.with_suffix('.c')
-        with open(c_file, 'w', encoding='utf-8') as f:
-            f.write(c_code)
+        
+        if args.advanced_debug or cache is not None:
+            c_code = compiler.compile()
+            
+            if args.advanced_debug:
+                print("\n" + "="*60)
+                print("C CODE:")
+                print("="*60)
+                print(c_code)
+                print()
+            
+            with open(c_file, 'w', encoding='utf-8') as f:
+                f.write(c_code)
+        else:
+            with open(c_file, 'w', encoding='utf-8') as f:
+                compiler.compile(stream=f)
         
         print(f"C code generated: {c_file}")
         
+        if cache is not None:
+            cache.store(cache_key, c_code=c_code)
+        
         if args.c_only:
             print("C-only mode: skipping binary compilation")
             return
         
-        if args.output:
-            output_name = args.output
-        else:
-            output_name = input_path.stem
-        
-        if sys.platform == 'win32':
-            output_file = f"{output_name}.exe"
-        else:
-            output_file = output_name
+        output_file = binary_output_name(args, input_path)
         
-        compile_c_to_exe(str(c_file), output_file, compiler.c_imports, preprocessor.stdlib_imports, args.tcc)
+        if compile_c_to_exe(str(c_file), output_file, compiler.c_imports, preprocessor.stdlib_imports, args.tcc, args.opt_level) and cache is not None:
+            cache.store(cache_key, binary=output_file)
     
     except KatoSyntaxError as e:
         print(str(e))
@@ -1,4 +1,5 @@
-from .nodes import ASTNode
+from .nodes import ASTNode, iter_fields
+from .visitor import NodeVisitor, NodeTransformer
 from .statements import (
     Program, Function, PrintStatement, ReturnStatement,
     VarDeclaration, CallStatement, IfStatement, Assignment,
@@ -15,7 +16,7 @@ from .expressions import (
 )
 
 __all__ = [
-    'ASTNode',
+    'ASTNode', 'iter_fields', 'NodeVisitor', 'NodeTransformer',
     'Program', 'Function', 'PrintStatement', 'ReturnStatement',
     'VarDeclaration', 'CallStatement', 'IfStatement', 'Assignment',
     'WhileStatement', 'IncrementStatement', 'DecrementStatement',
@@ -2,47 +2,65 @@ from .nodes import ASTNode
 
 
 class StringLiteral(ASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class NumberLiteral(ASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class FloatLiteral(ASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class CharLiteral(ASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class Identifier(ASTNode):
+    __slots__ = ('name',)
+    
     def __init__(self, name):
         self.name = name
 
 
 class AddressOf(ASTNode):
+    __slots__ = ('operand',)
+    
     def __init__(self, operand):
         self.operand = operand
 
 
 class Dereference(ASTNode):
+    __slots__ = ('operand',)
+    
     def __init__(self, operand):
         self.operand = operand
 
 
 class ArrayAccess(ASTNode):
+    __slots__ = ('name', 'index')
+    
     def __init__(self, name, index):
         self.name = name
         self.index = index
 
 
 class BinaryOp(ASTNode):
+    __slots__ = ('left', 'operator', 'right')
+    
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
@@ -50,29 +68,39 @@ class BinaryOp(ASTNode):
 
 
 class InptCall(ASTNode):
+    __slots__ = ('prompt',)
+    
     def __init__(self, prompt):
         self.prompt = prompt
 
 
 class FunctionCall(ASTNode):
+    __slots__ = ('name', 'arguments')
+    
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
 
 
 class ConvertExpression(ASTNode):
+    __slots__ = ('expression', 'target_type')
+    
     def __init__(self, expression, target_type):
         self.expression = expression
         self.target_type = target_type
 
 
 class FindCall(ASTNode):
+    __slots__ = ('target', 'pattern')
+    
     def __init__(self, target, pattern):
         self.target = target
         self.pattern = pattern
 
 
 class StructAccess(ASTNode):
+    __slots__ = ('struct_name', 'field_name')
+    
     def __init__(self, struct_name, field_name):
         self.struct_name = struct_name
         self.field_name = field_name
@@ -1,4 +1,15 @@
 class ASTNode:
-    def __init__(self):
-        self.line_number = None
-        self.source_line = None
+    __slots__ = ('line_number', 'source_lines')
+    
+    @property
+    def source_line(self):
+        line_number = self.line_number
+        if line_number <= len(self.source_lines):
+            return self.source_lines[line_number - 1]
+        return ""
+
+
+def iter_fields(node):
+    for name in node.__slots__ + ('line_number', 'source_line'):
+        if hasattr(node, name):
+            yield name, getattr(node, name)
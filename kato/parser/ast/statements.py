@@ -2,11 +2,15 @@ from .nodes import ASTNode
 
 
 class Program(ASTNode):
+    __slots__ = ('functions', 'c_imports', 'structs')
+    
     def __init__(self, functions):
         self.functions = functions
 
 
 class Function(ASTNode):
+    __slots__ = ('name', 'params', 'body', 'param_types', 'return_type')
+    
     def __init__(self, name, params, body):
         self.name = name
         self.params = params
@@ -14,16 +18,22 @@ class Function(ASTNode):
 
 
 class PrintStatement(ASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class ReturnStatement(ASTNode):
+    __slots__ = ('value',)
+    
     def __init__(self, value):
         self.value = value
 
 
 class VarDeclaration(ASTNode):
+    __slots__ = ('var_type', 'name', 'value')
+    
     def __init__(self, var_type, name, value):
         self.var_type = var_type
         self.name = name
@@ -31,12 +41,16 @@ class VarDeclaration(ASTNode):
 
 
 class CallStatement(ASTNode):
+    __slots__ = ('func_name', 'arguments')
+    
     def __init__(self, func_name, arguments):
         self.func_name = func_name
         self.arguments = arguments
 
 
 class IfStatement(ASTNode):
+    __slots__ = ('condition', 'if_body', 'elif_parts', 'else_body')
+    
     def __init__(self, condition, if_body, elif_parts, else_body):
         self.condition = condition
         self.if_body = if_body
@@ -45,28 +59,38 @@ class IfStatement(ASTNode):
 
 
 class Assignment(ASTNode):
+    __slots__ = ('name', 'value')
+    
     def __init__(self, name, value):
         self.name = name
         self.value = value
 
 
 class WhileStatement(ASTNode):
+    __slots__ = ('condition', 'body')
+    
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
 
 
 class IncrementStatement(ASTNode):
+    __slots__ = ('name',)
+    
     def __init__(self, name):
         self.name = name
 
 
 class DecrementStatement(ASTNode):
+    __slots__ = ('name',)
+    
     def __init__(self, name):
         self.name = name
 
 
 class ArrayDeclaration(ASTNode):
+    __slots__ = ('array_type', 'name', 'elements')
+    
     def __init__(self, array_type, name, elements):
         self.array_type = array_type
         self.name = name
@@ -74,6 +98,8 @@ class ArrayDeclaration(ASTNode):
 
 
 class ArrayAssignment(ASTNode):
+    __slots__ = ('name', 'index', 'value')
+    
     def __init__(self, name, index, value):
         self.name = name
         self.index = index
@@ -81,6 +107,8 @@ class ArrayAssignment(ASTNode):
 
 
 class SwitchStatement(ASTNode):
+    __slots__ = ('expression', 'cases', 'default_body')
+    
     def __init__(self, expression, cases, default_body):
         self.expression = expression
         self.cases = cases
@@ -88,46 +116,58 @@ class SwitchStatement(ASTNode):
 
 
 class CaseClause(ASTNode):
+    __slots__ = ('value', 'body')
+    
     def __init__(self, value, body):
         self.value = value
         self.body = body
 
 
 class ConvertStatement(ASTNode):
+    __slots__ = ('expression', 'target_type')
+    
     def __init__(self, expression, target_type):
         self.expression = expression
         self.target_type = target_type
 
 
 class CImportStatement(ASTNode):
+    __slots__ = ('header_name',)
+    
     def __init__(self, header_name):
         self.header_name = header_name
 
 
 class CCallStatement(ASTNode):
+    __slots__ = ('func_name', 'arguments')
+    
     def __init__(self, func_name, arguments):
         self.func_name = func_name
         self.arguments = arguments
 
 
 class BreakStatement(ASTNode):
-    pass
+    __slots__ = ()
 
 
 class ContinueStatement(ASTNode):
-    pass
+    __slots__ = ()
 
 
 class InfStatement(ASTNode):
+    __slots__ = ('body',)
+    
     def __init__(self, body):
         self.body = body
 
 
 class StopStatement(ASTNode):
-    pass
+    __slots__ = ()
 
 
 class ForStatement(ASTNode):
+    __slots__ = ('iterable', 'counter', 'condition', 'body')
+    
     def __init__(self, iterable, counter, condition, body):
         self.iterable = iterable
         self.counter = counter
@@ -136,12 +176,16 @@ class ForStatement(ASTNode):
 
 
 class StructDeclaration(ASTNode):
+    __slots__ = ('name', 'fields')
+    
     def __init__(self, name, fields):
         self.name = name
         self.fields = fields
 
 
 class StructVarDeclaration(ASTNode):
+    __slots__ = ('struct_type', 'name', 'field_values')
+    
     def __init__(self, struct_type, name, field_values):
         self.struct_type = struct_type
         self.name = name
@@ -149,6 +193,8 @@ class StructVarDeclaration(ASTNode):
 
 
 class StructFieldAssignment(ASTNode):
+    __slots__ = ('struct_name', 'field_name', 'value')
+    
     def __init__(self, struct_name, field_name, value):
         self.struct_name = struct_name
         self.field_name = field_name
@@ -156,6 +202,8 @@ class StructFieldAssignment(ASTNode):
 
 
 class PointerAssignment(ASTNode):
+    __slots__ = ('pointer', 'value')
+    
     def __init__(self, pointer, value):
         self.pointer = pointer
         self.value = value
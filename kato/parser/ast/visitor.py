@@ -0,0 +1,65 @@
+from .nodes import ASTNode
+
+
+class NodeVisitor:
+    dispatch = None
+    
+    def visit(self, node):
+        visitor_class = type(self)
+        dispatch = visitor_class.__dict__.get('dispatch')
+        if dispatch is None:
+            dispatch = {}
+            visitor_class.dispatch = dispatch
+        
+        node_class = type(node)
+        method = dispatch.get(node_class)
+        if method is None:
+            method = getattr(visitor_class, 'visit_' + node_class.__name__, visitor_class.generic_visit)
+            dispatch[node_class] = method
+        return method(self, node)
+    
+    def visit_value(self, value):
+        if isinstance(value, ASTNode):
+            self.visit(value)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self.visit_value(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                self.visit_value(item)
+    
+    def generic_visit(self, node):
+        for name in type(node).__slots__:
+            value = getattr(node, name, None)
+            if value is not None:
+                self.visit_value(value)
+
+
+class NodeTransformer(NodeVisitor):
+    def transform_value(self, value):
+        if isinstance(value, ASTNode):
+            return self.visit(value)
+        elif isinstance(value, list):
+            new_values = []
+            for item in value:
+                new_item = self.transform_value(item)
+                if isinstance(item, ASTNode):
+                    if new_item is None:
+                        continue
+                    if isinstance(new_item, list):
+                        new_values.extend(new_item)
+                        continue
+                new_values.append(new_item)
+            return new_values
+        elif isinstance(value, tuple):
+            return tuple(self.transform_value(item) for item in value)
+        elif isinstance(value, dict):
+            return {key: self.transform_value(item) for key, item in value.items()}
+        return value
+    
+    def generic_visit(self, node):
+        for name in type(node).__slots__:
+            value = getattr(node, name, None)
+            if value is not None:
+                setattr(node, name, self.transform_value(value))
+        return node
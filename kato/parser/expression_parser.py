@@ -1,3 +1,10 @@
+from lexer.tokens import (
+    TYPE_KINDS,
+    IDENTIFIER, NUMBER, FLOAT_NUMBER, STRING, CHAR, INPT, FIND, CONVERT,
+    LPAREN, RPAREN, LBRACKET, RBRACKET, COMMA, DOT, AMPERSAND, AND, OR,
+    ASTERISK, MINUS, GREATER, DOUBLE_SLASH,
+    PLUS, SLASH, PERCENT, EQUAL_EQUAL, NOT_EQUAL, LESS, LESS_EQUAL, GREATER_EQUAL
+)
 from .ast.expressions import (
     StringLiteral, NumberLiteral, FloatLiteral, CharLiteral,
     Identifier, BinaryOp, InptCall, ArrayAccess, FunctionCall,
@@ -6,6 +13,13 @@ from .ast.expressions import (
 from .errors import KatoSyntaxError
 
 
+COMPARISON_KINDS = frozenset((EQUAL_EQUAL, NOT_EQUAL, LESS, GREATER, LESS_EQUAL, GREATER_EQUAL))
+
+ADDITIVE_KINDS = frozenset((PLUS, MINUS))
+
+MULTIPLICATIVE_KINDS = frozenset((ASTERISK, SLASH, DOUBLE_SLASH, PERCENT))
+
+
 class ExpressionParser:
     def __init__(self, parser):
         self.parser = parser
@@ -16,7 +30,7 @@ class ExpressionParser:
     def parse_logical_or(self):
         left = self.parse_logical_and()
         
-        while self.parser.current_token() and self.parser.current_token().type == "OR":
+        while self.parser.current_token() and self.parser.current_token().kind == OR:
             op_token = self.parser.current_token()
             operator = op_token.value
             self.parser.advance()
@@ -28,7 +42,7 @@ class ExpressionParser:
     def parse_logical_and(self):
         left = self.parse_comparison_expr()
         
-        while self.parser.current_token() and self.parser.current_token().type == "AND":
+        while self.parser.current_token() and self.parser.current_token().kind == AND:
             op_token = self.parser.current_token()
             operator = op_token.value
             self.parser.advance()
@@ -41,7 +55,7 @@ class ExpressionParser:
         left = self.parse_additive()
         
         token = self.parser.current_token()
-        if token and token.type in ["EQUAL_EQUAL", "NOT_EQUAL", "LESS", "GREATER", "LESS_EQUAL", "GREATER_EQUAL"]:
+        if token and token.kind in COMPARISON_KINDS:
             operator = token.value
             self.parser.advance()
             right = self.parse_additive()
@@ -52,7 +66,7 @@ class ExpressionParser:
     def parse_additive(self):
         left = self.parse_multiplicative()
         
-        while self.parser.current_token() and self.parser.current_token().type in ["PLUS", "MINUS"]:
+        while self.parser.current_token() and self.parser.current_token().kind in ADDITIVE_KINDS:
             op_token = self.parser.current_token()
             operator = op_token.value
             self.parser.advance()
@@ -64,16 +78,16 @@ class ExpressionParser:
     def parse_multiplicative(self):
         left = self.parse_primary()
         
-        while self.parser.current_token() and self.parser.current_token().type in ["ASTERISK", "SLASH", "DOUBLE_SLASH", "PERCENT"]:
-            if self.parser.current_token().type == "ASTERISK":
+        while self.parser.current_token() and self.parser.current_token().kind in MULTIPLICATIVE_KINDS:
+            if self.parser.current_token().kind == ASTERISK:
                 next_token = self.parser.peek_token()
-                if next_token and next_token.type == "IDENTIFIER":
+                if next_token and next_token.kind == IDENTIFIER:
                     peek_after = self.parser.peek_token(2)
-                    if peek_after and peek_after.type == "ASTERISK":
+                    if peek_after and peek_after.kind == ASTERISK:
                         break
             
             op_token = self.parser.current_token()
-            if op_token.type == "DOUBLE_SLASH":
+            if op_token.kind == DOUBLE_SLASH:
                 operator = "//"
             else:
                 operator = op_token.value
@@ -86,27 +100,27 @@ class ExpressionParser:
     def parse_primary(self):
         token = self.parser.current_token()
         
-        if token.type == "STRING":
+        if token.kind == STRING:
             self.parser.advance()
             return StringLiteral(token.value)
-        elif token.type == "CHAR":
+        elif token.kind == CHAR:
             self.parser.advance()
             return CharLiteral(token.value)
-        elif token.type == "NUMBER":
+        elif token.kind == NUMBER:
             self.parser.advance()
             return NumberLiteral(token.value)
-        elif token.type == "FLOAT_NUMBER":
+        elif token.kind == FLOAT_NUMBER:
             self.parser.advance()
             return FloatLiteral(token.value)
-        elif token.type == "IDENTIFIER":
+        elif token.kind == IDENTIFIER:
             name = token.value
             self.parser.advance()
             
-            if self.parser.current_token() and self.parser.current_token().type == "DOT":
+            if self.parser.current_token() and self.parser.current_token().kind == DOT:
                 self.parser.advance()
-                field_token = self.parser.expect("IDENTIFIER")
+                field_token = self.parser.expect(IDENTIFIER)
                 return StructAccess(name, field_token.value)
-            elif self.parser.current_token() and self.parser.current_token().type == "LPAREN":
+            elif self.parser.current_token() and self.parser.current_token().kind == LPAREN:
                 if name not in self.parser.defined_functions and name not in self.parser.builtin_functions:
                     raise KatoSyntaxError(
                         f"Unknown function '{name}'",
@@ -125,7 +139,7 @@ class ExpressionParser:
                 
                 self.parser.advance()
                 arguments = []
-                while self.parser.current_token() and self.parser.current_token().type != "RPAREN":
+                while self.parser.current_token() and self.parser.current_token().kind != RPAREN:
                     arg_token = self.parser.current_token()
                     arg = self.parse_expression()
                     
@@ -138,9 +152,9 @@ class ExpressionParser:
                             )
                     
                     arguments.append(arg)
-                    if self.parser.current_token() and self.parser.current_token().type == "COMMA":
+                    if self.parser.current_token() and self.parser.current_token().kind == COMMA:
                         self.parser.advance()
-                self.parser.expect("RPAREN")
+                self.parser.expect(RPAREN)
                 
                 if name == "random":
                     if len(arguments) != 2:
@@ -151,53 +165,53 @@ class ExpressionParser:
                         )
                 
                 return FunctionCall(name, arguments)
-            elif self.parser.current_token() and self.parser.current_token().type == "LBRACKET":
+            elif self.parser.current_token() and self.parser.current_token().kind == LBRACKET:
                 self.parser.advance()
                 index = self.parse_expression()
-                self.parser.expect("RBRACKET")
+                self.parser.expect(RBRACKET)
                 return ArrayAccess(name, index)
             
             return Identifier(name)
-        elif token.type in ["INT", "FLOAT", "CHAR", "STRING_TYPE"]:
+        elif token.kind in TYPE_KINDS:
             raise KatoSyntaxError(
                 f"Cannot use type '{token.value}' as a variable. Did you mean to use a variable name?",
                 token.line, token.column,
                 self.parser.source_code
             )
-        elif token.type == "AMPERSAND":
+        elif token.kind == AMPERSAND:
             self.parser.advance()
             operand = self.parse_primary()
             return AddressOf(operand)
-        elif token.type == "ASTERISK":
+        elif token.kind == ASTERISK:
             next_token = self.parser.peek_token()
-            if next_token and next_token.type == "IDENTIFIER":
+            if next_token and next_token.kind == IDENTIFIER:
                 peek_after = self.parser.peek_token(2)
-                if peek_after and peek_after.type == "ASTERISK":
+                if peek_after and peek_after.kind == ASTERISK:
                     self.parser.advance()
-                    var_token = self.parser.expect("IDENTIFIER")
+                    var_token = self.parser.expect(IDENTIFIER)
                     
-                    if self.parser.current_token() and self.parser.current_token().type == "LBRACKET":
+                    if self.parser.current_token() and self.parser.current_token().kind == LBRACKET:
                         name = var_token.value
                         self.parser.advance()
                         index = self.parse_expression()
-                        self.parser.expect("RBRACKET")
-                        self.parser.expect("ASTERISK")
+                        self.parser.expect(RBRACKET)
+                        self.parser.expect(ASTERISK)
                         return ArrayAccess(name, index)
                     
-                    self.parser.expect("ASTERISK")
+                    self.parser.expect(ASTERISK)
                     return Dereference(Identifier(var_token.value))
             raise KatoSyntaxError(
                 f"Unexpected '*' in expression",
                 token.line, token.column,
                 self.parser.source_code
             )
-        elif token.type == "MINUS":
+        elif token.kind == MINUS:
             self.parser.advance()
             next_token = self.parser.current_token()
-            if next_token.type == "NUMBER":
+            if next_token.kind == NUMBER:
                 self.parser.advance()
                 return NumberLiteral(-next_token.value)
-            elif next_token.type == "FLOAT_NUMBER":
+            elif next_token.kind == FLOAT_NUMBER:
                 self.parser.advance()
                 return FloatLiteral(-next_token.value)
             else:
@@ -206,20 +220,20 @@ class ExpressionParser:
                     next_token.line, next_token.column,
                     self.parser.source_code
                 )
-        elif token.type == "LPAREN":
+        elif token.kind == LPAREN:
             self.parser.advance()
             expr = self.parse_expression()
-            self.parser.expect("RPAREN")
+            self.parser.expect(RPAREN)
             return expr
-        elif token.type == "INPT":
+        elif token.kind == INPT:
             self.parser.advance()
-            self.parser.expect("LPAREN")
+            self.parser.expect(LPAREN)
             prompt = self.parse_expression()
-            self.parser.expect("RPAREN")
+            self.parser.expect(RPAREN)
             return InptCall(prompt)
-        elif token.type == "FIND":
+        elif token.kind == FIND:
             self.parser.advance()
-            self.parser.expect("LPAREN")
+            self.parser.expect(LPAREN)
             target_token = self.parser.current_token()
             target = self.parse_expression()
             
@@ -230,16 +244,16 @@ class ExpressionParser:
                     self.parser.source_code
                 )
             
-            self.parser.expect("COMMA")
+            self.parser.expect(COMMA)
             pattern = self.parse_expression()
-            self.parser.expect("RPAREN")
+            self.parser.expect(RPAREN)
             return FindCall(target, pattern)
-        elif token.type == "CONVERT":
+        elif token.kind == CONVERT:
             self.parser.advance()
             expr = self.parse_primary()
-            self.parser.expect("GREATER")
+            self.parser.expect(GREATER)
             type_token = self.parser.current_token()
-            if type_token.type not in ["INT", "FLOAT", "CHAR", "STRING_TYPE"]:
+            if type_token.kind not in TYPE_KINDS:
                 raise KatoSyntaxError(
                     f"Expected type (int, float, char, string), got '{type_token.value}'",
                     type_token.line, type_token.column,
@@ -258,7 +272,7 @@ class ExpressionParser:
     def parse_comparison(self):
         left_token = self.parser.current_token()
         
-        if left_token and left_token.type in ["INT", "FLOAT", "CHAR", "STRING_TYPE"]:
+        if left_token and left_token.kind in TYPE_KINDS:
             raise KatoSyntaxError(
                 f"Cannot use type '{left_token.value}' as a variable. Did you mean to use a variable name?",
                 left_token.line, left_token.column,
@@ -1,15 +1,20 @@
+from lexer.tokens import (
+    KIND_NAMES, TYPE_KINDS,
+    EOF, IDENTIFIER, C_IMPORT, FUNCTION, STRUCT,
+    LBRACE, RBRACE, LPAREN, RPAREN, SEMICOLON, COMMA
+)
 from .ast import Program, Function
 from .errors import KatoSyntaxError
 from .expression_parser import ExpressionParser
 from .statement_parser import StatementParser
+from .token_stream import TokenStream
 
 
 class Parser:
     def __init__(self, tokens, source_code=None):
-        self.tokens = tokens
-        self.pos = 0
+        self.tokens = TokenStream(tokens)
         self.source_code = source_code
-        self.source_lines = source_code.split('\n') if source_code else []
+        self.source_lines = [line.strip() for line in source_code.split('\n')] if source_code else []
         self.defined_functions = set()
         self.builtin_functions = {"print", "random", "find"}
         self.defined_variables = set()
@@ -20,30 +25,27 @@ class Parser:
         self.stmt_parser = StatementParser(self, self.expr_parser)
     
     def current_token(self):
-        if self.pos >= len(self.tokens):
-            return None
-        return self.tokens[self.pos]
+        if self.tokens.window:
+            return self.tokens.window[0]
+        return self.tokens.peek()
     
     def peek_token(self, offset=1):
-        peek_pos = self.pos + offset
-        if peek_pos >= len(self.tokens):
-            return None
-        return self.tokens[peek_pos]
+        return self.tokens.peek(offset)
     
     def advance(self):
-        self.pos += 1
+        self.tokens.advance()
     
-    def expect(self, token_type):
+    def expect(self, kind):
         token = self.current_token()
         if token is None:
             raise KatoSyntaxError(
-                f"Expected {token_type}, but reached end of file",
+                f"Expected {KIND_NAMES[kind]}, but reached end of file",
                 1, 1,
                 self.source_code
             )
-        if token.type != token_type:
+        if token.kind != kind:
             raise KatoSyntaxError(
-                f"Expected {token_type}, but got {token.type}",
+                f"Expected {KIND_NAMES[kind]}, but got {token.type}",
                 token.line, token.column,
                 self.source_code
             )
@@ -55,12 +57,12 @@ class Parser:
         c_imports = []
         structs = []
         
-        while self.current_token() and self.current_token().type != "EOF":
-            if self.current_token().type == "C_IMPORT":
+        while self.current_token() and self.current_token().kind != EOF:
+            if self.current_token().kind == C_IMPORT:
                 c_imports.append(self.stmt_parser.parse_c_import())
-            elif self.current_token().type == "STRUCT":
+            elif self.current_token().kind == STRUCT:
                 structs.append(self.parse_struct())
-            elif self.current_token().type == "FUNCTION":
+            elif self.current_token().kind == FUNCTION:
                 functions.append(self.parse_function())
             else:
                 token = self.current_token()
@@ -84,9 +86,9 @@ class Parser:
         return program
     
     def parse_function(self):
-        self.expect("FUNCTION")
+        self.expect(FUNCTION)
         
-        name_token = self.expect("IDENTIFIER")
+        name_token = self.expect(IDENTIFIER)
         name = name_token.value
         
         if name in self.defined_functions or name in self.builtin_functions:
@@ -96,17 +98,17 @@ class Parser:
                 self.source_code
             )
         
-        self.expect("LPAREN")
+        self.expect(LPAREN)
         
         params = []
-        while self.current_token() and self.current_token().type != "RPAREN":
-            param_token = self.expect("IDENTIFIER")
+        while self.current_token() and self.current_token().kind != RPAREN:
+            param_token = self.expect(IDENTIFIER)
             params.append(param_token.value)
             
-            if self.current_token() and self.current_token().type == "COMMA":
+            if self.current_token() and self.current_token().kind == COMMA:
                 self.advance()
         
-        self.expect("RPAREN")
+        self.expect(RPAREN)
         
         if name == "main" and len(params) > 0:
             raise KatoSyntaxError(
@@ -121,11 +123,11 @@ class Parser:
         for param in params:
             self.defined_variables.add(param)
         
-        lbrace_token = self.expect("LBRACE")
+        lbrace_token = self.expect(LBRACE)
         
         body = []
-        while self.current_token() and self.current_token().type != "RBRACE":
-            if self.current_token().type == "EOF":
+        while self.current_token() and self.current_token().kind != RBRACE:
+            if self.current_token().kind == EOF:
                 raise KatoSyntaxError(
                     f"Function '{name}' is not closed. Missing closing brace '}}' for function that starts here",
                     lbrace_token.line, lbrace_token.column,
@@ -135,14 +137,14 @@ class Parser:
             if stmt is not None:
                 body.append(stmt)
         
-        if self.current_token() is None or self.current_token().type == "EOF":
+        if self.current_token() is None or self.current_token().kind == EOF:
             raise KatoSyntaxError(
                 f"Function '{name}' is not closed. Missing closing brace '}}' for function that starts here",
                 lbrace_token.line, lbrace_token.column,
                 self.source_code
             )
         
-        self.expect("RBRACE")
+        self.expect(RBRACE)
         
         return_type = self.infer_return_type(body)
         self.function_return_types[name] = return_type
@@ -152,8 +154,8 @@ class Parser:
     def parse_struct(self):
         from .ast import StructDeclaration
         
-        self.expect("STRUCT")
-        name_token = self.expect("IDENTIFIER")
+        self.expect(STRUCT)
+        name_token = self.expect(IDENTIFIER)
         name = name_token.value
         
         if name == "c":
@@ -170,12 +172,12 @@ class Parser:
                 self.source_code
             )
         
-        self.expect("LBRACE")
+        self.expect(LBRACE)
         fields = {}
         
-        while self.current_token() and self.current_token().type != "RBRACE":
+        while self.current_token() and self.current_token().kind != RBRACE:
             field_type_token = self.current_token()
-            if field_type_token.type not in ["INT", "FLOAT", "CHAR", "STRING_TYPE"]:
+            if field_type_token.kind not in TYPE_KINDS:
                 raise KatoSyntaxError(
                     f"Expected type (int, float, char, string), got '{field_type_token.value}'",
                     field_type_token.line, field_type_token.column,
@@ -184,7 +186,7 @@ class Parser:
             field_type = field_type_token.value
             self.advance()
             
-            field_name_token = self.expect("IDENTIFIER")
+            field_name_token = self.expect(IDENTIFIER)
             field_name = field_name_token.value
             
             if field_name in fields:
@@ -195,28 +197,41 @@ class Parser:
                 )
             
             fields[field_name] = field_type
-            self.expect("SEMICOLON")
+            self.expect(SEMICOLON)
         
-        self.expect("RBRACE")
+        self.expect(RBRACE)
         self.defined_structs[name] = fields
         return StructDeclaration(name, fields)
     
+    def collect_returns(self, node, returns):
+        from .ast import ASTNode, ReturnStatement, iter_fields
+        
+        if isinstance(node, ReturnStatement):
+            returns.append(node)
+        elif isinstance(node, ASTNode):
+            for _, value in iter_fields(node):
+                self.collect_returns(value, returns)
+        elif isinstance(node, (list, tuple)):
+            for item in node:
+                self.collect_returns(item, returns)
+        
+        return returns
+    
     def infer_return_type(self, body):
-        from .ast import ReturnStatement, StringLiteral, CharLiteral, FloatLiteral, Identifier
+        from .ast import StringLiteral, CharLiteral, FloatLiteral, Identifier
         
         has_return_with_value = False
         
-        for statement in body:
-            if isinstance(statement, ReturnStatement):
-                if statement.value:
-                    has_return_with_value = True
-                    if isinstance(statement.value, StringLiteral):
-                        return "string"
-                    elif isinstance(statement.value, CharLiteral):
-                        return "char"
-                    elif isinstance(statement.value, FloatLiteral):
-                        return "float"
-                    elif isinstance(statement.value, Identifier):
-                        return "int"
+        for statement in self.collect_returns(body, []):
+            if statement.value:
+                has_return_with_value = True
+                if isinstance(statement.value, StringLiteral):
+                    return "string"
+                elif isinstance(statement.value, CharLiteral):
+                    return "char"
+                elif isinstance(statement.value, FloatLiteral):
+                    return "float"
+                elif isinstance(statement.value, Identifier):
+                    return "int"
         
         return "void" if not has_return_with_value else "int"
@@ -1,3 +1,11 @@
+from lexer.tokens import (
+    TYPE_KINDS,
+    IDENTIFIER, NUMBER, FLOAT_NUMBER, STRING, C_IMPORT, C_CALL,
+    PRINT, RETURN, VAR, MASS, CALL, IF, ELIF, ELSE, WHILE, SWITCH, CASE, DEFAULT,
+    CONVERT, BREAK, CONTINUE, INF, STOP, FOR,
+    LBRACE, RBRACE, LPAREN, RPAREN, LBRACKET, RBRACKET, SEMICOLON, EQUALS,
+    COMMA, COLON, DOT, ASTERISK, GREATER, PLUS_PLUS, MINUS_MINUS
+)
 from .ast.statements import (
     PrintStatement, ReturnStatement, VarDeclaration,
     CallStatement, IfStatement, Assignment,
@@ -10,135 +18,129 @@ from .ast.statements import (
 from .errors import KatoSyntaxError
 
 
+PRINT_VALUE_KINDS = frozenset((STRING, NUMBER, FLOAT_NUMBER, IDENTIFIER, ASTERISK, LPAREN))
+
+CASE_END_KINDS = frozenset((CASE, DEFAULT, RBRACE))
+
+
 class StatementParser:
     def __init__(self, parser, expr_parser):
         self.parser = parser
         self.expr_parser = expr_parser
+        self.statement_handlers = {
+            C_IMPORT: self.parse_c_import,
+            C_CALL: self.parse_c_call,
+            PRINT: self.parse_print_statement,
+            RETURN: self.parse_return_statement,
+            VAR: self.parse_var_statement,
+            MASS: self.parse_array_declaration,
+            CALL: self.parse_call_statement,
+            IF: self.parse_if_statement,
+            WHILE: self.parse_while_statement,
+            SWITCH: self.parse_switch_statement,
+            CONVERT: self.parse_convert_statement,
+            BREAK: self.parse_break,
+            CONTINUE: self.parse_continue,
+            INF: self.parse_inf_statement,
+            STOP: self.parse_stop,
+            FOR: self.parse_for_statement,
+            ASTERISK: self.parse_pointer_assignment,
+            IDENTIFIER: self.parse_identifier_statement,
+        }
+        self.identifier_handlers = {
+            PLUS_PLUS: self.parse_increment,
+            MINUS_MINUS: self.parse_decrement,
+            LBRACKET: self.parse_array_assignment,
+            DOT: self.parse_struct_field_assignment,
+            LPAREN: self.parse_direct_call_statement,
+        }
     
     def parse_statement(self):
         token = self.parser.current_token()
         
-        if token.type == "C_IMPORT":
-            return self.parse_c_import()
-        elif token.type == "C_CALL":
-            return self.parse_c_call()
-        elif token.type == "PRINT":
-            return self.parse_print_statement()
-        elif token.type == "RETURN":
-            return self.parse_return_statement()
-        elif token.type == "VAR":
-            next_token = self.parser.peek_token()
-            if next_token and next_token.type == "IDENTIFIER" and next_token.value in self.parser.defined_structs:
-                return self.parse_struct_var_declaration()
-            return self.parse_var_declaration()
-        elif token.type == "MASS":
-            return self.parse_array_declaration()
-        elif token.type == "CALL":
-            return self.parse_call_statement()
-        elif token.type == "IF":
-            return self.parse_if_statement()
-        elif token.type == "WHILE":
-            return self.parse_while_statement()
-        elif token.type == "SWITCH":
-            return self.parse_switch_statement()
-        elif token.type == "CONVERT":
-            return self.parse_convert_statement()
-        elif token.type == "BREAK":
-            return self.parse_break()
-        elif token.type == "CONTINUE":
-            return self.parse_continue()
-        elif token.type == "INF":
-            return self.parse_inf_statement()
-        elif token.type == "STOP":
-            return self.parse_stop()
-        elif token.type == "FOR":
-            return self.parse_for_statement()
-        elif token.type == "ASTERISK":
-            return self.parse_pointer_assignment()
-        elif token.type == "IDENTIFIER":
-            next_token = self.parser.peek_token()
-            if next_token and next_token.type == "PLUS_PLUS":
-                return self.parse_increment()
-            elif next_token and next_token.type == "MINUS_MINUS":
-                return self.parse_decrement()
-            elif next_token and next_token.type == "LBRACKET":
-                return self.parse_array_assignment()
-            elif next_token and next_token.type == "DOT":
-                return self.parse_struct_field_assignment()
-            elif next_token and next_token.type == "LPAREN":
-                return self.parse_direct_call_statement()
-            else:
-                return self.parse_assignment()
-        else:
+        handler = self.statement_handlers.get(token.kind)
+        if handler is None:
             raise KatoSyntaxError(
                 f"Unknown statement type '{token.value}'",
                 token.line, token.column,
                 self.parser.source_code
             )
+        return handler()
+    
+    def parse_var_statement(self):
+        next_token = self.parser.peek_token()
+        if next_token and next_token.kind == IDENTIFIER and next_token.value in self.parser.defined_structs:
+            return self.parse_struct_var_declaration()
+        return self.parse_var_declaration()
+    
+    def parse_identifier_statement(self):
+        next_token = self.parser.peek_token()
+        if next_token:
+            handler = self.identifier_handlers.get(next_token.kind)
+            if handler is not None:
+                return handler()
+        return self.parse_assignment()
     
     def parse_print_statement(self):
         print_token = self.parser.current_token()
         line_num = print_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
-        self.parser.expect("PRINT")
-        self.parser.expect("LPAREN")
+        self.parser.expect(PRINT)
+        self.parser.expect(LPAREN)
         
         values = []
-        while self.parser.current_token() and self.parser.current_token().type != "RPAREN":
+        while self.parser.current_token() and self.parser.current_token().kind != RPAREN:
             values.append(self.expr_parser.parse_expression())
             
-            if self.parser.current_token() and self.parser.current_token().type != "RPAREN":
-                if self.parser.current_token().type in ["STRING", "NUMBER", "FLOAT_NUMBER", "IDENTIFIER", "ASTERISK", "LPAREN"]:
+            if self.parser.current_token() and self.parser.current_token().kind != RPAREN:
+                if self.parser.current_token().kind in PRINT_VALUE_KINDS:
                     continue
                 else:
                     break
         
-        self.parser.expect("RPAREN")
+        self.parser.expect(RPAREN)
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after print statement",
                 print_token.line, print_token.column + len("print"),
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = PrintStatement(values)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_return_statement(self):
         return_token = self.parser.current_token()
         line_num = return_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
-        self.parser.expect("RETURN")
+        self.parser.expect(RETURN)
         
         value = self.expr_parser.parse_expression()
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after return statement",
                 return_token.line, return_token.column + len("return"),
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = ReturnStatement(value)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_var_declaration(self):
         var_token = self.parser.current_token()
         line_num = var_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
-        self.parser.expect("VAR")
+        self.parser.expect(VAR)
         
         type_token = self.parser.current_token()
-        if type_token.type not in ["INT", "FLOAT", "CHAR", "STRING_TYPE"]:
+        if type_token.kind not in TYPE_KINDS:
             raise KatoSyntaxError(
                 f"Expected variable type (int, float, char, string), got '{type_token.value}'",
                 type_token.line, type_token.column,
@@ -148,12 +150,12 @@ class StatementParser:
         self.parser.advance()
         
         is_pointer = False
-        if self.parser.current_token() and self.parser.current_token().type == "ASTERISK":
+        if self.parser.current_token() and self.parser.current_token().kind == ASTERISK:
             is_pointer = True
             var_type += "*"
             self.parser.advance()
         
-        name_token = self.parser.expect("IDENTIFIER")
+        name_token = self.parser.expect(IDENTIFIER)
         name = name_token.value
         
         if name in self.parser.defined_variables:
@@ -165,31 +167,30 @@ class StatementParser:
         
         self.parser.defined_variables.add(name)
         
-        self.parser.expect("EQUALS")
+        self.parser.expect(EQUALS)
         
         value = self.expr_parser.parse_expression()
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after variable declaration",
                 var_token.line, var_token.column,
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = VarDeclaration(var_type, name, value)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_call_statement(self):
         call_token = self.parser.current_token()
         line_num = call_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
-        self.parser.expect("CALL")
+        self.parser.expect(CALL)
         
-        func_name_token = self.parser.expect("IDENTIFIER")
+        func_name_token = self.parser.expect(IDENTIFIER)
         func_name = func_name_token.value
         
         if func_name not in self.parser.defined_functions and func_name not in self.parser.builtin_functions:
@@ -200,74 +201,73 @@ class StatementParser:
             )
         
         lparen_token = self.parser.current_token()
-        if lparen_token is None or lparen_token.type != "LPAREN":
+        if lparen_token is None or lparen_token.kind != LPAREN:
             raise KatoSyntaxError(
                 f"Function call without arguments (missing parentheses)",
                 func_name_token.line, func_name_token.column + len(func_name),
                 self.parser.source_code
             )
-        self.parser.expect("LPAREN")
+        self.parser.expect(LPAREN)
         
         arguments = []
-        while self.parser.current_token() and self.parser.current_token().type != "RPAREN":
+        while self.parser.current_token() and self.parser.current_token().kind != RPAREN:
             arguments.append(self.expr_parser.parse_expression())
             
-            if self.parser.current_token() and self.parser.current_token().type == "COMMA":
+            if self.parser.current_token() and self.parser.current_token().kind == COMMA:
                 self.parser.advance()
         
-        self.parser.expect("RPAREN")
+        self.parser.expect(RPAREN)
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after function call",
                 call_token.line, call_token.column,
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = CallStatement(func_name, arguments)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_if_statement(self):
-        self.parser.expect("IF")
+        self.parser.expect(IF)
         
         condition = self.expr_parser.parse_comparison()
         
-        self.parser.expect("LBRACE")
+        self.parser.expect(LBRACE)
         if_body = []
-        while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
+        while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
             if_body.append(self.parse_statement())
-        self.parser.expect("RBRACE")
+        self.parser.expect(RBRACE)
         
         elif_parts = []
-        while self.parser.current_token() and self.parser.current_token().type == "ELIF":
+        while self.parser.current_token() and self.parser.current_token().kind == ELIF:
             self.parser.advance()
             elif_condition = self.expr_parser.parse_comparison()
-            self.parser.expect("LBRACE")
+            self.parser.expect(LBRACE)
             elif_body = []
-            while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
+            while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
                 elif_body.append(self.parse_statement())
-            self.parser.expect("RBRACE")
+            self.parser.expect(RBRACE)
             elif_parts.append((elif_condition, elif_body))
         
         else_body = None
-        if self.parser.current_token() and self.parser.current_token().type == "ELSE":
+        if self.parser.current_token() and self.parser.current_token().kind == ELSE:
             self.parser.advance()
-            self.parser.expect("LBRACE")
+            self.parser.expect(LBRACE)
             else_body = []
-            while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
+            while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
                 else_body.append(self.parse_statement())
-            self.parser.expect("RBRACE")
+            self.parser.expect(RBRACE)
         
         return IfStatement(condition, if_body, elif_parts, else_body)
     
     def parse_assignment(self):
         name_token = self.parser.current_token()
         line_num = name_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
         name = name_token.value
         
         if name not in self.parser.defined_variables:
@@ -279,45 +279,44 @@ class StatementParser:
         
         self.parser.advance()
         
-        self.parser.expect("EQUALS")
+        self.parser.expect(EQUALS)
         
         value = self.expr_parser.parse_expression()
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after assignment",
                 name_token.line, name_token.column,
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = Assignment(name, value)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
 
     def parse_while_statement(self):
-        self.parser.expect("WHILE")
-        self.parser.expect("LPAREN")
+        self.parser.expect(WHILE)
+        self.parser.expect(LPAREN)
         
         condition = self.expr_parser.parse_comparison()
         
-        self.parser.expect("RPAREN")
-        self.parser.expect("LBRACE")
+        self.parser.expect(RPAREN)
+        self.parser.expect(LBRACE)
         
         body = []
-        while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
+        while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
             body.append(self.parse_statement())
         
-        self.parser.expect("RBRACE")
+        self.parser.expect(RBRACE)
         
         return WhileStatement(condition, body)
     
     def parse_increment(self):
         name_token = self.parser.current_token()
         line_num = name_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
         name = name_token.value
         
         if name not in self.parser.defined_variables:
@@ -328,26 +327,25 @@ class StatementParser:
             )
         
         self.parser.advance()
-        self.parser.expect("PLUS_PLUS")
+        self.parser.expect(PLUS_PLUS)
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after increment",
                 name_token.line, name_token.column,
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = IncrementStatement(name)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_decrement(self):
         name_token = self.parser.current_token()
         line_num = name_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
         name = name_token.value
         
         if name not in self.parser.defined_variables:
@@ -358,28 +356,28 @@ class StatementParser:
             )
         
         self.parser.advance()
-        self.parser.expect("MINUS_MINUS")
+        self.parser.expect(MINUS_MINUS)
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after decrement",
                 name_token.line, name_token.column,
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = DecrementStatement(name)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
 
     def parse_array_declaration(self):
         mass_token = self.parser.current_token()
-        self.parser.expect("MASS")
+        self.parser.expect(MASS)
         
         type_token = self.parser.current_token()
-        if type_token.type not in ["INT", "FLOAT", "CHAR", "STRING_TYPE"]:
+        if type_token.kind not in TYPE_KINDS:
             raise KatoSyntaxError(
                 f"Expected array type (int, float, char, string), got '{type_token.value}'",
                 type_token.line, type_token.column,
@@ -388,7 +386,7 @@ class StatementParser:
         array_type = type_token.value
         self.parser.advance()
         
-        name_token = self.parser.expect("IDENTIFIER")
+        name_token = self.parser.expect(IDENTIFIER)
         name = name_token.value
         
         if name in self.parser.defined_variables:
@@ -400,33 +398,32 @@ class StatementParser:
         
         self.parser.defined_variables.add(name)
         
-        self.parser.expect("EQUALS")
-        self.parser.expect("LBRACE")
+        self.parser.expect(EQUALS)
+        self.parser.expect(LBRACE)
         
         elements = []
-        while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
+        while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
             elements.append(self.expr_parser.parse_expression())
             
-            if self.parser.current_token() and self.parser.current_token().type == "COMMA":
+            if self.parser.current_token() and self.parser.current_token().kind == COMMA:
                 self.parser.advance()
         
-        self.parser.expect("RBRACE")
+        self.parser.expect(RBRACE)
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after array declaration",
                 mass_token.line, mass_token.column,
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         return ArrayDeclaration(array_type, name, elements)
     
     def parse_array_assignment(self):
         name_token = self.parser.current_token()
         line_num = name_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
         name = name_token.value
         
         if name not in self.parser.defined_variables:
@@ -437,66 +434,66 @@ class StatementParser:
             )
         
         self.parser.advance()
-        self.parser.expect("LBRACKET")
+        self.parser.expect(LBRACKET)
         
         index = self.expr_parser.parse_expression()
         
-        self.parser.expect("RBRACKET")
-        self.parser.expect("EQUALS")
+        self.parser.expect(RBRACKET)
+        self.parser.expect(EQUALS)
         
         value = self.expr_parser.parse_expression()
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after array assignment",
                 name_token.line, name_token.column,
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = ArrayAssignment(name, index, value)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_switch_statement(self):
         switch_token = self.parser.current_token()
-        self.parser.expect("SWITCH")
-        self.parser.expect("LPAREN")
+        self.parser.expect(SWITCH)
+        self.parser.expect(LPAREN)
         
         expression = self.expr_parser.parse_expression()
         
-        self.parser.expect("RPAREN")
-        self.parser.expect("LBRACE")
+        self.parser.expect(RPAREN)
+        self.parser.expect(LBRACE)
         
         cases = []
         default_body = None
         
-        while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
-            if self.parser.current_token().type == "CASE":
+        while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
+            if self.parser.current_token().kind == CASE:
                 self.parser.advance()
                 
                 case_value = self.expr_parser.parse_primary()
                 
                 case_body = []
                 while self.parser.current_token():
-                    if self.parser.current_token().type in ["CASE", "DEFAULT", "RBRACE"]:
+                    if self.parser.current_token().kind in CASE_END_KINDS:
                         
                         break
                     case_body.append(self.parse_statement())
                 
                 cases.append(CaseClause(case_value, case_body))
                 
-            elif self.parser.current_token().type == "DEFAULT":
+            elif self.parser.current_token().kind == DEFAULT:
                 self.parser.advance()
-                self.parser.expect("LBRACE")
+                self.parser.expect(LBRACE)
                 
                 default_body = []
-                while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
+                while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
                     default_body.append(self.parse_statement())
                 
-                self.parser.expect("RBRACE")
+                self.parser.expect(RBRACE)
             else:
                 raise KatoSyntaxError(
                     f"Expected 'case' or 'default' in switch statement, got '{self.parser.current_token().value}'",
@@ -504,19 +501,19 @@ class StatementParser:
                     self.parser.source_code
                 )
         
-        self.parser.expect("RBRACE")
+        self.parser.expect(RBRACE)
         
         return SwitchStatement(expression, cases, default_body)
     
     def parse_convert_statement(self):
-        self.parser.expect("CONVERT")
+        self.parser.expect(CONVERT)
         
         expression = self.expr_parser.parse_primary()
         
-        self.parser.expect("GREATER")
+        self.parser.expect(GREATER)
         
         type_token = self.parser.current_token()
-        if type_token.type not in ["INT", "FLOAT", "CHAR", "STRING_TYPE"]:
+        if type_token.kind not in TYPE_KINDS:
             raise KatoSyntaxError(
                 f"Expected type (int, float, char, string), got '{type_token.value}'",
                 type_token.line, type_token.column,
@@ -525,14 +522,13 @@ class StatementParser:
         target_type = type_token.value
         self.parser.advance()
         
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         return ConvertStatement(expression, target_type)
     
     def parse_direct_call_statement(self):
         func_name_token = self.parser.current_token()
         line_num = func_name_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
         func_name = func_name_token.value
         
         if func_name not in self.parser.defined_functions and func_name not in self.parser.builtin_functions:
@@ -543,119 +539,116 @@ class StatementParser:
             )
         
         self.parser.advance()
-        self.parser.expect("LPAREN")
+        self.parser.expect(LPAREN)
         
         arguments = []
-        while self.parser.current_token() and self.parser.current_token().type != "RPAREN":
+        while self.parser.current_token() and self.parser.current_token().kind != RPAREN:
             arguments.append(self.expr_parser.parse_expression())
             
-            if self.parser.current_token() and self.parser.current_token().type == "COMMA":
+            if self.parser.current_token() and self.parser.current_token().kind == COMMA:
                 self.parser.advance()
         
-        self.parser.expect("RPAREN")
+        self.parser.expect(RPAREN)
         
         semicolon_token = self.parser.current_token()
-        if semicolon_token is None or semicolon_token.type != "SEMICOLON":
+        if semicolon_token is None or semicolon_token.kind != SEMICOLON:
             raise KatoSyntaxError(
                 "Missing semicolon ';' after function call",
                 func_name_token.line, func_name_token.column,
                 self.parser.source_code
             )
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         stmt = CallStatement(func_name, arguments)
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_c_import(self):
         self.parser.advance()
         header_name = ""
         
-        while self.parser.current_token() and self.parser.current_token().type != "SEMICOLON":
+        while self.parser.current_token() and self.parser.current_token().kind != SEMICOLON:
             token = self.parser.current_token()
-            if token.type == "IDENTIFIER":
+            if token.kind == IDENTIFIER:
                 header_name += token.value
-            elif token.type == "DOT":
+            elif token.kind == DOT:
                 header_name += "."
-            elif token.type == "NUMBER":
+            elif token.kind == NUMBER:
                 header_name += str(token.value)
             else:
                 break
             self.parser.advance()
         
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         return CImportStatement(header_name)
     
     def parse_c_call(self):
         func_token = self.parser.current_token()
         func_name = func_token.value[2:]
         self.parser.advance()
-        self.parser.expect("LPAREN")
+        self.parser.expect(LPAREN)
         
         arguments = []
-        while self.parser.current_token() and self.parser.current_token().type != "RPAREN":
+        while self.parser.current_token() and self.parser.current_token().kind != RPAREN:
             arguments.append(self.expr_parser.parse_expression())
             
-            if self.parser.current_token() and self.parser.current_token().type == "COMMA":
+            if self.parser.current_token() and self.parser.current_token().kind == COMMA:
                 self.parser.advance()
         
-        self.parser.expect("RPAREN")
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(RPAREN)
+        self.parser.expect(SEMICOLON)
         
         return CCallStatement(func_name, arguments)
 
     def parse_break(self):
         break_token = self.parser.current_token()
         line_num = break_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
         self.parser.advance()
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         stmt = BreakStatement()
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_continue(self):
         continue_token = self.parser.current_token()
         line_num = continue_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
         self.parser.advance()
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         stmt = ContinueStatement()
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_inf_statement(self):
-        self.parser.expect("INF")
-        self.parser.expect("LBRACE")
+        self.parser.expect(INF)
+        self.parser.expect(LBRACE)
         
         body = []
-        while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
+        while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
             body.append(self.parse_statement())
         
-        self.parser.expect("RBRACE")
+        self.parser.expect(RBRACE)
         
         return InfStatement(body)
     
     def parse_stop(self):
         stop_token = self.parser.current_token()
         line_num = stop_token.line
-        source_line = self.parser.source_lines[line_num - 1].strip() if line_num <= len(self.parser.source_lines) else ""
         self.parser.advance()
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         stmt = StopStatement()
         stmt.line_number = line_num
-        stmt.source_line = source_line
+        stmt.source_lines = self.parser.source_lines
         return stmt
     
     def parse_for_statement(self):
-        self.parser.expect("FOR")
-        self.parser.expect("LPAREN")
+        self.parser.expect(FOR)
+        self.parser.expect(LPAREN)
         
         iterable_token = self.parser.current_token()
-        if iterable_token.type != "IDENTIFIER":
+        if iterable_token.kind != IDENTIFIER:
             raise KatoSyntaxError(
                 f"Expected array or variable name, got '{iterable_token.value}'",
                 iterable_token.line, iterable_token.column,
@@ -664,13 +657,13 @@ class StatementParser:
         iterable = iterable_token.value
         self.parser.advance()
         
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         counter = None
-        if self.parser.current_token().type == "VAR":
+        if self.parser.current_token().kind == VAR:
             self.parser.advance()
             counter_type_token = self.parser.current_token()
-            if counter_type_token.type not in ["INT", "FLOAT", "CHAR", "STRING_TYPE"]:
+            if counter_type_token.kind not in TYPE_KINDS:
                 raise KatoSyntaxError(
                     f"Expected counter type, got '{counter_type_token.value}'",
                     counter_type_token.line, counter_type_token.column,
@@ -679,36 +672,36 @@ class StatementParser:
             counter_type = counter_type_token.value
             self.parser.advance()
             
-            counter_name_token = self.parser.expect("IDENTIFIER")
+            counter_name_token = self.parser.expect(IDENTIFIER)
             counter_name = counter_name_token.value
             
-            self.parser.expect("EQUALS")
+            self.parser.expect(EQUALS)
             counter_value = self.expr_parser.parse_expression()
             
             counter = VarDeclaration(counter_type, counter_name, counter_value)
             self.parser.defined_variables.add(counter_name)
         else:
-            counter_token = self.parser.expect("IDENTIFIER")
+            counter_token = self.parser.expect(IDENTIFIER)
             counter = counter_token.value
         
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         
         condition = self.expr_parser.parse_comparison()
         
-        self.parser.expect("RPAREN")
-        self.parser.expect("LBRACE")
+        self.parser.expect(RPAREN)
+        self.parser.expect(LBRACE)
         
         body = []
-        while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
+        while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
             body.append(self.parse_statement())
         
-        self.parser.expect("RBRACE")
+        self.parser.expect(RBRACE)
         
         return ForStatement(iterable, counter, condition, body)
     
     def parse_struct_var_declaration(self):
-        self.parser.expect("VAR")
-        struct_type_token = self.parser.expect("IDENTIFIER")
+        self.parser.expect(VAR)
+        struct_type_token = self.parser.expect(IDENTIFIER)
         struct_type = struct_type_token.value
         
         if struct_type not in self.parser.defined_structs:
@@ -718,7 +711,7 @@ class StatementParser:
                 self.parser.source_code
             )
         
-        name_token = self.parser.expect("IDENTIFIER")
+        name_token = self.parser.expect(IDENTIFIER)
         name = name_token.value
         
         if name in self.parser.defined_variables:
@@ -729,12 +722,12 @@ class StatementParser:
             )
         
         self.parser.defined_variables.add(name)
-        self.parser.expect("EQUALS")
-        self.parser.expect("LBRACE")
+        self.parser.expect(EQUALS)
+        self.parser.expect(LBRACE)
         
         field_values = {}
-        while self.parser.current_token() and self.parser.current_token().type != "RBRACE":
-            field_name_token = self.parser.expect("IDENTIFIER")
+        while self.parser.current_token() and self.parser.current_token().kind != RBRACE:
+            field_name_token = self.parser.expect(IDENTIFIER)
             field_name = field_name_token.value
             
             if field_name not in self.parser.defined_structs[struct_type]:
@@ -744,7 +737,7 @@ class StatementParser:
                     self.parser.source_code
                 )
             
-            if self.parser.current_token() and self.parser.current_token().type == "COLON":
+            if self.parser.current_token() and self.parser.current_token().kind == COLON:
                 self.parser.advance()
             else:
                 raise KatoSyntaxError(
@@ -755,11 +748,11 @@ class StatementParser:
             
             field_values[field_name] = self.expr_parser.parse_expression()
             
-            if self.parser.current_token() and self.parser.current_token().type == "COMMA":
+            if self.parser.current_token() and self.parser.current_token().kind == COMMA:
                 self.parser.advance()
         
-        self.parser.expect("RBRACE")
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(RBRACE)
+        self.parser.expect(SEMICOLON)
         return StructVarDeclaration(struct_type, name, field_values)
     
     def parse_struct_field_assignment(self):
@@ -774,20 +767,20 @@ class StatementParser:
             )
         
         self.parser.advance()
-        self.parser.expect("DOT")
-        field_name_token = self.parser.expect("IDENTIFIER")
+        self.parser.expect(DOT)
+        field_name_token = self.parser.expect(IDENTIFIER)
         field_name = field_name_token.value
-        self.parser.expect("EQUALS")
+        self.parser.expect(EQUALS)
         value = self.expr_parser.parse_expression()
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         return StructFieldAssignment(struct_name, field_name, value)
 
     def parse_pointer_assignment(self):
-        self.parser.expect("ASTERISK")
-        pointer_token = self.parser.expect("IDENTIFIER")
+        self.parser.expect(ASTERISK)
+        pointer_token = self.parser.expect(IDENTIFIER)
         pointer_name = pointer_token.value
-        self.parser.expect("ASTERISK")
-        self.parser.expect("EQUALS")
+        self.parser.expect(ASTERISK)
+        self.parser.expect(EQUALS)
         value = self.expr_parser.parse_expression()
-        self.parser.expect("SEMICOLON")
+        self.parser.expect(SEMICOLON)
         return PointerAssignment(pointer_name, value)
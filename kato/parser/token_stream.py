@@ -0,0 +1,29 @@
+from collections import deque
+
+
+class TokenStream:
+    def __init__(self, tokens):
+        self.source = iter(tokens)
+        self.window = deque()
+        self.exhausted = False
+    
+    def fill(self, count):
+        while len(self.window) < count and not self.exhausted:
+            token = next(self.source, None)
+            if token is None:
+                self.exhausted = True
+            else:
+                self.window.append(token)
+    
+    def peek(self, offset=0):
+        if offset >= len(self.window):
+            self.fill(offset + 1)
+            if offset >= len(self.window):
+                return None
+        return self.window[offset]
+    
+    def advance(self):
+        if not self.window:
+            self.fill(1)
+        if self.window:
+            self.window.popleft()
@@ -0,0 +1,34 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+KATO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROGRAM = os.path.join(KATO_DIR, "test", "short_circuit.kato")
+
+
+def run_program(opt_level, workdir):
+    source = os.path.join(workdir, f"short_circuit_O{opt_level}.kato")
+    shutil.copyfile(PROGRAM, source)
+    subprocess.run(
+        [sys.executable, "main.py", source, "-c", "--no-cache", "-O", str(opt_level)],
+        cwd=KATO_DIR, check=True, capture_output=True
+    )
+    binary = os.path.join(workdir, f"short_circuit_O{opt_level}")
+    subprocess.run(["gcc", "-w", "-o", binary, source[:-len(".kato")] + ".c", "-lm"], check=True)
+    return subprocess.run([binary], check=True, capture_output=True, text=True).stdout
+
+
+@unittest.skipIf(shutil.which("gcc") is None, "gcc is not installed")
+class ShortCircuitTest(unittest.TestCase):
+    def test_optimized_output_matches_unoptimized(self):
+        with tempfile.TemporaryDirectory() as workdir:
+            expected = run_program(0, workdir)
+            self.assertEqual(expected, "v=6\ncalled 0\nw=1\n")
+            self.assertEqual(run_program(2, workdir), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()